@@ -0,0 +1,263 @@
+#!/usr/bin/python
+
+"""
+Performance benchmarks of menu navigation, rendering and message scrolling.
+Everything runs against the in-memory VirtualLcd, so no hardware is needed.
+
+    python benchmarks/run_benchmarks.py --output bench.json
+
+Compare the JSON output of two releases to catch regressions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rpilcdmenu import RpiLCDMenu  # noqa: E402
+from rpilcdmenu.backends import VirtualLcd  # noqa: E402
+from rpilcdmenu.items import FunctionItem, MenuItem, SubmenuItem  # noqa: E402
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor  # noqa: E402
+from rpilcdmenu.views import MessageView  # noqa: E402
+
+
+def measure(name, operation, iterations, lcd=None, **params):
+    """
+    Call operation repeatedly and collect timing and bus statistics
+    :param str name: benchmark name
+    :param callable operation: measured code, called once per iteration
+    :param int iterations: number of calls
+    :param VirtualLcd lcd: display whose traffic is reported
+    :return dict: result record
+    """
+    if lcd is not None:
+        lcd.reset_stats()
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    result = {
+        "name": name,
+        "params": params,
+        "iterations": iterations,
+        "mean_us": sum(timings) / iterations * 1e6,
+        "p50_us": timings[iterations // 2] * 1e6,
+        "p95_us": timings[min(int(iterations * 0.95), iterations - 1)] * 1e6,
+        "max_us": timings[-1] * 1e6,
+    }
+    if lcd is not None:
+        stats = lcd.stats()
+        result["lcd_bytes_per_op"] = stats["bytes"] / float(iterations)
+        result["bus_writes_per_op"] = stats["bus_writes"] / float(iterations)
+    return result
+
+
+def create_menu(item_count, text="item %d", cols=16, rows=2):
+    lcd = VirtualLcd(cols=cols, rows=rows)
+    processor = RpiLcdProcessor(lcd=lcd)
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+    for index in range(item_count):
+        menu.append_item(MenuItem(text % index))
+    menu.start()
+    processor.run_pending()
+    return menu, processor, lcd
+
+
+def forget_display(processor):
+    """
+    Make the next render draw the full frame again, the frame dedup and the
+    shadow framebuffer would drop a render of an unchanged menu
+    """
+    processor.frame = None
+    processor.shadow.invalidate()
+
+
+def bench_render(iterations):
+    results = []
+
+    menu, processor, lcd = create_menu(10)
+
+    def render_static():
+        forget_display(processor)
+        menu.render()
+        processor.run_pending()
+
+    results.append(measure("render_static", render_static, iterations, lcd))
+
+    menu, processor, lcd = create_menu(10, "a menu item text too long for the display %d")
+
+    def render_scrolling():
+        forget_display(processor)
+        menu.render()
+        processor.run_pending()
+
+    results.append(measure("render_scrolling_start", render_scrolling, iterations, lcd))
+
+    menu.render()
+    processor.run_pending()
+    animation = processor.animation
+    results.append(measure("render_scrolling_frame", animation.step, iterations, lcd))
+    animation.cancel()
+    return results
+
+
+def bench_navigation(iterations, sizes):
+    results = []
+    for size in sizes:
+        menu, processor, lcd = create_menu(size)
+
+        def down():
+            menu.processDown()
+            processor.run_pending()
+
+        def up():
+            menu.processUp()
+            processor.run_pending()
+
+        results.append(measure("process_down", down, iterations, lcd, items=size))
+        results.append(measure("process_up", up, iterations, lcd, items=size))
+    return results
+
+
+def bench_lazy_menu(iterations, size):
+    lcd = VirtualLcd()
+    processor = RpiLcdProcessor(lcd=lcd)
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+
+    def start():
+        menu.set_data_source(range(size))
+        menu.start()
+        processor.run_pending()
+
+    results = [measure("lazy_menu_start", start, 1, lcd, items=size)]
+
+    def down():
+        menu.processDown()
+        processor.run_pending()
+
+    results.append(measure("lazy_process_down", down, iterations, lcd, items=size))
+    return results
+
+
+def bench_message_view(iterations, text_size):
+    lcd = VirtualLcd()
+    processor = RpiLcdProcessor(lcd=lcd)
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+    words = "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor. "
+    text = (words * (text_size // len(words) + 1))[:text_size]
+
+    results = []
+    created = []
+    results.append(measure(
+        "message_view_layout", lambda: created.append(MessageView(menu, text, True)), 1, size=text_size
+    ))
+
+    view = created[0]
+    view.start()
+    processor.run_pending()
+
+    def scroll_down():
+        view.processDown()
+        processor.run_pending()
+
+    results.append(measure("message_view_scroll", scroll_down, iterations, lcd, size=text_size))
+    return results
+
+
+def bench_item_memory(count):
+    """
+    Bytes allocated per item, texts included, measured with tracemalloc
+    """
+    submenu = RpiLCDMenu(rpi_lcd_processor=RpiLcdProcessor(lcd=VirtualLcd()))
+    factories = (
+        ("MenuItem", lambda index: MenuItem("item %d" % index)),
+        ("FunctionItem", lambda index: FunctionItem("item %d" % index, print)),
+        ("SubmenuItem", lambda index: SubmenuItem("item %d" % index, submenu)),
+    )
+
+    results = []
+    for name, factory in factories:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        items = [factory(index) for index in range(count)]
+        allocated = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        del items
+
+        results.append({
+            "name": "item_memory",
+            "params": {"class": name},
+            "iterations": count,
+            "bytes_per_item": allocated / float(count),
+        })
+    return results
+
+
+def bench_queue_throughput(commands):
+    processor = RpiLcdProcessor(lcd=VirtualLcd())
+    done = threading.Event()
+    noop = [lambda: None]
+
+    processor.start()
+    start = time.perf_counter()
+    for _ in range(commands):
+        processor.put(noop)
+    processor.put([done.set])
+    done.wait()
+    elapsed = time.perf_counter() - start
+    processor.stop()
+
+    return [{
+        "name": "queue_throughput",
+        "params": {"commands": commands},
+        "iterations": commands,
+        "commands_per_second": commands / elapsed,
+        "batches": processor.stats()["batches_processed"],
+    }]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="bench_output.json", help="JSON file to write the results to")
+    parser.add_argument("--iterations", type=int, default=1000, help="calls per benchmark")
+    args = parser.parse_args()
+
+    results = []
+    results += bench_render(args.iterations)
+    results += bench_navigation(args.iterations, (10, 100, 1000, 10000))
+    results += bench_lazy_menu(args.iterations, 1000000)
+    results += bench_message_view(args.iterations, 100 * 1024)
+    results += bench_item_memory(args.iterations * 10)
+    results += bench_queue_throughput(args.iterations * 10)
+
+    report = {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+
+    for result in results:
+        print("%-24s %-18s %s" % (
+            result["name"],
+            json.dumps(result["params"]),
+            "%.1f us" % result["mean_us"] if "mean_us" in result else
+            "%.0f bytes/item" % result["bytes_per_item"] if "bytes_per_item" in result else
+            "%.0f commands/s" % result["commands_per_second"]
+        ))
+
+
+if __name__ == "__main__":
+    main()
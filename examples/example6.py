@@ -0,0 +1,55 @@
+#!/usr/bin/python
+
+"""
+menu with message view, driven by the input layer instead of a polling loop
+"""
+
+from rpilcdmenu import *
+from rpilcdmenu.items import *
+from rpilcdmenu.input import InputController, GpioButton, PolledAxis, ENTER
+import smbus
+import time
+
+
+def main():
+    menu = RpiLCDMenu()
+
+    for index in range(100):
+        menu.append_item(FunctionItem("Item %d" % index, foo_function, [index]))
+    menu.append_item(
+        MessageItem('message item',
+                    'Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut '
+                    'labore et dolore magna aliqua.',
+                    menu,
+                    True)
+    )
+
+    menu.start()
+
+    # debounced, auto-repeating input; bursts of moves are drawn as one frame
+    controller = InputController(menu).start()
+
+    # standard button, reported by GPIO edge callbacks
+    GpioButton(controller, 27, ENTER).start()
+
+    # analog joystick via adc converter over i2c, y axis on a0
+    address = 0x48
+    a0 = 0x40
+    bus = smbus.SMBus(1)
+
+    def read_y():
+        bus.write_byte(address, a0)
+        return bus.read_byte(address) * 3.3 / 255
+
+    PolledAxis(controller, read_y, low=0.7, high=2.5).start()
+
+    while True:
+        time.sleep(1)
+
+
+def foo_function(item_index):
+    print("item %d pressed" % item_index)
+
+
+if __name__ == "__main__":
+    main()
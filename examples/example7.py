@@ -0,0 +1,109 @@
+#!/usr/bin/python
+
+"""
+menu drawn in the terminal, no Raspberry Pi needed
+
+    python example7.py                  # arrows or w/s to move, enter/right to select, q to quit
+    python example7.py --cols 20 --rows 4
+    python example7.py --stress 100000  # unthrottled random navigation, reports frames per second
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+
+from rpilcdmenu import *
+from rpilcdmenu.items import *
+from rpilcdmenu.backends import TerminalLcd
+from rpilcdmenu.input import InputController, TerminalKeyboard
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor
+
+
+def create_menu(processor):
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+
+    for index in range(20):
+        menu.append_item(FunctionItem("Item %d" % index, foo_function, [index]))
+
+    submenu = RpiLCDSubMenu(menu)
+    menu.append_item(SubmenuItem("SubMenu", submenu, menu))
+    submenu.append_item(MenuItem("A long item text which scrolls"))
+    submenu.append_item(FunctionItem("Back", exit_sub_menu, [submenu]))
+
+    menu.append_item(
+        MessageItem('message item',
+                    'Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut '
+                    'labore et dolore magna aliqua.',
+                    menu,
+                    True)
+    )
+    return menu
+
+
+def interactive(lcd):
+    processor = RpiLcdProcessor(lcd=lcd)
+    processor.start()
+    menu = create_menu(processor).start()
+
+    done = threading.Event()
+    controller = InputController(menu).start()
+    keyboard = TerminalKeyboard(controller, on_quit=done.set).start()
+    try:
+        done.wait()
+    finally:
+        keyboard.stop()
+        controller.stop()
+        processor.stop()
+
+
+def stress(lcd, events):
+    """
+    Navigate as fast as possible, frames are drawn on the calling thread
+    """
+    processor = RpiLcdProcessor(lcd=lcd)
+    menu = create_menu(processor)
+    menu.lcd_framerate = 0.0001
+    menu = menu.start()
+    processor.run_pending()
+
+    start = time.perf_counter()
+    for _ in range(events):
+        event = random.choice((menu.processUp, menu.processDown, menu.processDown, menu.processEnter))
+        menu = event() or menu
+        processor.run_pending()
+    elapsed = time.perf_counter() - start
+
+    menu._stop_animation()
+    stats = lcd.stats()
+    print("%d events in %.2f s: %.0f events/s, %d transfers, %d bytes" % (
+        events, elapsed, events / elapsed, stats["transfers"], stats["bytes"]
+    ), file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cols", type=int, default=16)
+    parser.add_argument("--rows", type=int, default=2)
+    parser.add_argument("--stress", type=int, metavar="EVENTS", help="run unthrottled random navigation")
+    parser.add_argument("--no-draw", action="store_true", help="do not draw the display while stress testing")
+    args = parser.parse_args()
+
+    lcd = TerminalLcd(cols=args.cols, rows=args.rows, draw=not args.no_draw)
+    if args.stress:
+        stress(lcd, args.stress)
+    else:
+        interactive(lcd)
+
+
+def foo_function(item_index):
+    return None
+
+
+def exit_sub_menu(submenu):
+    return submenu.exit()
+
+
+if __name__ == "__main__":
+    main()
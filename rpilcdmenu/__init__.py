@@ -1,5 +1,6 @@
 from .rpi_lcd_menu import RpiLCDMenu
 from .rpi_lcd_submenu import RpiLCDSubMenu
+from .async_lcd import AsyncLcdProcessor, AsyncRpiLCDMenu
 from .version import __version__
 
-__all__ = ['RpiLCDMenu', 'RpiLCDSubMenu', 'items', 'views']
+__all__ = ['RpiLCDMenu', 'RpiLCDSubMenu', 'AsyncLcdProcessor', 'AsyncRpiLCDMenu', 'items', 'views']
@@ -0,0 +1,164 @@
+import asyncio
+from collections import deque
+
+from rpilcdmenu.rpi_lcd_hwd import BaseLcdProcessor, NORMAL
+
+
+class AsyncLcdProcessor(BaseLcdProcessor):
+    """
+    asyncio replacement of RpiLcdProcessor. LCD commands are executed by a
+    writer task on the event loop instead of a dedicated thread. Timers use
+    loop.call_later, so ScrollAnimation runs unchanged on top of it.
+    All methods have to be called from the event loop thread.
+    """
+
+    def __init__(self, coalesce_frames=True, lcd=None, metrics=None, max_batch=32, starvation_limit=4, governor=None):
+        """
+        See BaseLcdProcessor
+        """
+        super(AsyncLcdProcessor, self).__init__(coalesce_frames, lcd, metrics, max_batch, starvation_limit, governor)
+        # Items of timers which became due, served when the queue is empty
+        self._due = deque()
+        self._wakeup = None
+        self._idle = None
+        self._task = None
+        self._loop = None
+
+    def start(self):
+        """
+        Start the writer task on the running event loop
+        """
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._idle = asyncio.Event()
+            self._loop = asyncio.get_running_loop()
+            self._task = self._loop.create_task(self.run())
+            if self.metrics is not None and self.metrics.callback is not None:
+                self.schedule(self.metrics.interval, [self._report_metrics])
+        return self
+
+    def is_alive(self):
+        return self._task is not None and not self._task.done()
+
+    async def run(self):
+        """
+        Process all LCD write commands. Everything pending is drained and
+        flushed at once, then the task yields so other tasks keep running.
+        """
+        while True:
+            while not self._queue and not self._due:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            batch = self._take_queued(bool(self._due))
+            if batch is None:
+                batch = list(self._due)
+                self._due.clear()
+            if not self._execute(batch):
+                break
+            await asyncio.sleep(0)
+
+        self._idle.set()
+
+    async def drain(self):
+        """
+        Wait until every queued command has been written to the LCD
+        """
+        if self.is_alive() and (self._queue or self._due or not self._idle.is_set()):
+            await self._idle.wait()
+
+    async def stop(self):
+        """
+        Process the remaining commands and end the writer task
+        """
+        if self._task is not None:
+            self.put(None)
+            await self._task
+            self._task = None
+
+    def put_threadsafe(self, items, lane=NORMAL):
+        """
+        Queue a command from another thread, e.g. a worker pool
+        :param list items: callable followed by its arguments
+        :param int lane: URGENT, NORMAL or BACKGROUND
+        """
+        self._loop.call_soon_threadsafe(self.put, items, lane)
+
+    def _append(self, items, is_frame, lane):
+        super(AsyncLcdProcessor, self)._append(items, is_frame, lane)
+        self._notify()
+
+    def _notify(self):
+        if self._wakeup is not None:
+            self._idle.clear()
+            self._wakeup.set()
+
+    def schedule(self, delay, items):
+        """
+        Run a command on the writer task after delay seconds
+        :param float delay: seconds to wait
+        :param list items: callable followed by its arguments
+        :return asyncio.TimerHandle: handle to cancel the command
+        """
+        return asyncio.get_running_loop().call_later(delay, self._fire, items)
+
+    def cancel(self, timer):
+        """
+        :param asyncio.TimerHandle timer: handle returned by schedule
+        """
+        timer.cancel()
+
+    def _fire(self, items):
+        self._due.append(items)
+        self._notify()
+
+    def _report_metrics(self):
+        # No new timer once the writer task has ended
+        if self.is_alive():
+            super(AsyncLcdProcessor, self)._report_metrics()
+        else:
+            self.metrics.callback(self.metrics_snapshot())
+
+
+class AsyncRpiLCDMenu:
+    """
+    Awaitable front-end of a menu tree drawn through an AsyncLcdProcessor.
+    It tracks the active menu like the 'menu = menu.processDown()' loop of
+    the examples and every call returns once the new frame is on the LCD.
+    """
+
+    def __init__(self, menu):
+        """
+        :param RpiLCDMenu menu: root menu created with an AsyncLcdProcessor
+        """
+        self.menu = menu
+        self.rpi_lcd_processor = menu.rpi_lcd_processor
+
+    async def start(self):
+        self.rpi_lcd_processor.start()
+        self.menu = self.menu.start()
+        await self.rpi_lcd_processor.drain()
+        return self
+
+    async def processUp(self):
+        return await self._process(self.menu.processUp)
+
+    async def processDown(self):
+        return await self._process(self.menu.processDown)
+
+    async def processEnter(self):
+        return await self._process(self.menu.processEnter)
+
+    async def processAltEnter(self):
+        return await self._process(self.menu.processAltEnter)
+
+    async def _process(self, event):
+        self.menu = event()
+        await self.rpi_lcd_processor.drain()
+        return self
+
+    async def stop(self):
+        if self.menu is not None:
+            self.menu._stop_animation()
+        await self.rpi_lcd_processor.stop()
@@ -0,0 +1,6 @@
+from .base import LcdBackend
+from .rplcd_backend import RplcdBackend
+from .virtual import VirtualLcd
+from .terminal import TerminalLcd
+
+__all__ = ['LcdBackend', 'RplcdBackend', 'VirtualLcd', 'TerminalLcd']
@@ -0,0 +1,58 @@
+class LcdBackend:
+    """
+    Interface of a character display. It follows the RPLCD CharLCD API,
+    so menus can call the backend exactly like an RPLCD display.
+    """
+
+    cols = 16
+    rows = 2
+
+    def write_string(self, value):
+        """
+        Write text at the cursor position, '\\r' and '\\n' move the cursor
+        :param str value: text to be written
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Blank the display and move the cursor home
+        """
+        raise NotImplementedError
+
+    def home(self):
+        """
+        Move the cursor to the top left cell
+        """
+        raise NotImplementedError
+
+    def create_char(self, location, bitmap):
+        """
+        Define a custom character in CG-RAM
+        :param int location: CG-RAM slot (0-7)
+        :param tuple bitmap: eight rows of five pixels
+        """
+        raise NotImplementedError
+
+    def _get_cursor_pos(self):
+        raise NotImplementedError
+
+    def _set_cursor_pos(self, value):
+        raise NotImplementedError
+
+    cursor_pos = property(
+        lambda self: self._get_cursor_pos(),
+        lambda self, value: self._set_cursor_pos(value),
+        doc="The cursor position as (row, col) tuple"
+    )
+
+    def flush(self):
+        """
+        Send buffered writes to the display. Called by the processor after
+        every batch of commands, backends without buffering do nothing.
+        """
+
+    def close(self, clear=False):
+        """
+        Release the display
+        """
@@ -0,0 +1,70 @@
+from .base import LcdBackend
+
+
+class RplcdBackend(LcdBackend):
+    """
+    Display connected through an I2C port expander, driven by RPLCD.
+    RPLCD is imported on creation, so the library can be used without it.
+    """
+
+    def __init__(self, i2c_expander="PCF8574", address=0x27, port=1, cols=16, rows=2, dotsize=8,
+                 auto_linebreaks=True, lcd=None, batched=False, profile=None):
+        """
+        :param str i2c_expander: port expander chip, see RPLCD.i2c.CharLCD
+        :param int address: I2C address of the expander
+        :param int port: I2C bus number
+        :param int cols: display width in characters
+        :param int rows: display height in characters
+        :param int dotsize: character height in pixels
+        :param bool auto_linebreaks: continue long lines on the next row
+        :param CharLCD lcd: already configured RPLCD display, overrides all other arguments
+        :param bool batched: send the writes of a whole batch as I2C block transfers (PCF8574 only)
+        :param BusProfile|str profile: timing profile of batched transfers, or its name in PROFILES
+        """
+        if lcd is None and batched and i2c_expander == "PCF8574":
+            from .rplcd_batched import BatchedCharLCD, PROFILES
+
+            lcd = BatchedCharLCD(
+                profile=PROFILES[profile] if isinstance(profile, str) else profile,
+                address=address, port=port,
+                cols=cols, rows=rows, dotsize=dotsize, auto_linebreaks=auto_linebreaks,
+            )
+
+        if lcd is None:
+            from RPLCD.i2c import CharLCD
+
+            lcd = CharLCD(
+                i2c_expander=i2c_expander, address=address, port=port,
+                cols=cols, rows=rows, dotsize=dotsize, auto_linebreaks=auto_linebreaks,
+            )
+
+        self.lcd = lcd
+        self.cols = lcd.lcd.cols
+        self.rows = lcd.lcd.rows
+
+    def write_string(self, value):
+        self.lcd.write_string(value)
+
+    def clear(self):
+        self.lcd.clear()
+
+    def home(self):
+        self.lcd.home()
+
+    def create_char(self, location, bitmap):
+        self.lcd.create_char(location, bitmap)
+
+    def _get_cursor_pos(self):
+        return self.lcd.cursor_pos
+
+    def _set_cursor_pos(self, value):
+        self.lcd.cursor_pos = value
+
+    def flush(self):
+        flush = getattr(self.lcd, "flush", None)
+        if flush is not None:
+            flush()
+
+    def close(self, clear=False):
+        self.flush()
+        self.lcd.close(clear=clear)
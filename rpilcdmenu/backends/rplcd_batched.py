@@ -0,0 +1,110 @@
+import math
+
+from RPLCD import common as c
+from RPLCD.i2c import CharLCD, PCF8574_E
+
+
+class BusProfile:
+    """
+    I2C timing profile used to pack HD44780 bytes into block transfers
+    """
+
+    # Bits on the wire per byte, including the acknowledge bit
+    BITS_PER_BYTE = 9
+    # Bus writes per HD44780 byte: each nibble is set up, latched with E high and released
+    WRITES_PER_BYTE = 6
+    # Writes between the end of one HD44780 byte and the latch of the next nibble
+    WRITES_UNTIL_LATCH = 3
+
+    def __init__(self, clock_hz=100000, block_size=32, settle_delay=0.0, execution_time=0.000037):
+        """
+        :param int clock_hz: I2C clock configured for the bus (dtparam=i2c_arm_baudrate)
+        :param int block_size: bytes per block write, SMBus allows 32
+        :param float settle_delay: seconds to wait after every block, for shared or noisy buses
+        :param float execution_time: seconds the HD44780 needs to execute a regular instruction
+        """
+        self.clock_hz = clock_hz
+        self.block_size = block_size
+        self.settle_delay = settle_delay
+        self.execution_time = execution_time
+
+    @property
+    def byte_time(self):
+        """
+        Seconds one byte occupies the bus
+        """
+        return self.BITS_PER_BYTE / float(self.clock_hz)
+
+    @property
+    def padding_writes(self):
+        """
+        Repeated writes needed after every HD44780 byte on fast buses, so
+        the controller has finished before the next nibble gets latched
+        """
+        return max(int(math.ceil(self.execution_time / self.byte_time)) - self.WRITES_UNTIL_LATCH, 0)
+
+
+PROFILES = {
+    "standard": BusProfile(clock_hz=100000),
+    "fast": BusProfile(clock_hz=400000),
+    "fast-plus": BusProfile(clock_hz=1000000),
+}
+
+
+class BatchedCharLCD(CharLCD):
+    """
+    RPLCD PCF8574 display which encodes every HD44780 byte into a buffer
+    instead of issuing eight single-byte writes with sleeps in between.
+    flush() sends the buffer as I2C block writes, the bus clock provides
+    the timing. Clear and home are flushed at once, RPLCD waits for them.
+    """
+
+    def __init__(self, profile=None, **kwargs):
+        """
+        :param BusProfile profile: timing profile, 'standard' if None
+        :param kwargs: arguments of RPLCD.i2c.CharLCD
+        """
+        self.profile = profile if profile is not None else PROFILES["standard"]
+        self._buffer = []
+        # RPLCD's initialisation sequence relies on its own delays
+        self._batching = False
+        super(BatchedCharLCD, self).__init__(i2c_expander="PCF8574", **kwargs)
+        self._batching = True
+        self.transfers = 0
+
+    def _send_data(self, value):
+        if not self._batching:
+            return super(BatchedCharLCD, self)._send_data(value)
+        self._encode(c.RS_DATA, value)
+
+    def _send_instruction(self, value):
+        if not self._batching:
+            return super(BatchedCharLCD, self)._send_instruction(value)
+        self._encode(c.RS_INSTRUCTION, value)
+        if value in (c.LCD_CLEARDISPLAY, c.LCD_RETURNHOME):
+            self.flush()
+
+    def _encode(self, mode, value):
+        for nibble in (value & 0xF0, (value << 4) & 0xF0):
+            byte = mode | nibble | self._backlight
+            self._buffer += (byte, byte | PCF8574_E, byte)
+        if self.profile.padding_writes:
+            self._buffer += (self._buffer[-1],) * self.profile.padding_writes
+
+    def flush(self):
+        """
+        Send the buffered bytes as block writes
+        """
+        buffer = self._buffer
+        if not buffer:
+            return
+        self._buffer = []
+
+        block_size = self.profile.block_size
+        for start in range(0, len(buffer), block_size):
+            block = buffer[start: start + block_size]
+            # The PCF8574 has no registers, the "command" byte is just the first output value
+            self.bus.write_i2c_block_data(self._address, block[0], block[1:])
+            self.transfers += 1
+            if self.profile.settle_delay:
+                c.msleep(self.profile.settle_delay * 1000)
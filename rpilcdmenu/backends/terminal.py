@@ -0,0 +1,54 @@
+import sys
+
+from .virtual import VirtualLcd
+
+
+class TerminalLcd(VirtualLcd):
+    """
+    VirtualLcd drawn to a terminal with ANSI escape sequences, for
+    development without a Raspberry Pi. The display is redrawn whenever the
+    processor flushes a batch which changed something, like a transfer on
+    the real bus. Custom characters are shown as a block.
+    """
+
+    def __init__(self, cols=16, rows=2, stream=None, draw=True, record=False, **kwargs):
+        """
+        :param int cols: display width in characters
+        :param int rows: display height in characters
+        :param stream: terminal to draw to, sys.stdout if None
+        :param bool draw: False to only keep the display in memory (stress tests)
+        :param bool record: log every byte like VirtualLcd, off so interactive sessions stay bounded
+        :param kwargs: arguments of VirtualLcd
+        """
+        super(TerminalLcd, self).__init__(cols=cols, rows=rows, record=record, **kwargs)
+        self.stream = stream if stream is not None else sys.stdout
+        self.draw = draw
+        self.frames_drawn = 0
+        self._cleared_screen = False
+
+    def flush(self):
+        changed = self._pending
+        super(TerminalLcd, self).flush()
+        if changed and self.draw:
+            self.render()
+
+    def render(self):
+        """
+        Draw the display at the top left corner of the terminal
+        """
+        border = "+" + "-" * self.cols + "+"
+        lines = [border] + ["|" + self._printable(row) + "|" for row in self.display()] + [border]
+        # Clear once, afterwards only move home, the box overwrites itself
+        prefix = "\x1b[H" if self._cleared_screen else "\x1b[2J\x1b[H"
+        self._cleared_screen = True
+        self.stream.write(prefix + "\n".join(lines) + "\n")
+        self.stream.flush()
+        self.frames_drawn += 1
+        return self
+
+    @staticmethod
+    def _printable(row):
+        return "".join(
+            "█" if ord(char) < 8 else char if char.isprintable() else "?"
+            for char in row
+        )
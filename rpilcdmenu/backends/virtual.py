@@ -0,0 +1,133 @@
+import time
+
+from .base import LcdBackend
+
+# Single byte I2C writes RPLCD issues through a PCF8574 for one HD44780 byte:
+# two nibbles, each written once and then pulsed on the enable line
+PCF8574_WRITES_PER_BYTE = 8
+
+# HD44780 instructions
+LCD_CLEARDISPLAY = 0x01
+LCD_RETURNHOME = 0x02
+LCD_SETCGRAMADDR = 0x40
+LCD_SETDDRAMADDR = 0x80
+ROW_OFFSETS = (0x00, 0x40, 0x14, 0x54)
+
+
+class VirtualLcd(LcdBackend):
+    """
+    In-memory HD44780. It keeps the visible characters and records every
+    instruction and data byte the controller would receive, which allows
+    to measure bus traffic, frame rate and latency without hardware.
+    """
+
+    def __init__(self, cols=16, rows=2, auto_linebreaks=True, clock=time.monotonic, record=True):
+        """
+        :param int cols: display width in characters
+        :param int rows: display height in characters
+        :param bool auto_linebreaks: continue long lines on the next row
+        :param callable clock: time source of the recorded log
+        :param bool record: log every byte, False keeps only the counters for long running sessions
+        """
+        self.cols = cols
+        self.rows = rows
+        self.auto_linebreaks = auto_linebreaks
+        self.clock = clock
+        self.record = record
+        self.buffer = [[" "] * cols for _ in range(rows)]
+        self.cgram = [None] * 8
+        self._cursor = (0, 0)
+        # (timestamp, kind, value) with kind "instruction" or "data", empty unless recording
+        self.log = []
+        self.instruction_bytes = 0
+        self.data_bytes = 0
+        self.transfers = 0
+        self._pending = False
+
+    def display(self):
+        """
+        :return list: the visible text, one string per row
+        """
+        return ["".join(row) for row in self.buffer]
+
+    def reset_stats(self):
+        self.log = []
+        self.instruction_bytes = 0
+        self.data_bytes = 0
+        self.transfers = 0
+        return self
+
+    def stats(self):
+        """
+        :return dict: recorded traffic
+        """
+        total = self.instruction_bytes + self.data_bytes
+        return {
+            "instruction_bytes": self.instruction_bytes,
+            "data_bytes": self.data_bytes,
+            "bytes": total,
+            "bus_writes": total * PCF8574_WRITES_PER_BYTE,
+            "transfers": self.transfers,
+        }
+
+    def _instruction(self, value):
+        self.instruction_bytes += 1
+        self._pending = True
+        if self.record:
+            self.log.append((self.clock(), "instruction", value))
+
+    def _data(self, value):
+        self.data_bytes += 1
+        self._pending = True
+        if self.record:
+            self.log.append((self.clock(), "data", value))
+
+    def write_string(self, value):
+        for char in value:
+            row, col = self._cursor
+            if char == "\n":
+                self._set_cursor_pos(((row + 1) % self.rows, col))
+            elif char == "\r":
+                self._set_cursor_pos((row, 0))
+            else:
+                self._data(ord(char))
+                if col < self.cols:
+                    self.buffer[row][col] = char
+                col += 1
+                if col >= self.cols and self.auto_linebreaks:
+                    self._set_cursor_pos(((row + 1) % self.rows, 0))
+                else:
+                    self._cursor = (row, col)
+
+    def flush(self):
+        """
+        Count buffered bytes as one transfer
+        """
+        if self._pending:
+            self.transfers += 1
+            self._pending = False
+
+    def clear(self):
+        self._instruction(LCD_CLEARDISPLAY)
+        self.buffer = [[" "] * self.cols for _ in range(self.rows)]
+        self._cursor = (0, 0)
+
+    def home(self):
+        self._instruction(LCD_RETURNHOME)
+        self._cursor = (0, 0)
+
+    def create_char(self, location, bitmap):
+        self._instruction(LCD_SETCGRAMADDR | location << 3)
+        for line in bitmap:
+            self._data(line)
+        self.cgram[location] = tuple(bitmap)
+        # RPLCD moves back to DDRAM afterwards
+        self._set_cursor_pos(self._cursor)
+
+    def _get_cursor_pos(self):
+        return self._cursor
+
+    def _set_cursor_pos(self, value):
+        row, col = value
+        self._instruction(LCD_SETDDRAMADDR | (ROW_OFFSETS[row] + col))
+        self._cursor = (row, col)
@@ -1,3 +1,6 @@
+import threading
+
+
 class BaseMenu:
     """
     A generic menu
@@ -12,6 +15,10 @@ class BaseMenu:
         self.current_option = 0
         self.selected_option = -1
         self.input_count = 0
+        # Menu returned by a background FunctionItem, taken over by the next input
+        self.redirect = None
+        # MenuIndex of the tree this menu belongs to, kept up to date by append_item/remove_item
+        self.index = None
 
     def start(self):
         """
@@ -42,6 +49,22 @@ class BaseMenu:
         """
         item.menu = self
         self.items.append(item)
+        if self.index is not None:
+            self.index.item_added(self, item)
+        return self
+
+    def set_data_source(self, source, item_factory=None, page_size=16, cache_pages=3):
+        """
+        Replace the items by a lazy view of a data source. Items are created
+        only when they get close to the visible window.
+        :param DataSource source: records to browse, or a plain sequence
+        :param callable item_factory: creates the MenuItem of a record, MenuItem(str(record)) if None
+        :param int page_size: records fetched at once
+        :param int cache_pages: pages kept in memory
+        """
+        from rpilcdmenu.data_source import LazyItems
+
+        self.items = LazyItems(source, self, item_factory, page_size, cache_pages)
         return self
 
     def render(self):
@@ -58,23 +81,53 @@ class BaseMenu:
         """
         User triggered up event
         """
-        self.input_count += 1
+        if self.redirect is not None:
+            return self._take_redirect().processUp()
         if self.current_option == 0:
-            self.current_option = len(self.items) - 1
-        else:
-            self.current_option -= 1
-        self.render()
-        return self
+            return self._select(len(self.items) - 1)
+        return self._select(self.current_option - 1)
 
     def processDown(self):
         """
         User triggered down event
         """
-        self.input_count += 1
+        if self.redirect is not None:
+            return self._take_redirect().processDown()
         if self.current_option == len(self.items) - 1:
-            self.current_option = 0
-        else:
-            self.current_option += 1
+            return self._select(0)
+        return self._select(self.current_option + 1)
+
+    def processSteps(self, steps):
+        """
+        Move the cursor by several positions with a single render, e.g. for
+        a burst of coalesced input events. Subclasses overriding processUp
+        or processDown but not processSteps get their methods called once
+        per step instead.
+        :param int steps: positions to move, negative moves up
+        """
+        if self.redirect is not None:
+            return self._take_redirect().processSteps(steps)
+        cls = type(self)
+        if cls.processUp is not BaseMenu.processUp or cls.processDown is not BaseMenu.processDown:
+            menu = self
+            for _ in range(abs(steps)):
+                menu = menu.processUp() if steps < 0 else menu.processDown()
+            return menu
+        if self.items:
+            return self._select((self.current_option + steps) % len(self.items))
+        return self._select(self.current_option)
+
+    def _select(self, option):
+        """
+        Move the cursor and render the menu. Moves which keep the selection
+        (e.g. in a menu with a single item) leave the display and a running
+        scroll animation alone.
+        :param int option: index of the item to be selected
+        """
+        if option == self.current_option and self.items:
+            return self
+        self.input_count += 1
+        self.current_option = option
         self.render()
         return self
 
@@ -82,6 +135,8 @@ class BaseMenu:
         """
         User triggered enter event
         """
+        if self.redirect is not None:
+            return self._take_redirect().processEnter()
         self.input_count += 1
         item = self.items[self.current_option]
         return self._fire_action(item, item.action())
@@ -90,6 +145,8 @@ class BaseMenu:
         """
         Trigger event for second item in a ContainerItem
         """
+        if self.redirect is not None:
+            return self._take_redirect().processAltEnter()
         self.input_count += 1
         item = self.items[self.current_option]
         try:
@@ -112,6 +169,47 @@ class BaseMenu:
             return action_result
         return self
 
+    def action_finished(self, item, action_result):
+        """
+        A FunctionItem running in the background has returned. A returned
+        menu becomes active with the next input event.
+        """
+        menu = self._fire_action(item, action_result)
+        if menu is not self:
+            self.redirect = menu
+        return menu
+
+    def _take_redirect(self):
+        menu = self.redirect
+        self.redirect = None
+        return menu
+
+    def show_busy(self, busy=True):
+        """
+        A background action has started or, with busy False, finished
+        """
+
+    def _call_soon_threadsafe(self, items):
+        """
+        Run a command on the thread driving the display, can be called from any thread
+        :param list items: callable followed by its arguments
+        """
+        items[0](*items[1:])
+
+    def _call_later(self, delay, items):
+        """
+        Run a command after delay seconds
+        :param list items: callable followed by its arguments
+        :return: handle for _cancel_call
+        """
+        timer = threading.Timer(delay, items[0], items[1:])
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def _cancel_call(self, handle):
+        handle.cancel()
+
     def exit(self):
         """
         exit submenu and return parent
@@ -126,5 +224,7 @@ class BaseMenu:
         :param MenuItem item: The item to be removed
         """
         item.menu = self
+        if self.index is not None:
+            self.index.item_removed(self, item)
         self.items.remove(item)
         return self
@@ -0,0 +1,78 @@
+class BusyIndicator:
+    """
+    Spinner in the top right corner of the display while FunctionItems run
+    in the background. Like ScrollAnimation it is drawn by timers on the
+    LCD processor and all of its state is only touched on that thread.
+    """
+
+    frames = ".oOo"
+
+    def __init__(self, menu, interval=0.2):
+        """
+        :param RpiLCDMenu menu: menu used to write to the display
+        :param float interval: seconds between two spinner frames
+        """
+        self.menu = menu
+        self.processor = menu.rpi_lcd_processor
+        self.interval = interval
+        self.jobs = 0
+        self.frame = 0
+        # Spinner character on the display and the one it hides
+        self.shown = None
+        self.covered = " "
+        self.timer = None
+        self._step_items = [self.step]
+
+    def acquire(self):
+        """
+        A background job has started, show the spinner
+        """
+        self.processor.put([self._acquire])
+        return self
+
+    def release(self):
+        """
+        A background job has finished, the spinner disappears after the last one
+        """
+        self.processor.put([self._release])
+        return self
+
+    def _acquire(self):
+        self.jobs += 1
+        if self.jobs == 1:
+            self.frame = 0
+            self.step()
+
+    def _release(self):
+        self.jobs -= 1
+        if self.jobs:
+            return
+        if self.timer is not None:
+            self.processor.cancel(self.timer)
+            self.timer = None
+        line = self.processor.shadow.lines[0]
+        if line is not None and line[-1] == self.shown:
+            self._draw(line, self.covered)
+        self.shown = None
+
+    def step(self):
+        """
+        Draw the next spinner frame. Runs on the processor thread.
+        """
+        if not self.jobs:
+            return self
+
+        line = self.processor.shadow.lines[0]
+        if line is not None:
+            # Everything else drawn in the corner since the last frame is new content
+            if line[-1] != self.shown:
+                self.covered = line[-1]
+            self.shown = self.frames[self.frame % len(self.frames)]
+            self._draw(line, self.shown)
+            self.frame += 1
+
+        self.timer = self.processor.schedule(self.interval * self.processor.time_scale, self._step_items)
+        return self
+
+    def _draw(self, line, char):
+        self.menu._write_to_lcd([line[:-1] + char])
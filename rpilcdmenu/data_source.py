@@ -0,0 +1,105 @@
+from collections import OrderedDict
+
+from rpilcdmenu.items import MenuItem
+
+
+class DataSource:
+    """
+    Records browsed by a lazy menu. Subclasses report the number of
+    records and fetch them page by page, e.g. from a directory listing,
+    a log file or a Wi-Fi scan.
+    """
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def fetch(self, start, count):
+        """
+        :param int start: index of the first record
+        :param int count: number of records, fewer are returned at the end
+        :return list: the records
+        """
+        raise NotImplementedError
+
+
+class SequenceSource(DataSource):
+    """
+    Data source over anything supporting len() and slicing (list, range...)
+    """
+
+    def __init__(self, sequence):
+        self.sequence = sequence
+
+    def __len__(self):
+        return len(self.sequence)
+
+    def fetch(self, start, count):
+        return self.sequence[start: start + count]
+
+
+class LazyItems:
+    """
+    Read-only sequence of menu items created on demand from a data source.
+    Items are materialized a page at a time and the least recently used
+    pages are dropped, so only the pages around the cursor are in memory.
+    """
+
+    def __init__(self, source, menu=None, item_factory=None, page_size=16, cache_pages=3):
+        """
+        :param DataSource source: records to browse, a plain sequence is wrapped in a SequenceSource
+        :param BaseMenu menu: menu the items belong to
+        :param callable item_factory: creates the MenuItem of a record, MenuItem(str(record)) if None
+        :param int page_size: records fetched at once
+        :param int cache_pages: pages kept in memory
+        """
+        self.source = source if isinstance(source, DataSource) else SequenceSource(source)
+        self.menu = menu
+        self.item_factory = item_factory if item_factory is not None else lambda record: MenuItem(str(record))
+        self.page_size = page_size
+        self.cache_pages = cache_pages
+        self._pages = OrderedDict()
+
+    def __len__(self):
+        return len(self.source)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("menu item index out of range")
+
+        page, offset = divmod(index, self.page_size)
+        return self._page(page)[offset]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def refresh(self):
+        """
+        Drop all materialized items, the data source has changed
+        """
+        self._pages.clear()
+        return self
+
+    def _page(self, page):
+        try:
+            self._pages.move_to_end(page)
+            return self._pages[page]
+        except KeyError:
+            pass
+
+        items = []
+        for record in self.source.fetch(page * self.page_size, self.page_size):
+            item = self.item_factory(record)
+            item.menu = self.menu
+            items.append(item)
+
+        self._pages[page] = items
+        if len(self._pages) > self.cache_pages:
+            self._pages.popitem(last=False)
+        return items
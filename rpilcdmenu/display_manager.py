@@ -0,0 +1,205 @@
+import logging
+import threading
+
+from rpilcdmenu.backends import RplcdBackend
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor
+
+
+class BusDisplay(RpiLcdProcessor):
+    """
+    Processor of one display managed by a DisplayManager. It keeps its own
+    command queue, timers and shadow framebuffer, but has no thread of its
+    own: the worker of its I2C bus executes it together with the other
+    displays on that bus. Menus use it like a RpiLcdProcessor. A display
+    whose commands raise is detached from the bus, failed holds the error
+    and new commands are dropped.
+    """
+
+    def __init__(self, worker, lcd, coalesce_frames=True, metrics=None, governor=None):
+        """
+        :param BusWorker worker: thread driving the bus of the display
+        :param LcdBackend lcd: the display
+        :param FrameGovernor governor: paces the scroll animation, the one of the bus
+        """
+        super(BusDisplay, self).__init__(coalesce_frames=coalesce_frames, lcd=lcd, metrics=metrics, governor=governor)
+        self.worker = worker
+        # Queue and timers are guarded by the lock of the bus, so one wake-up serves all displays
+        self._condition = worker.condition
+        self._stopped = threading.Event()
+        # Exception which detached the display from its bus, commands queued afterwards are dropped
+        self.failed = None
+        self.commands_rejected = 0
+
+    def start(self):
+        self.worker.add(self)
+        return self
+
+    def is_alive(self):
+        return self in self.worker.displays
+
+    def stop(self):
+        """
+        Process the remaining commands and detach the display from its bus
+        """
+        if self.is_alive():
+            self.put(None)
+            self._stopped.wait()
+
+    def join(self, timeout=None):
+        self._stopped.wait(timeout)
+
+    def _append(self, items, is_frame, lane):
+        with self._condition:
+            if self.failed is not None:
+                self.commands_rejected += 1
+                return
+            super(BusDisplay, self)._append(items, is_frame, lane)
+
+
+class BusWorker(threading.Thread):
+    """
+    Drives all displays on one I2C bus. Every round takes one batch from
+    each display with pending work, starting at a different display each
+    time, so busy displays cannot starve the others.
+    """
+
+    def __init__(self, bus, governor=None):
+        """
+        :param bus: I2C bus number (or any key grouping displays)
+        :param FrameGovernor governor: budget of the scroll animations of all displays on the bus
+        """
+        super(BusWorker, self).__init__(name="lcd-bus-%s" % bus, daemon=True)
+        self.bus = bus
+        self.governor = governor
+        self.condition = threading.Condition()
+        self.displays = []
+        self.running = True
+        self.rounds = 0
+        self._next = 0
+
+    def add(self, display):
+        with self.condition:
+            self.displays.append(display)
+            self.condition.notify()
+        return self
+
+    def run(self):
+        while True:
+            with self.condition:
+                work = self._next_round()
+                if work is None:
+                    return
+            for display, batch in work:
+                try:
+                    running = display._execute(batch)
+                except Exception as error:
+                    # A broken display must not take the others on the bus down
+                    logging.exception("Display on bus %s failed and was detached", self.bus)
+                    self._detach(display, error)
+                    continue
+                if not running:
+                    self._detach(display)
+            self.rounds += 1
+
+    def _detach(self, display, error=None):
+        with self.condition:
+            self.displays.remove(display)
+            if error is not None:
+                display.failed = error
+                # Nothing will ever execute the remaining commands
+                display._queue.take()
+        display._stopped.set()
+
+    def _next_round(self):
+        """
+        Block until a display has queued commands or due timers, the
+        condition has to be held by the caller
+        :return list: (display, batch) pairs, None once the worker is stopped
+        """
+        while True:
+            if not self.running:
+                return None
+            work = []
+            timeout = None
+            count = len(self.displays)
+            for index in range(count):
+                display = self.displays[(self._next + index) % count]
+                batch, wait = display._take_batch()
+                if batch:
+                    work.append((display, batch))
+                elif wait is not None and (timeout is None or wait < timeout):
+                    timeout = wait
+            if work:
+                self._next = (self._next + 1) % count
+                return work
+            self.condition.wait(timeout)
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        self.join()
+
+
+class DisplayManager:
+    """
+    Runs many displays from one thread per I2C bus instead of one thread
+    per display. Displays on different buses never wait for each other.
+
+        manager = DisplayManager()
+        menu = RpiLCDMenu(rpi_lcd_processor=manager.add_display(address=0x26, port=1))
+    """
+
+    def __init__(self):
+        self.workers = {}
+        self.displays = []
+
+    def add_display(self, lcd=None, bus=None, coalesce_frames=True, metrics=None, governor=None, **backend_kwargs):
+        """
+        Create the processor of a display and start driving it
+        :param LcdBackend lcd: the display, a RplcdBackend created from backend_kwargs if None
+        :param bus: key of the bus worker, the I2C port of the display if None
+        :param bool coalesce_frames: latest-frame-wins mode, see RpiLcdProcessor
+        :param PipelineMetrics metrics: instrumentation of the display, off if None
+        :param FrameGovernor governor: paces the scroll animations of the whole bus, the first
+            one given for a bus is used by all its displays
+        :param backend_kwargs: arguments of RplcdBackend (address, port, cols, rows...)
+        :return BusDisplay: processor for a RpiLCDMenu
+        """
+        if lcd is None:
+            lcd = RplcdBackend(**backend_kwargs)
+        if bus is None:
+            bus = backend_kwargs.get("port", 1)
+
+        worker = self.workers.get(bus)
+        if worker is None:
+            worker = self.workers[bus] = BusWorker(bus, governor)
+            worker.start()
+        elif worker.governor is None and governor is not None:
+            worker.governor = governor
+            for other in worker.displays:
+                other.governor = governor
+
+        display = BusDisplay(worker, lcd, coalesce_frames, metrics, worker.governor).start()
+        self.displays.append(display)
+        return display
+
+    def stats(self):
+        """
+        :return dict: bus -> number of displays and processed rounds
+        """
+        return {
+            bus: {"displays": len(worker.displays), "rounds": worker.rounds}
+            for bus, worker in self.workers.items()
+        }
+
+    def stop(self):
+        """
+        Process the remaining commands of all displays and end the bus threads
+        """
+        for display in self.displays:
+            display.stop()
+        for worker in self.workers.values():
+            worker.stop()
+        self.displays = []
+        self.workers = {}
@@ -1,3 +1,9 @@
 from .text_helper import get_scrolled_text
+from .text_layout import TextLayout
+from .shadow_framebuffer import ShadowFramebuffer
+from .scroll_frames import ScrollFrameCache
+from .metrics import Histogram, PipelineMetrics
+from .glyph_manager import GlyphManager
+from .frame_governor import FrameGovernor
 
-__all__ = ['get_scrolled_text']
+__all__ = ['get_scrolled_text', 'TextLayout', 'ShadowFramebuffer', 'ScrollFrameCache', 'Histogram', 'PipelineMetrics', 'GlyphManager', 'FrameGovernor']
@@ -0,0 +1,92 @@
+import time
+
+
+class FrameGovernor:
+    """
+    Paces animation frames to a share of the bus time. The cost of a frame
+    (writing it and flushing the display) is measured by the animation and
+    smoothed, the delay until the next frame is stretched until frames
+    occupy at most 'budget' of the bus. On a slow or shared bus scrolling
+    gets slower instead of starving other devices. Animations of several
+    displays on one bus share the budget, each gets its part.
+    """
+
+    def __init__(self, budget=0.25, smoothing=0.2, max_slowdown=8.0, clock=time.perf_counter):
+        """
+        :param float budget: share of the bus time animation frames may use (0 to 1)
+        :param float smoothing: weight of a new measurement in the moving average
+        :param float max_slowdown: longest delay as a multiple of the nominal one
+        :param callable clock: time source of the measurements
+        """
+        self.budget = budget
+        self.smoothing = smoothing
+        self.max_slowdown = max_slowdown
+        self.clock = clock
+        self.frame_cost = 0.0
+        self.frames = 0
+        self.stretched = 0
+        # Animations using the bus: stream -> time its next frame is due
+        self._streams = {}
+
+    def record(self, seconds):
+        """
+        :param float seconds: bus time one frame took, whichever display drew it
+        """
+        if self.frames:
+            self.frame_cost += self.smoothing * (seconds - self.frame_cost)
+        else:
+            self.frame_cost = seconds
+        self.frames += 1
+
+    def delay(self, nominal, stream=None):
+        """
+        :param float nominal: delay the animation asks for
+        :param stream: key of the animating display, e.g. its processor
+        :return float: delay keeping the frames of all streams within the budget
+        """
+        now = self.clock()
+        self._streams[stream] = now
+        streams = self.active_streams(now, nominal)
+        # The next frame is scheduled once this one is written: streams * cost / (cost + delay) <= budget
+        paced = self.frame_cost * (streams - self.budget) / self.budget
+        if paced <= nominal:
+            delay = nominal
+        else:
+            self.stretched += 1
+            delay = min(paced, nominal * self.max_slowdown)
+        self._streams[stream] = now + delay
+        return delay
+
+    def active_streams(self, now=None, grace=0.0):
+        """
+        :param float now: current time of the clock
+        :param float grace: seconds a frame may be late before its stream counts as stopped
+        :return int: animations which are due to draw another frame
+        """
+        if now is None:
+            now = self.clock()
+        for stream, due in list(self._streams.items()):
+            if due + grace < now:
+                del self._streams[stream]
+        return max(len(self._streams), 1)
+
+    def utilization(self, delay):
+        """
+        :param float delay: seconds between two frames of every stream
+        :return float: share of the bus time the frames take
+        """
+        if delay <= 0:
+            return 1.0
+        return min(self.active_streams() * self.frame_cost / (self.frame_cost + delay), 1.0)
+
+    def snapshot(self):
+        """
+        :return dict: measured frame cost and how often delays were stretched
+        """
+        return {
+            "frames": self.frames,
+            "frame_cost_us": self.frame_cost * 1e6,
+            "stretched": self.stretched,
+            "streams": len(self._streams),
+            "budget": self.budget,
+        }
@@ -0,0 +1,143 @@
+import logging
+import re
+import threading
+from collections import OrderedDict
+
+# Glyph characters handed out by char() come from the Unicode private use
+# area, they are mapped to CG-RAM slots when a frame gets drawn
+PLACEHOLDER_BASE = 0xF000
+PLACEHOLDER = re.compile("[\uf000-\uf8ff]")
+
+
+class GlyphManager:
+    """
+    Tracks which custom character sits in which of the 8 HD44780 CG-RAM
+    slots. Texts hold a placeholder character per glyph, which stays valid
+    however many glyphs are used. Slots are assigned on the processor thread
+    right before a frame is written: glyphs are uploaded on first use and
+    stay resident until the least recently used one, not shown by the frame,
+    has to make room.
+    """
+
+    def __init__(self, processor, slots=8):
+        """
+        :param RpiLcdProcessor processor: its LCD receives the uploads, pinned glyphs go through its queue
+        :param int slots: CG-RAM slots of the display
+        """
+        self.processor = processor
+        self.slots = slots
+        # bitmap -> placeholder character and back
+        self._chars = {}
+        self._bitmaps = {}
+        # placeholder -> slot of the resident glyphs, least recently used first
+        self._resident = OrderedDict()
+        self._free = list(range(slots))
+        # Slots defined with define(), never evicted
+        self._pinned = {}
+        self._lock = threading.Lock()
+        self.uploads = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def char(self, bitmap):
+        """
+        Character showing a glyph in texts written to the display
+        :param tuple bitmap: eight rows of five pixels
+        :return str: placeholder of the glyph, replaced by its slot when drawn
+        """
+        bitmap = tuple(bitmap)
+        with self._lock:
+            if len(self._pinned) == self.slots:
+                raise Exception("Error: All CG-RAM slots are pinned.")
+            char = self._chars.get(bitmap)
+            if char is None:
+                char = chr(PLACEHOLDER_BASE + len(self._chars))
+                self._chars[bitmap] = char
+                self._bitmaps[char] = bitmap
+        return char
+
+    def resolve(self, rows):
+        """
+        Replace the glyph placeholders by CG-RAM slots, uploading glyphs which
+        are not resident. Runs on the processor thread before rows are written.
+        :param list rows: strings to be written
+        :return list: rows as they are sent to the LCD
+        """
+        if not self._bitmaps:
+            return rows
+        # Glyphs of the frame in order of appearance
+        used = dict.fromkeys(char for row in rows for char in PLACEHOLDER.findall(row) if char in self._bitmaps)
+        if not used:
+            return rows
+
+        slots = {}
+        with self._lock:
+            for char in used:
+                if char in self._resident:
+                    self._resident.move_to_end(char)
+                    slots[char] = self._resident[char]
+                    self.hits += 1
+            for char in used:
+                if char not in slots:
+                    slot = self._assign(char, used)
+                    if slot is not None:
+                        slots[char] = slot
+
+        def replace(match):
+            char = match.group()
+            if char in slots:
+                return chr(slots[char])
+            return "?" if char in used else char
+
+        return [PLACEHOLDER.sub(replace, row) for row in rows]
+
+    def _assign(self, char, used):
+        """
+        Upload a glyph into a free slot or the least recently used one which
+        is not needed for the same frame
+        :return int: the slot, None if every slot is taken by this frame
+        """
+        if self._free:
+            slot = self._free.pop(0)
+        else:
+            victim = next((resident for resident in self._resident if resident not in used), None)
+            if victim is None:
+                logging.error("More glyphs in one frame than CG-RAM slots, the rest is shown as '?'")
+                return None
+            slot = self._resident.pop(victim)
+            self.evictions += 1
+
+        self._resident[char] = slot
+        self.uploads += 1
+        self.processor.lcd.create_char(slot, self._bitmaps[char])
+        return slot
+
+    def define(self, slot, bitmap):
+        """
+        Put a glyph into a fixed slot, which is not used for other glyphs anymore
+        :param int slot: CG-RAM slot (0-7)
+        :param tuple bitmap: eight rows of five pixels
+        """
+        bitmap = tuple(bitmap)
+        with self._lock:
+            if slot in self._free:
+                self._free.remove(slot)
+            for resident, resident_slot in list(self._resident.items()):
+                if resident_slot == slot:
+                    del self._resident[resident]
+            if self._pinned.get(slot) != bitmap:
+                self._pinned[slot] = bitmap
+                self.uploads += 1
+                self.processor.put([self.processor.lcd.create_char, slot, bitmap])
+        return self
+
+    def stats(self):
+        """
+        :return dict: upload counters for monitoring
+        """
+        return {
+            "uploads": self.uploads,
+            "hits": self.hits,
+            "evictions": self.evictions,
+            "resident": len(self._resident) + len(self._pinned),
+        }
@@ -0,0 +1,114 @@
+import time
+
+
+class Histogram:
+    """
+    Latency histogram with power-of-two microsecond buckets. Bucket n
+    counts durations below 2**n microseconds, the last one everything else.
+    """
+
+    BUCKETS = 24
+
+    def __init__(self):
+        self.buckets = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        """
+        :param float seconds: measured duration
+        """
+        self.buckets[min(int(seconds * 1e6).bit_length(), self.BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent):
+        """
+        :param float percent: 0 to 100
+        :return float: upper bound of the bucket holding the percentile, in seconds
+        """
+        if not self.count:
+            return 0.0
+        rank = self.count * percent / 100.0
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(2 ** bucket / 1e6, self.max)
+        return self.max
+
+    def snapshot(self):
+        """
+        :return dict: count and latencies in microseconds
+        """
+        return {
+            "count": self.count,
+            "mean_us": self.total / self.count * 1e6 if self.count else 0.0,
+            "p50_us": self.percentile(50) * 1e6,
+            "p95_us": self.percentile(95) * 1e6,
+            "max_us": self.max * 1e6,
+        }
+
+
+class PipelineMetrics:
+    """
+    Counters and latency histograms of the LCD pipeline. A processor
+    created without metrics skips all of the bookkeeping.
+    """
+
+    def __init__(self, callback=None, interval=10.0, clock=time.perf_counter):
+        """
+        :param callable callback: called with snapshot() every interval seconds
+            by the processor the metrics are attached to
+        :param float interval: seconds between two callback calls
+        :param callable clock: time source of all measurements
+        """
+        self.callback = callback
+        self.interval = interval
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        """
+        Start a new measuring period
+        """
+        # Execution time per command, keyed on the name of the called function
+        self.commands = {}
+        self.queue_wait = Histogram()
+        self.render = Histogram()
+        self.bytes_written = 0
+        self.frames_written = 0
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+        self.scroll_animations = 0
+        return self
+
+    def command(self, func, seconds):
+        """
+        :param callable func: executed command
+        :param float seconds: time it took
+        """
+        name = getattr(func, "__qualname__", None) or type(func).__name__
+        try:
+            histogram = self.commands[name]
+        except KeyError:
+            histogram = self.commands[name] = Histogram()
+        histogram.add(seconds)
+
+    def snapshot(self):
+        """
+        :return dict: all counters, histograms as returned by Histogram.snapshot
+        """
+        return {
+            "commands": {name: histogram.snapshot() for name, histogram in self.commands.items()},
+            "queue_wait": self.queue_wait.snapshot(),
+            "render": self.render.snapshot(),
+            "bytes_written": self.bytes_written,
+            "frames_written": self.frames_written,
+            "frames_rendered": self.frames_rendered,
+            "frames_skipped": self.frames_skipped,
+            "scroll_animations": self.scroll_animations,
+        }
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+
+
+class ScrollFrameCache:
+    """
+    Least recently used cache of precomputed scroll animation frames.
+    Entries are keyed on the item text, so changing the text of an item
+    never returns stale frames.
+    """
+
+    def __init__(self, maxsize=32, edge_delay_frames=25, delay_frames=5):
+        """
+        :param int maxsize: how many scroll sequences are kept
+        :param int edge_delay_frames: pause at both ends of the text, in animation frames
+        :param int delay_frames: pause between two scroll steps, in animation frames
+        """
+        self.maxsize = maxsize
+        self.edge_delay_frames = edge_delay_frames
+        self.delay_frames = delay_frames
+        self._frames = OrderedDict()
+
+    def get(self, text, width, cursor_char):
+        """
+        :param str text: text of the scrolled row
+        :param int width: visible characters next to the cursor
+        :param str cursor_char: character in front of the text
+        :return tuple: (row, delay_frames) pairs, one per animation step
+        """
+        key = (text, width, cursor_char)
+        try:
+            self._frames.move_to_end(key)
+            return self._frames[key]
+        except KeyError:
+            pass
+
+        frames = self._build(text, width, cursor_char)
+        self._frames[key] = frames
+        if len(self._frames) > self.maxsize:
+            self._frames.popitem(last=False)
+        return frames
+
+    def invalidate(self, text=None):
+        """
+        Drop cached frames
+        :param str text: only drop sequences of this text, everything if None
+        """
+        if text is None:
+            self._frames.clear()
+            return self
+
+        for key in [key for key in self._frames if key[0] == text]:
+            del self._frames[key]
+        return self
+
+    def __len__(self):
+        return len(self._frames)
+
+    def _build(self, text, width, cursor_char):
+        last = max(len(text) - width, 0)
+        return tuple(
+            (
+                cursor_char + text[pos: pos + width],
+                self.edge_delay_frames if pos in (0, last) else self.delay_frames
+            )
+            for pos in range(last + 1)
+        )
@@ -0,0 +1,62 @@
+class ShadowFramebuffer:
+    """
+    Copy of the characters currently shown on the LCD. Comparing a new
+    frame against it yields only the character runs which really changed.
+    """
+
+    def __init__(self, cols=16, rows=2, max_gap=1):
+        """
+        :param int cols: display width in characters
+        :param int rows: display height in characters
+        :param int max_gap: unchanged characters between two changed runs which are
+            rewritten instead of repositioning the cursor (one command byte each)
+        """
+        self.cols = cols
+        self.rows = rows
+        self.max_gap = max_gap
+        self.lines = [None] * rows
+
+    def clear(self):
+        """
+        The display has been cleared, every cell holds a space now
+        """
+        self.lines = [" " * self.cols for _ in range(self.rows)]
+
+    def invalidate(self):
+        """
+        The display content is unknown (e.g. after a raw write), next diff rewrites everything
+        """
+        self.lines = [None] * self.rows
+
+    def diff(self, framebuffer):
+        """
+        Compare a frame with the shadow copy and remember it as shown.
+        Rows missing from framebuffer are left untouched.
+        :param list framebuffer: strings to be shown, one per row
+        :return list: (row, col, text) runs which have to be written to the LCD
+        """
+        runs = []
+        for row, line in enumerate(framebuffer[:self.rows]):
+            line = line.ljust(self.cols)[:self.cols]
+            old = self.lines[row]
+            self.lines[row] = line
+
+            if old is None:
+                runs.append((row, 0, line))
+                continue
+            if old == line:
+                continue
+
+            start = last = None
+            for col in range(self.cols):
+                if line[col] == old[col]:
+                    continue
+                if start is None:
+                    start = col
+                elif col - last - 1 > self.max_gap:
+                    runs.append((row, start, line[start:last + 1]))
+                    start = col
+                last = col
+            runs.append((row, start, line[start:last + 1]))
+
+        return runs
@@ -1,8 +1,9 @@
 
-def get_scrolled_line(text, line_number=0):
+def get_scrolled_line(text, line_number=0, width=16):
     """
     :param str text: message to be scrolled
     :param int line_number: which number to start from
+    :param int width: display width in characters
     """
     scrolled_text = ''
     char_index = 0
@@ -14,7 +15,7 @@ def get_scrolled_line(text, line_number=0):
 
         char_index += 1
 
-        if char_index == 16 or char == '\n':
+        if char_index == width or char == '\n':
             if line_index == line_number:
                 return scrolled_text
             char_index = 0
@@ -23,28 +24,34 @@ def get_scrolled_line(text, line_number=0):
     return scrolled_text
 
 
-def get_scrolled_text(text, start_line=0, lines_required=2):
+def get_scrolled_text(text, start_line=0, lines_required=2, width=16):
     """
     :param str text: message to be scrolled
     :param int start_line: which number to start from
     :param int lines_required: how many lines are needed
+    :param int width: display width in characters
     """
     return ''.join(
-        get_scrolled_line(text, line)
+        get_scrolled_line(text, line, width)
         for line in range(start_line, start_line + lines_required)
     )
 
 
-def get_text_lines(text):
+def get_text_lines(text, width=16):
     """
     :param str text: message to evaluate
+    :param int width: display width in characters
     :return int: how many lines the message has
     """
     char_index = 0
     line_counter = 1
 
     for char in text:
-        if char_index == 17 or char == '\n':
+        if char == '\n':
+            char_index = 0
+            line_counter += 1
+            continue
+        if char_index == width:
             char_index = 0
             line_counter += 1
         char_index += 1
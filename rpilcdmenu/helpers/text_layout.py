@@ -0,0 +1,98 @@
+def wrap_text(paragraph, width=16):
+    """
+    Break a single paragraph into display lines, at spaces where possible
+    :param str paragraph: text without newlines
+    :param int width: display width in characters
+    :return list: display lines
+    """
+    if len(paragraph) <= width:
+        return [paragraph]
+
+    lines = []
+    line = ''
+    for word in paragraph.split(' '):
+        if line and len(line) + 1 + len(word) <= width:
+            line += ' ' + word
+            continue
+        if line:
+            lines.append(line)
+        while len(word) > width:
+            lines.append(word[:width])
+            word = word[width:]
+        line = word
+    lines.append(line)
+    return lines
+
+
+class TextLayout:
+    """
+    Wraps a text into display lines once and keeps the result, so showing
+    any part of the text is a slice of the line index. Lines are broken
+    at spaces where possible, words longer than the display are split.
+    """
+
+    def __init__(self, text='', width=16):
+        """
+        :param str text: text to be laid out
+        :param int width: display width in characters
+        """
+        self.width = width
+        self.text = ''
+        self.lines = ['']
+        # First line of the last paragraph, which is re-wrapped on append
+        self._paragraph_line = 0
+        self._paragraph = ''
+
+        self.append(text)
+
+    def set_text(self, text):
+        """
+        Replace the text, appended text only wraps the new part
+        :param str text: new text
+        """
+        if text.startswith(self.text):
+            return self.append(text[len(self.text):])
+
+        self.text = ''
+        self.lines = ['']
+        self._paragraph_line = 0
+        self._paragraph = ''
+        return self.append(text)
+
+    def append(self, text):
+        """
+        Add text to the end, only the last paragraph gets wrapped again
+        :param str text: text to be added
+        """
+        if not text:
+            return self
+
+        self.text += text
+        paragraphs = (self._paragraph + text).split('\n')
+
+        del self.lines[self._paragraph_line:]
+        for paragraph in paragraphs[:-1]:
+            self.lines.extend(self._wrap(paragraph))
+
+        self._paragraph_line = len(self.lines)
+        self._paragraph = paragraphs[-1]
+        self.lines.extend(self._wrap(self._paragraph))
+        return self
+
+    @property
+    def line_count(self):
+        """
+        :return int: how many display lines the text has
+        """
+        return len(self.lines)
+
+    def window(self, start_line=0, lines_required=2):
+        """
+        :param int start_line: first line to be shown
+        :param int lines_required: how many lines are needed
+        :return list: the requested display lines
+        """
+        return self.lines[start_line: start_line + lines_required]
+
+    def _wrap(self, paragraph):
+        return wrap_text(paragraph, self.width)
@@ -0,0 +1,7 @@
+from .controller import InputController, UP, DOWN, ENTER, ALT_ENTER
+from .sources import InputSource, GpioButton, PolledAxis, KeyboardSource, TerminalKeyboard
+
+__all__ = [
+    'InputController', 'UP', 'DOWN', 'ENTER', 'ALT_ENTER',
+    'InputSource', 'GpioButton', 'PolledAxis', 'KeyboardSource', 'TerminalKeyboard',
+]
@@ -0,0 +1,218 @@
+import threading
+import time
+from collections import deque
+
+UP = "up"
+DOWN = "down"
+ENTER = "enter"
+ALT_ENTER = "alt_enter"
+
+# Cursor movement of the keys which auto-repeat and coalesce
+MOVES = {UP: -1, DOWN: 1}
+
+
+class InputController:
+    """
+    Turns raw key presses and releases from input sources into menu
+    events. Presses are debounced, held up/down keys repeat with growing
+    speed and bursts of moves are applied as one cursor move with a single
+    render. Like the examples' 'menu = menu.processDown()' loop it tracks
+    the active menu. Sources may report from any thread, the menu is only
+    driven from the controller thread (or the caller of dispatch).
+    """
+
+    def __init__(self, menu, debounce=0.03, coalesce_window=0.02, repeat_delay=0.5, repeat_interval=0.2,
+                 repeat_min_interval=0.03, repeat_acceleration=0.8, clock=time.monotonic, recorder=None):
+        """
+        :param BaseMenu menu: the active menu
+        :param float debounce: seconds after an accepted change of a key during which its bounces are ignored, the first edge is accepted at once
+        :param float coalesce_window: seconds moves are collected before they are applied
+        :param float repeat_delay: seconds up/down has to be held before it repeats, no repeat if None
+        :param float repeat_interval: seconds between the first repeats
+        :param float repeat_min_interval: fastest repeat
+        :param float repeat_acceleration: factor applied to the interval after every repeat
+        :param callable clock: time source
+        :param TraceRecorder recorder: logs every dispatched event, if given
+        """
+        self.menu = menu
+        self.debounce = debounce
+        self.coalesce_window = coalesce_window
+        self.repeat_delay = repeat_delay
+        self.repeat_interval = repeat_interval
+        self.repeat_min_interval = repeat_min_interval
+        self.repeat_acceleration = repeat_acceleration
+        self.clock = clock
+        self.recorder = recorder
+
+        self._condition = threading.Condition()
+        # Pending events as [key, steps] entries, consecutive moves share one entry
+        self._pending = deque()
+        self._pending_since = None
+        # Per key: reported level, accepted level and time of the last accepted change
+        self._levels = {}
+        self._states = {}
+        self._changed_at = {}
+        # Held move keys: key -> [next repeat, current interval]
+        self._held = {}
+        self._thread = None
+        self._running = False
+        self.events_received = 0
+        self.events_dispatched = 0
+
+    def press(self, key):
+        """
+        A key went down, can be called from any thread
+        """
+        self._report(key, True)
+        return self
+
+    def release(self, key):
+        """
+        A key went up, can be called from any thread
+        """
+        self._report(key, False)
+        return self
+
+    def tap(self, key):
+        """
+        A complete key stroke from a source which does not bounce (keyboard, remote)
+        """
+        with self._condition:
+            self._queue(key, self.clock())
+            self._condition.notify()
+        return self
+
+    def _report(self, key, level):
+        with self._condition:
+            now = self.clock()
+            self._levels[key] = level
+            self._settle(key, now)
+            self._condition.notify()
+
+    def _settle(self, key, now):
+        """
+        Accept the reported level of key once it differs from the accepted
+        one and the last change is more than debounce ago
+        """
+        level = self._levels.get(key, False)
+        if level == self._states.get(key, False):
+            return
+        if now - self._changed_at.get(key, float("-inf")) < self.debounce:
+            return
+
+        self._states[key] = level
+        self._changed_at[key] = now
+        if not level:
+            self._held.pop(key, None)
+            return
+        self._queue(key, now)
+        if key in MOVES and self.repeat_delay is not None:
+            self._held[key] = [now + self.repeat_delay, self.repeat_interval]
+
+    def _queue(self, key, now):
+        self.events_received += 1
+        if self._pending_since is None:
+            self._pending_since = now
+        if key in MOVES and self._pending and self._pending[-1][0] is None:
+            self._pending[-1][1] += MOVES[key]
+        elif key in MOVES:
+            self._pending.append([None, MOVES[key]])
+        else:
+            self._pending.append([key, 0])
+
+    def _repeat(self, now):
+        for key, repeat in self._held.items():
+            while repeat[0] <= now:
+                self._queue(key, repeat[0])
+                repeat[0] += repeat[1]
+                repeat[1] = max(repeat[1] * self.repeat_acceleration, self.repeat_min_interval)
+
+    def _take(self, now):
+        """
+        :return tuple: (events ready to be dispatched, seconds until something becomes due or None)
+        """
+        for key in list(self._levels):
+            self._settle(key, now)
+        self._repeat(now)
+
+        deadlines = [repeat[0] for repeat in self._held.values()]
+        deadlines += [
+            self._changed_at[key] + self.debounce
+            for key, level in self._levels.items() if level != self._states.get(key, False)
+        ]
+
+        events = []
+        if self._pending:
+            ready_at = self._pending_since + self.coalesce_window
+            if ready_at <= now:
+                events = list(self._pending)
+                self._pending.clear()
+                self._pending_since = None
+            else:
+                deadlines.append(ready_at)
+
+        timeout = max(min(deadlines) - now, 0) if deadlines else None
+        return events, timeout
+
+    def dispatch(self):
+        """
+        Apply the events which are due on the calling thread
+        :return BaseMenu: the active menu
+        """
+        with self._condition:
+            events, _ = self._take(self.clock())
+        return self._apply(events)
+
+    def _apply(self, events):
+        for key, steps in events:
+            self.apply(key, steps)
+        return self.menu
+
+    def apply(self, key, steps=0):
+        """
+        Pass one event to the active menu right away
+        :param str key: ENTER or ALT_ENTER, None for a cursor move
+        :param int steps: positions to move
+        :return BaseMenu: the active menu
+        """
+        if self.recorder is not None:
+            self.recorder.input(key, steps)
+        if key is None:
+            if steps:
+                self.menu = self.menu.processSteps(steps)
+        elif key == ENTER:
+            self.menu = self.menu.processEnter()
+        elif key == ALT_ENTER:
+            self.menu = self.menu.processAltEnter()
+        self.events_dispatched += 1
+        return self.menu
+
+    def start(self):
+        """
+        Dispatch events on a background thread
+        """
+        if self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(target=self.run, daemon=True)
+            self._thread.start()
+        return self
+
+    def run(self):
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                events, timeout = self._take(self.clock())
+                if not events:
+                    self._condition.wait(timeout)
+                    continue
+            self._apply(events)
+
+    def stop(self):
+        if self._thread is not None:
+            with self._condition:
+                self._running = False
+                self._condition.notify()
+            self._thread.join()
+            self._thread = None
+        return self
@@ -0,0 +1,213 @@
+import sys
+import threading
+
+from .controller import UP, DOWN, ENTER, ALT_ENTER
+
+
+class InputSource:
+    """
+    Feeds key presses and releases into an InputController
+    """
+
+    def __init__(self, controller):
+        """
+        :param InputController controller: receives the key events
+        """
+        self.controller = controller
+
+    def start(self):
+        return self
+
+    def stop(self):
+        return self
+
+
+class GpioButton(InputSource):
+    """
+    Push button on a GPIO pin, reported through RPi.GPIO edge callbacks
+    instead of polling. RPi.GPIO is imported on start.
+    """
+
+    def __init__(self, controller, pin, key, active_high=True, pull_up_down=None):
+        """
+        :param int pin: BCM pin number
+        :param str key: key the button stands for (UP, DOWN, ENTER, ALT_ENTER)
+        :param bool active_high: whether the pin reads 1 while the button is pressed
+        :param int pull_up_down: GPIO.PUD_UP or GPIO.PUD_DOWN, pulled against the active level if None
+        """
+        super(GpioButton, self).__init__(controller)
+        self.pin = pin
+        self.key = key
+        self.active_high = active_high
+        self.pull_up_down = pull_up_down
+        self.gpio = None
+
+    def start(self):
+        import RPi.GPIO as GPIO
+
+        self.gpio = GPIO
+        pull_up_down = self.pull_up_down
+        if pull_up_down is None:
+            pull_up_down = GPIO.PUD_DOWN if self.active_high else GPIO.PUD_UP
+        GPIO.setmode(GPIO.BCM)
+        GPIO.setup(self.pin, GPIO.IN, pull_up_down=pull_up_down)
+        GPIO.add_event_detect(self.pin, GPIO.BOTH, callback=self._edge)
+        return self
+
+    def _edge(self, pin):
+        # Read the level instead of trusting the edge type, bounces may be missed
+        if bool(self.gpio.input(pin)) == self.active_high:
+            self.controller.press(self.key)
+        else:
+            self.controller.release(self.key)
+
+    def stop(self):
+        if self.gpio is not None:
+            self.gpio.remove_event_detect(self.pin)
+        return self
+
+
+class PolledAxis(InputSource):
+    """
+    Analog axis (e.g. a joystick behind an I2C ADC) polled on a thread.
+    Leaving the center zone presses a key, returning releases it.
+    """
+
+    def __init__(self, controller, read, low_key=DOWN, high_key=UP, low=0.7, high=2.5, interval=0.02):
+        """
+        :param callable read: returns the current value of the axis
+        :param str low_key: key pressed below low
+        :param str high_key: key pressed above high
+        :param float low: upper bound of the low zone
+        :param float high: lower bound of the high zone
+        :param float interval: seconds between two readings
+        """
+        super(PolledAxis, self).__init__(controller)
+        self.read = read
+        self.low_key = low_key
+        self.high_key = high_key
+        self.low = low
+        self.high = high
+        self.interval = interval
+        self.key = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def poll(self):
+        """
+        Take one reading and report a changed key
+        """
+        value = self.read()
+        key = self.low_key if value < self.low else self.high_key if value > self.high else None
+        if key != self.key:
+            if self.key is not None:
+                self.controller.release(self.key)
+            if key is not None:
+                self.controller.press(key)
+            self.key = key
+        return self
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.poll()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self
+
+
+class KeyboardSource(InputSource):
+    """
+    Key strokes read from a text stream, stdin by default. Meant for
+    development and tests without buttons: every character is one stroke.
+    """
+
+    keymap = {"w": UP, "k": UP, "s": DOWN, "j": DOWN, "e": ENTER, " ": ENTER, "a": ALT_ENTER}
+
+    def __init__(self, controller, stream=None, keymap=None):
+        """
+        :param stream: text stream to read from, sys.stdin if None
+        :param dict keymap: character -> key, unknown characters are ignored
+        """
+        super(KeyboardSource, self).__init__(controller)
+        self.stream = stream if stream is not None else sys.stdin
+        if keymap is not None:
+            self.keymap = keymap
+        self._thread = None
+
+    def feed(self, text):
+        """
+        Report the key strokes of text
+        """
+        for char in text:
+            key = self.keymap.get(char)
+            if key is not None:
+                self.controller.tap(key)
+        return self
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        for line in self.stream:
+            self.feed(line)
+
+
+class TerminalKeyboard(KeyboardSource):
+    """
+    Keyboard of the terminal read key by key, arrows included. Up and down
+    move, right and enter select, left is the alternative select, q quits.
+    """
+
+    keymap = dict(KeyboardSource.keymap, **{
+        "\x1b[A": UP, "\x1b[B": DOWN, "\x1b[C": ENTER, "\x1b[D": ALT_ENTER, "\n": ENTER, "\r": ENTER,
+    })
+
+    def __init__(self, controller, stream=None, keymap=None, on_quit=None, quit_chars="q"):
+        """
+        :param callable on_quit: called when a quit key is pressed or the stream ends
+        :param str quit_chars: characters which end reading
+        """
+        super(TerminalKeyboard, self).__init__(controller, stream, keymap)
+        self.on_quit = on_quit
+        self.quit_chars = quit_chars
+        self._saved_mode = None
+
+    def start(self):
+        if self.stream.isatty():
+            import termios
+            import tty
+
+            self._saved_mode = termios.tcgetattr(self.stream)
+            tty.setcbreak(self.stream)
+        return super(TerminalKeyboard, self).start()
+
+    def _run(self):
+        while True:
+            char = self.stream.read(1)
+            if not char or char in self.quit_chars:
+                break
+            if char == "\x1b":
+                char += self.stream.read(2)
+            self.feed([char])
+        if self.on_quit is not None:
+            self.on_quit()
+
+    def stop(self):
+        if self._saved_mode is not None:
+            import termios
+
+            termios.tcsetattr(self.stream, termios.TCSADRAIN, self._saved_mode)
+            self._saved_mode = None
+        return self
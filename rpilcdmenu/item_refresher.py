@@ -0,0 +1,119 @@
+import logging
+import time
+
+from rpilcdmenu.items.dynamic_item import DynamicItem
+from rpilcdmenu.rpi_lcd_hwd import BACKGROUND
+
+
+class ItemRefresher:
+    """
+    Keeps the visible DynamicItems up to date. Stale providers run on an
+    executor, their values are applied on the LCD processor thread and the
+    menu is only rendered again if a visible text changed. Items which are
+    not shown are never polled. Like BusyIndicator it is created by the
+    first menu needing it and shared by all menus on the display.
+    """
+
+    def __init__(self, menu, executor=None, clock=time.monotonic, min_ttl=0.1):
+        """
+        :param RpiLCDMenu menu: menu used to reach the display
+        :param concurrent.futures.Executor executor: runs the providers, a single worker thread if None
+        :param callable clock: time source of the value ages
+        :param float min_ttl: shortest time between two calls of a provider, whatever its ttl
+        """
+        self.processor = menu.rpi_lcd_processor
+        self.executor = executor
+        self._owns_executor = executor is None
+        self.clock = clock
+        self.min_ttl = min_ttl
+        # Menu which rendered last and its visible DynamicItems, set by the
+        # rendering thread under the render lock of the processor
+        self.menu = None
+        self.items = []
+        self.timer = None
+        self.refreshes = 0
+        self.renders = 0
+        self._poll_items = [self._poll]
+
+    def watch(self, menu, items):
+        """
+        The menu has been rendered with items visible, no items if it does not
+        show a list. Can be called from the thread driving the menu.
+        :param RpiLCDMenu menu: menu drawing the display
+        :param list items: visible items, other than DynamicItems are ignored
+        """
+        items = [item for item in items if isinstance(item, DynamicItem)]
+        with self.processor.render_lock:
+            watched = self.items
+            self.menu = menu if items else None
+            self.items = items
+        # Nothing to poll and no timer of earlier items to cancel
+        if items or watched:
+            self.processor.put(self._poll_items)
+        return self
+
+    def _poll(self):
+        """
+        Start the providers of stale visible items and wait for the next one to expire
+        """
+        if self.timer is not None:
+            self.processor.cancel(self.timer)
+            self.timer = None
+
+        now = self.clock()
+        next_expiry = None
+        for item in self.items:
+            if item.future is not None:
+                continue
+            expires_at = item.expires_at()
+            if item.fetched_at is not None:
+                # A ttl of 0 must not turn into a busy loop
+                expires_at = max(expires_at, item.fetched_at + self.min_ttl)
+            if expires_at <= now:
+                self._submit(item)
+            elif next_expiry is None or expires_at < next_expiry:
+                next_expiry = expires_at
+
+        if next_expiry is not None:
+            self.timer = self.processor.schedule(next_expiry - now, self._poll_items)
+
+    def _submit(self, item):
+        if self.executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lcd-refresh")
+        processor = self.processor
+        item.future = future = self.executor.submit(item.provider)
+        self.refreshes += 1
+        future.add_done_callback(lambda done: processor.put_threadsafe([self._apply, item, done], BACKGROUND))
+
+    def _apply(self, item, future):
+        """
+        Take the value of a provider, runs on the processor thread. The menu
+        is only drawn if it is still the one which rendered last and shows
+        the item, the render lock keeps renders of the menu thread out.
+        """
+        item.future = None
+        item.fetched_at = self.clock()
+        if future.exception() is not None:
+            logging.error("DynamicItem '%s' failed: %r", item.text, future.exception())
+        else:
+            text = str(future.result())
+            if text != item.text:
+                item.text = text
+                with self.processor.render_lock:
+                    if self.menu is not None and item in self.items:
+                        self.renders += 1
+                        # Rendering watches the items again, which polls them
+                        self.menu.render()
+                        return
+        self._poll()
+
+    def close(self):
+        """
+        Stop the worker thread created by the refresher
+        """
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        return self
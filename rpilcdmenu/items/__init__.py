@@ -3,5 +3,6 @@ from .function_item import FunctionItem
 from .submenu_item import SubmenuItem
 from .message_item import MessageItem
 from .container_item import ContainerItem
+from .dynamic_item import DynamicItem
 
-__all__ = ['FunctionItem', 'SubmenuItem', 'MenuItem', 'MessageItem', 'ContainerItem']
+__all__ = ['FunctionItem', 'SubmenuItem', 'MenuItem', 'MessageItem', 'ContainerItem', 'DynamicItem']
@@ -3,6 +3,8 @@ class ContainerItem:
     An item to contain two other items
     """
 
+    __slots__ = ("items", "text", "menu")
+
     def __init__(self, text, menu=None):
         """
         :ivar str text: The text shown for this menu item
@@ -0,0 +1,33 @@
+from .menu_item import MenuItem
+
+
+class DynamicItem(MenuItem):
+    """
+    A menu item showing a live value (temperature, IP address...). Its text
+    comes from a provider which the ItemRefresher of the display calls in
+    the background while the item is visible and its value is older than ttl.
+    """
+
+    __slots__ = ("provider", "ttl", "fetched_at", "future")
+
+    def __init__(self, provider, ttl=5.0, text="...", menu=None):
+        """
+        :ivar callable provider: Returns the text to be shown, called on a worker thread
+        :ivar float ttl: Seconds a value is shown before the provider is called again
+        :ivar str text: Shown until the provider has returned for the first time
+        :ivar RpiLCDMenu menu: The menu which this item belongs to
+        """
+        super(DynamicItem, self).__init__(text=text, menu=menu)
+
+        self.provider = provider
+        self.ttl = ttl
+        self.fetched_at = None
+        self.future = None
+
+    def expires_at(self):
+        """
+        :return float: time at which the value gets stale, -inf before the first call
+        """
+        if self.fetched_at is None:
+            return float("-inf")
+        return self.fetched_at + self.ttl
@@ -1,32 +1,127 @@
+import logging
+import threading
+from types import MappingProxyType
+
+from rpilcdmenu.base_menu import BaseMenu
 from .menu_item import MenuItem
 
+# Shared by all items called without arguments
+NO_ARGS = ()
+NO_KWARGS = MappingProxyType({})
+
 
 class FunctionItem(MenuItem):
     """
     A menu item to call a Python function
     """
 
-    def __init__(self, text, function, args=None, kwargs=None, menu=None):
+    __slots__ = ("function", "args", "kwargs", "returned_value", "executor", "timeout", "future", "_timeout_handle",
+                 "_lock")
+
+    def __init__(self, text, function, args=None, kwargs=None, menu=None, executor=None, timeout=None):
         """
         :ivar function: The function to be called
         :ivar list args: An optional list of arguments to be passed to the function
         :ivar dict kwargs: An optional dictionary of keyword arguments to be passed to the function
         :ivar RpiLCDMenu menu: The menu which this item belongs to
+        :ivar concurrent.futures.Executor executor: Runs the function in the background, the menu
+            stays responsive and shows a busy indicator meanwhile. Called synchronously if None
+        :ivar float timeout: Seconds after which a background call is abandoned, no limit if None
         """
         super(FunctionItem, self).__init__(text=text, menu=menu)
 
         self.function = function
 
-        self.args = args if args is not None else []
-        self.kwargs = kwargs if kwargs is not None else {}
+        self.args = args if args is not None else NO_ARGS
+        self.kwargs = kwargs if kwargs is not None else NO_KWARGS
         self.returned_value = None
+        self.executor = executor
+        self.timeout = timeout
+        self.future = None
+        self._timeout_handle = None
+        # Calls are finished from the timer and the executor threads, cancelling
+        # a future runs its callbacks on the cancelling thread
+        self._lock = threading.RLock()
 
     def action(self):
         """
-        This class overrides this method
+        This class overrides this method. With an executor the function is
+        only submitted, its result is handed to the menu once it is done.
         """
-        self.returned_value = self.function(*self.args, **self.kwargs)
-        return self.returned_value
+        if self.executor is None:
+            self.returned_value = self.function(*self.args, **self.kwargs)
+            return self.returned_value
+
+        menu = self._owner()
+        with self._lock:
+            # Entering the item again while it is running does not start another call
+            if self.future is not None:
+                return None
+
+            future = self.future = self.executor.submit(self.function, *self.args, **self.kwargs)
+            menu.show_busy()
+            if self.timeout is not None:
+                self._timeout_handle = menu._call_later(self.timeout, [self._finish, future])
+        future.add_done_callback(lambda done: menu._call_soon_threadsafe([self._finish, done]))
+        return None
+
+    def _owner(self):
+        """
+        :return BaseMenu: menu showing the item, the one holding its ContainerItem if it has one
+        """
+        menu = self.menu
+        while menu is not None and not isinstance(menu, BaseMenu):
+            menu = menu.menu
+        return menu
+
+    def is_running(self):
+        """
+        :return bool: whether a background call is in progress
+        """
+        return self.future is not None
+
+    def cancel(self):
+        """
+        Abandon the background call. A call which has already started keeps
+        running on the executor, but its result is dropped.
+        """
+        if self.future is not None:
+            self._finish(self.future)
+        return self
+
+    def _finish(self, future):
+        """
+        Apply the outcome of a background call. Runs on the display thread,
+        the first of completion, timeout and cancellation wins.
+        """
+        with self._lock:
+            if future is None or future is not self.future:
+                return
+            self._apply(future)
+
+    def _apply(self, future):
+        menu = self._owner()
+        self.future = None
+        if self._timeout_handle is not None:
+            menu._cancel_call(self._timeout_handle)
+            self._timeout_handle = None
+        menu.show_busy(False)
+
+        if not future.done():
+            future.cancel()
+            self.returned_value = None
+            logging.warning("FunctionItem '%s' abandoned", self.text)
+            return
+        if future.cancelled():
+            self.returned_value = None
+            return
+        if future.exception() is not None:
+            self.returned_value = None
+            logging.error("FunctionItem '%s' failed: %r", self.text, future.exception())
+            return
+
+        self.returned_value = future.result()
+        menu.action_finished(self, self.returned_value)
 
     def get_return(self):
         """
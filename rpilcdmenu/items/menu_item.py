@@ -3,6 +3,10 @@ class MenuItem(object):
     A generic menu item
     """
 
+    # Menus can hold thousands of items, slots keep them small. Subclasses
+    # without __slots__ get a __dict__ as usual.
+    __slots__ = ("text", "menu")
+
     def __init__(self, text, menu=None):
         """
         :ivar str text: The text shown for this menu item
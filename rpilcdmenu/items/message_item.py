@@ -7,6 +7,8 @@ class MessageItem(MenuItem):
     A menu item to open a submenu
     """
 
+    __slots__ = ("view",)
+
     def __init__(self, text, message, menu, scrollable=False):
         """
         :ivar str text: Message to be shown on display
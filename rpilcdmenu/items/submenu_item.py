@@ -5,6 +5,8 @@ class SubmenuItem(MenuItem):
     A menu item to open a submenu
     """
 
+    __slots__ = ("submenu",)
+
     def __init__(self, text, submenu, menu=None):
         """
         :ivar BaseMenu self.submenu: The submenu to be opened when this item is selected
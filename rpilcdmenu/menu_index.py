@@ -0,0 +1,177 @@
+from bisect import bisect_left, insort
+from itertools import count
+
+from rpilcdmenu.base_menu import BaseMenu
+
+
+class IndexEntry:
+    """
+    An item of the indexed menu tree
+    """
+
+    __slots__ = ("path", "menu", "item", "position", "key")
+
+    def __init__(self, path, menu, item, position, key):
+        self.path = path
+        self.menu = menu
+        self.item = item
+        self.position = position
+        # (lower case text, sequence number) in the sorted search list
+        self.key = key
+
+    def __repr__(self):
+        return "IndexEntry(%r)" % self.path
+
+
+class MenuIndex:
+    """
+    Index of a whole menu tree, built once by following SubmenuItem links.
+    Items are addressed by paths like "Settings/Network/IP", found by
+    prefix of their text and jumped to without stepping through the menus.
+    Menus report append_item/remove_item, so the index stays up to date.
+    Menus backed by a data source are not indexed.
+    """
+
+    separator = "/"
+
+    def __init__(self, root):
+        """
+        :param BaseMenu root: top menu of the tree
+        """
+        self.root = root
+        self._entries = {}
+        self._by_item = {}
+        self._menu_paths = {}
+        # Sorted (lower case text, sequence number, entry) for prefix search
+        self._texts = []
+        self._sequence = count()
+        self._add_menu(root, "")
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path):
+        return path in self._entries
+
+    def get(self, path):
+        """
+        :param str path: item texts from the root, joined by separator
+        :return IndexEntry: the entry, None if the path is unknown
+        """
+        return self._entries.get(path)
+
+    def search(self, prefix, limit=None):
+        """
+        Type-ahead search, case insensitive
+        :param str prefix: beginning of the item text
+        :param int limit: maximum number of entries
+        :return list: matching entries sorted by text
+        """
+        prefix = prefix.lower()
+        entries = []
+        for index in range(bisect_left(self._texts, (prefix,)), len(self._texts)):
+            text, _, entry = self._texts[index]
+            if not text.startswith(prefix) or len(entries) == limit:
+                break
+            entries.append(entry)
+        return entries
+
+    def jump(self, path):
+        """
+        Select an item and show its menu. The cursors of all menus on the
+        way are moved onto the path as well, so exiting walks back up it.
+        :param str path: item texts from the root, joined by separator
+        :return BaseMenu: the menu holding the item, it becomes the active menu
+        """
+        entry = self._entries[path]
+        target = entry.menu
+        menu = target
+        while True:
+            menu_path = self._menu_paths.get(menu)
+            if not menu_path:
+                break
+            parent = self._entries[menu_path]
+            parent.menu.current_option = parent.position
+            menu = parent.menu
+
+        target.current_option = entry.position
+        target.render()
+        return target
+
+    def item_added(self, menu, item):
+        """
+        Called by a menu after item has been appended
+        """
+        if menu in self._menu_paths and isinstance(menu.items, list):
+            self._add_item(menu, item, len(menu.items) - 1)
+        return self
+
+    def item_removed(self, menu, item):
+        """
+        Called by a menu before item gets removed. Items after it move up,
+        an item sharing its text takes over its path.
+        """
+        if menu not in self._menu_paths or not isinstance(menu.items, list):
+            return self
+        position = next((index for index, other in enumerate(menu.items) if other is item), None)
+        if position is None:
+            return self
+
+        entry = self._by_item.get(item)
+        if entry is not None and entry.menu is not menu:
+            entry = None
+        if entry is not None:
+            self._remove_entry(entry)
+
+        for later in menu.items[position + 1:]:
+            later_entry = self._by_item.get(later)
+            if later_entry is not None and later_entry.menu is menu:
+                later_entry.position -= 1
+
+        if entry is not None:
+            for index, other in enumerate(menu.items):
+                if other is not item and other.text == item.text and other not in self._by_item:
+                    self._add_item(menu, other, index if index < position else index - 1)
+                    break
+        return self
+
+    def _add_menu(self, menu, path):
+        if menu in self._menu_paths:
+            return
+        self._menu_paths[menu] = path
+        menu.index = self
+        if not isinstance(menu.items, list):
+            return
+        for position, item in enumerate(menu.items):
+            self._add_item(menu, item, position)
+
+    def _add_item(self, menu, item, position):
+        prefix = self._menu_paths[menu]
+        path = prefix + self.separator + item.text if prefix else item.text
+        # The first of several items with the same text keeps the path
+        if path in self._entries:
+            return
+
+        entry = IndexEntry(path, menu, item, position, (item.text.lower(), next(self._sequence)))
+        self._entries[path] = entry
+        self._by_item[item] = entry
+        insort(self._texts, entry.key + (entry,))
+
+        submenu = getattr(item, "submenu", None)
+        if isinstance(submenu, BaseMenu):
+            self._add_menu(submenu, path)
+
+    def _remove_entry(self, entry):
+        del self._entries[entry.path]
+        del self._by_item[entry.item]
+        del self._texts[bisect_left(self._texts, entry.key)]
+
+        submenu = getattr(entry.item, "submenu", None)
+        if submenu is not None and self._menu_paths.get(submenu) == entry.path:
+            del self._menu_paths[submenu]
+            submenu.index = None
+            if isinstance(submenu.items, list):
+                for item in submenu.items:
+                    child = self._by_item.get(item)
+                    if child is not None and child.menu is submenu:
+                        self._remove_entry(child)
@@ -1,44 +1,405 @@
+import heapq
+import itertools
 import threading
 import time
-import queue
-from queue import Empty
-import signal
-import threading
+from collections import deque
+
+from rpilcdmenu.backends import RplcdBackend
+from rpilcdmenu.helpers.glyph_manager import GlyphManager
+from rpilcdmenu.helpers.shadow_framebuffer import ShadowFramebuffer
+
+
+class Timer:
+    """
+    Handle of a command scheduled on the LCD processor
+    """
+
+    def __init__(self, deadline, sequence, items):
+        self.deadline = deadline
+        self.sequence = sequence
+        self.items = items
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.deadline, self.sequence) < (other.deadline, other.sequence)
+
+
+def create_lcd():
+    """
+    :return LcdBackend: the default PCF8574 16x2 display
+    """
+    return RplcdBackend(
+        i2c_expander="PCF8574", address=0x27, port=1,
+        cols=16, rows=2, dotsize=8, auto_linebreaks=True,
+    )
+
+
+# Priority lanes of the command queue, lower numbers are served first
+URGENT = 0  # alerts and overlays
+NORMAL = 1  # menu rendering and everything else
+BACKGROUND = 2  # refreshes nobody is waiting for
+LANES = (URGENT, NORMAL, BACKGROUND)
+
 
-from RPLCD.i2c import CharLCD
+class CommandQueue:
+    """
+    Priority lanes of FIFO LCD commands. In coalescing mode a full frame
+    supersedes a frame still waiting at the end of its lane and at the end
+    of every lower lane, those would only be drawn over it. The oldest
+    command of a lane skipped starvation_limit times in a row is served
+    first in the next batch. Not thread safe, the processor serialises the
+    access.
+    """
 
+    def __init__(self, coalesce_frames=True, metrics=None, starvation_limit=4):
+        """
+        :param bool coalesce_frames: latest-frame-wins mode
+        :param PipelineMetrics metrics: records how long commands wait, if given
+        :param int starvation_limit: batches a lane with waiting commands can be passed over
+        """
+        self.coalesce_frames = coalesce_frames
+        self.metrics = metrics
+        self.starvation_limit = starvation_limit
+        # Entries are (items, is_frame, queued_at) tuples, queued_at is None without metrics
+        self._lanes = [deque() for _ in LANES]
+        self._skips = [0 for _ in LANES]
+        self._length = 0
+        self.frames_dropped = 0
+        self.max_depth = 0
+        self.promotions = 0
+
+    def __len__(self):
+        return self._length
+
+    def append(self, items, is_frame=False, lane=NORMAL):
+        """
+        :param list items: callable followed by its arguments
+        :param bool is_frame: whether items draw a full frame
+        :param int lane: URGENT, NORMAL or BACKGROUND
+        """
+        queued_at = self.metrics.clock() if self.metrics is not None else None
+        entries = self._lanes[lane]
+        if is_frame and self.coalesce_frames:
+            for lower in self._lanes[lane + 1:]:
+                if lower and lower[-1][1]:
+                    lower.pop()
+                    self._length -= 1
+                    self.frames_dropped += 1
+            if entries and entries[-1][1]:
+                entries[-1] = (items, True, queued_at)
+                self.frames_dropped += 1
+                return
+        entries.append((items, is_frame, queued_at))
+        self._length += 1
+        self.max_depth = max(self.max_depth, self._length)
 
-class RpiLcdProcessor(threading.Thread):
-    def __init__(self):
-        super().__init__()
+    def popleft(self):
+        """
+        :return list: items of the oldest command of the highest lane
+        """
+        for entries in self._lanes:
+            if entries:
+                return self._pop(entries)
+        raise IndexError("pop from an empty CommandQueue")
+
+    def take(self, limit=None):
+        """
+        Take the commands of the next batch, lane by lane
+        :param int limit: maximum number of commands, everything if None
+        :return list: items of the commands in execution order
+        """
+        batch = []
+        served = set()
+        # The oldest command of a starved lane goes ahead of everything else
+        for lane in LANES:
+            if self._skips[lane] >= self.starvation_limit and self._lanes[lane]:
+                batch.append(self._pop(self._lanes[lane]))
+                served.add(lane)
+                self.promotions += 1
 
-        self.lcd = CharLCD(
-            i2c_expander="PCF8574", address=0x27, port=1,
-            cols=16, rows=2, dotsize=8, auto_linebreaks=True,
-        )
+        for lane in LANES:
+            entries = self._lanes[lane]
+            while entries and (limit is None or len(batch) < limit):
+                batch.append(self._pop(entries))
+                served.add(lane)
+
+        for lane in LANES:
+            self._skips[lane] = self._skips[lane] + 1 if self._lanes[lane] and lane not in served else 0
+        return batch
+
+    def _pop(self, entries):
+        items, _, queued_at = entries.popleft()
+        self._length -= 1
+        if queued_at is not None:
+            self.metrics.queue_wait.add(self.metrics.clock() - queued_at)
+        return items
+
+    def stats(self):
+        """
+        :return dict: queue counters for monitoring
+        """
+        return {
+            "depth": self._length,
+            "max_depth": self.max_depth,
+            "frames_dropped": self.frames_dropped,
+            "lane_depths": [len(entries) for entries in self._lanes],
+            "promotions": self.promotions,
+        }
+
+
+class BaseLcdProcessor:
+    """
+    Command queue of a display and the state shared by all menus drawing on
+    it. Commands are executed in batches with a single flush each, what
+    drives the batches (a thread, an asyncio task, a bus worker) is left to
+    the subclasses.
+    """
+
+    def __init__(self, coalesce_frames=True, lcd=None, metrics=None, max_batch=32, starvation_limit=4, governor=None):
+        """
+        :param bool coalesce_frames: latest-frame-wins mode, a full frame replaces
+            a frame which is still waiting at the end of the queue
+        :param LcdBackend lcd: display to write to, the default PCF8574 display if None
+        :param PipelineMetrics metrics: instrumentation of the pipeline, off if None
+        :param int max_batch: commands executed per batch, an urgent command waits
+            for at most one batch, unlimited if None
+        :param int starvation_limit: batches lower lanes and due timers can be passed over
+        :param FrameGovernor governor: paces the scroll animation to the bus throughput, fixed pace if None
+        """
+        self.lcd = lcd if lcd is not None else create_lcd()
         self.lcd.clear()
-        self._queue = queue.Queue(maxsize=0)
+        # What the display currently shows, only touched while executing commands
+        self.shadow = ShadowFramebuffer(self.lcd.cols, self.lcd.rows)
+        self.shadow.clear()
+        # CG-RAM slots, uploads go through the queue
+        self.glyphs = GlyphManager(self)
+        self.metrics = metrics
+        self._queue = CommandQueue(coalesce_frames, metrics, starvation_limit)
+        self.max_batch = max_batch
+        self.governor = governor
+        # Batches taken from the queue while timers were due
+        self._timer_skips = 0
+        # Frame the display shows once the queue is drained, None while unknown.
+        # Kept by the menus queueing frames, identical frames are not queued again.
+        self.frame = None
+        # Factor applied to the delays of all animations on this display, a trace replay speeds them up
+        self.time_scale = 1.0
+        # Running ScrollAnimation, shared by all menus drawing on this display
+        self.animation = None
+        # BusyIndicator of background FunctionItems, created on first use
+        self.busy_indicator = None
+        # ItemRefresher polling the visible DynamicItems, created on first use
+        self.refresher = None
+        # Held by menus while they render, the refresher renders from the processor thread
+        self.render_lock = threading.RLock()
+        # TraceRecorder logging the frames, see TraceRecorder.attach
+        self.recorder = None
+        self.commands_processed = 0
+        self.batches_processed = 0
 
-    def run(self) -> None:
+    def _take_queued(self, timers_due):
         """
-        Process all LCD write commands through a queue to prevent
-        display corruption.
+        Take up to max_batch queued commands unless due timers have been
+        passed over starvation_limit times
+        :param bool timers_due: whether timers are waiting to run
+        :return list: the batch, None if it is the turn of the timers
         """
-        while True:
-            items = self._queue.get()
+        if self._queue and not (timers_due and self._timer_skips >= self._queue.starvation_limit):
+            if timers_due:
+                self._timer_skips += 1
+            return self._queue.take(self.max_batch)
+        self._timer_skips = 0
+        return None
+
+    def _execute(self, batch):
+        """
+        :return bool: False once the stop marker has been reached
+        """
+        metrics = self.metrics
+        for items in batch:
             if items is None:
-                break
+                self.lcd.flush()
+                return False
             func = items[0]
             args = items[1:]
-            func(*args)
+            if metrics is None:
+                func(*args)
+            else:
+                start = metrics.clock()
+                func(*args)
+                metrics.command(func, metrics.clock() - start)
+            self.commands_processed += 1
+        # Everything drained in one wake-up goes out in one transfer
+        if metrics is None:
+            self.lcd.flush()
+        else:
+            start = metrics.clock()
+            self.lcd.flush()
+            metrics.command(self.lcd.flush, metrics.clock() - start)
+        self.batches_processed += 1
+        return True
+
+    def put(self, items, lane=NORMAL):
+        """
+        Queue an ordering-sensitive command (clear, create_char, raw writes...)
+        :param list items: callable followed by its arguments
+        :param int lane: URGENT, NORMAL or BACKGROUND, commands keep their order within a lane
+        """
+        self._append(items, False, lane)
+
+    def put_frame(self, items, lane=NORMAL):
+        """
+        Queue a full-frame write. In coalescing mode it supersedes a frame which
+        has not been drawn yet, as long as no other command was queued after it.
+        :param list items: callable followed by its arguments
+        :param int lane: URGENT, NORMAL or BACKGROUND
+        """
+        self._append(items, True, lane)
+
+    def _append(self, items, is_frame, lane):
+        self._queue.append(items, is_frame, lane)
+
+    def qsize(self):
+        """
+        :return int: number of commands waiting to be processed
+        """
+        return len(self._queue)
+
+    def stats(self):
+        """
+        :return dict: queue counters for monitoring
+        """
+        stats = self._queue.stats()
+        stats["commands_processed"] = self.commands_processed
+        stats["batches_processed"] = self.batches_processed
+        return stats
+
+    def metrics_snapshot(self):
+        """
+        :return dict: queue counters together with the pipeline metrics, None without metrics
+        """
+        if self.metrics is None:
+            return None
+        snapshot = self.metrics.snapshot()
+        snapshot.update(self.stats())
+        return snapshot
+
+    def _report_metrics(self):
+        self.metrics.callback(self.metrics_snapshot())
+        self.schedule(self.metrics.interval, [self._report_metrics])
+
+
+class RpiLcdProcessor(BaseLcdProcessor, threading.Thread):
+    """
+    Processor with a thread of its own, it sleeps until commands are queued
+    or the next timer is due
+    """
+
+    def __init__(self, coalesce_frames=True, lcd=None, metrics=None, max_batch=32, starvation_limit=4, governor=None):
+        """
+        See BaseLcdProcessor
+        """
+        threading.Thread.__init__(self)
+        self._condition = threading.Condition()
+        self._timers = []
+        self._timer_sequence = itertools.count()
+        BaseLcdProcessor.__init__(self, coalesce_frames, lcd, metrics, max_batch, starvation_limit, governor)
+        if metrics is not None and metrics.callback is not None:
+            self.schedule(metrics.interval, [self._report_metrics])
+
+    def run(self) -> None:
+        """
+        Process all LCD write commands through a queue to prevent
+        display corruption. Queued commands go first, due timers run when
+        the queue is empty and the thread waits for whichever comes next.
+        Each wake-up drains everything pending and flushes the LCD once.
+        """
+        while True:
+            with self._condition:
+                batch = self._next_batch()
+            if not self._execute(batch):
+                return
+
+    def run_pending(self):
+        """
+        Execute queued commands and due timers on the calling thread. Only
+        for a processor which has not been started (tests, benchmarks).
+        """
+        while True:
+            with self._condition:
+                batch, _ = self._take_batch()
+            if not batch or not self._execute(batch):
+                return self
+
+    def _next_batch(self):
+        """
+        Block until queued commands or due timers are available and take
+        all of them, the condition has to be held by the caller
+        """
+        while True:
+            batch, timeout = self._take_batch()
+            if batch:
+                return batch
+            self._condition.wait(timeout)
+
+    def _take_batch(self):
+        """
+        Take up to max_batch queued commands, or all due timers if the queue
+        is empty or the timers have been passed over starvation_limit times
+        :return tuple: (batch, seconds until the next timer or None)
+        """
+        while self._timers and self._timers[0].cancelled:
+            heapq.heappop(self._timers)
+
+        now = time.monotonic()
+        batch = self._take_queued(bool(self._timers) and self._timers[0].deadline <= now)
+        if batch is not None:
+            return batch, None
+        if not self._timers:
+            return [], None
+
+        batch = []
+        while self._timers and self._timers[0].deadline <= now:
+            timer = heapq.heappop(self._timers)
+            if not timer.cancelled:
+                batch.append(timer.items)
+        if batch or not self._timers:
+            return batch, None
+        return batch, self._timers[0].deadline - now
+
+    def schedule(self, delay, items):
+        """
+        Run a command on the processor thread after delay seconds
+        :param float delay: seconds to wait
+        :param list items: callable followed by its arguments
+        :return Timer: handle to cancel the command
+        """
+        with self._condition:
+            timer = Timer(time.monotonic() + delay, next(self._timer_sequence), items)
+            heapq.heappush(self._timers, timer)
+            self._condition.notify()
+        return timer
+
+    def cancel(self, timer):
+        """
+        Cancel a scheduled command, it is dropped once it becomes due
+        :param Timer timer: handle returned by schedule
+        """
+        with self._condition:
+            timer.cancelled = True
+            self._condition.notify()
 
     def stop(self):
-        # self._p.terminate()
-        self._queue.put(None)
+        self.put(None)
         self.join()
 
-    def put(self, *args):
-        self._queue.put(*args)
+    def _append(self, items, is_frame, lane):
+        with self._condition:
+            super(RpiLcdProcessor, self)._append(items, is_frame, lane)
+            self._condition.notify()
+
+    # put is thread safe already
+    put_threadsafe = BaseLcdProcessor.put
 
 
 if __name__ == "__main__":
@@ -1,13 +1,15 @@
-from time import sleep
 from rpilcdmenu.base_menu import BaseMenu
-from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor
+from rpilcdmenu.busy_indicator import BusyIndicator
+from rpilcdmenu.helpers.text_layout import wrap_text
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor, URGENT
+from rpilcdmenu.scroll_animation import ScrollAnimation
 import logging
 
 
 class RpiLCDMenu(BaseMenu):
     """ Class to create and set up the main menu object. """
 
-    def __init__(self, scrolling_menu=True):
+    def __init__(self, scrolling_menu=True, rpi_lcd_processor=None):
         """
         Initialize the menu. Communication with the LCD hardware is
         handled by the RPLCD module. By default, if the text of the current
@@ -15,13 +17,18 @@ class RpiLCDMenu(BaseMenu):
         left, pause momentarily, and then repeat. Set 'scrolling_menu' to
         False to disable this animation and simply truncate the extra
         characters.
+        A started processor (e.g. an AsyncLcdProcessor) can be passed in
+        'rpi_lcd_processor', otherwise a RpiLcdProcessor thread is started.
         """
         super().__init__()
         self.logger = logging
 
-        self.lcd_framerate = 0.05  # Interval to listen for input during menu scrolling
+        self.lcd_framerate = 0.05  # Duration of one scroll animation frame
         self.cursor_char = ">"  # Character for menu selector
 
+        if rpi_lcd_processor is not None:
+            self.rpi_lcd_processor = rpi_lcd_processor
+
         try:
             self.rpi_lcd_processor
         except AttributeError:
@@ -29,9 +36,37 @@ class RpiLCDMenu(BaseMenu):
             self.rpi_lcd_processor.start()
 
         self.lcd = self.rpi_lcd_processor.lcd
+        self.shadow = self.rpi_lcd_processor.shadow
+        self.metrics = self.rpi_lcd_processor.metrics
+        self.glyphs = self.rpi_lcd_processor.glyphs
+
+        # Display geometry, taken from the LCD backend unless set by a submenu
+        try:
+            self.cols
+        except AttributeError:
+            self.cols = self.lcd.cols
+            self.rows = self.lcd.rows
 
         self.scrolling_menu = scrolling_menu
-        self.max_width = 15
+        # First item shown in the top row
+        self.window_start = 0
+
+    # Set through max_width, None derives it from the display width
+    _max_width = None
+
+    @property
+    def max_width(self):
+        """
+        Characters available for item text next to the cursor, the display
+        width minus the cursor unless set to another value
+        """
+        if self._max_width is not None:
+            return self._max_width
+        return self.cols - 1
+
+    @max_width.setter
+    def max_width(self, value):
+        self._max_width = value
 
     def custom_character(self, loc, char):
         """
@@ -40,36 +75,119 @@ class RpiLCDMenu(BaseMenu):
         char: A tuple containing the bitmap representing the character
         For more info, see:
         https://rplcd.readthedocs.io/en/stable/usage.html#creating-custom-characters
+        The location is reserved for this character, use glyph() to share
+        the remaining slots. The upload is queued like every other write.
         """
-        self.lcd.create_char(loc, char)
+        self.glyphs.define(ord(loc) if isinstance(loc, str) else loc, char)
         return self
 
+    def glyph(self, bitmap):
+        """
+        Custom character for use in menu texts and messages. CG-RAM slots are
+        shared and assigned when a frame is drawn, so the character keeps
+        showing its glyph however many others are used afterwards.
+        bitmap: A tuple containing the bitmap representing the character
+        Returns the character to be written, e.g. "Volume " + menu.glyph(SPEAKER)
+        """
+        return self.glyphs.char(bitmap)
+
     def write_to_lcd(self, frame_buffer, clear=False):
-        self.rpi_lcd_processor.put([self._write_to_lcd, frame_buffer, clear])
+        """
+        Queue a frame for the LCD. A frame identical to the one the display
+        will show anyway is dropped before it reaches the queue.
+        frame_buffer: A list whose elements are the strings to be written to the LCD
+        clear: If true, the display is cleared first
+        """
+        processor = self.rpi_lcd_processor
+        if not clear and frame_buffer == processor.frame:
+            if self.metrics is not None:
+                self.metrics.frames_skipped += 1
+            return self
+        # Rows missing from a frame keep unknown content
+        processor.frame = list(frame_buffer) if len(frame_buffer) >= self.rows else None
+
+        if clear:
+            processor.put([self._write_to_lcd, frame_buffer, clear])
+        else:
+            processor.put_frame([self._write_to_lcd, frame_buffer])
+        return self
 
     def _write_to_lcd(self, framebuffer, clear=False):
         """
-        Method to write out the formatted framebuffer to the LCD.
+        Method to write out the formatted framebuffer to the LCD. Only the
+        character runs differing from the shadow framebuffer are transferred.
         framebuffer: A list whose elements are the strings to be written to the LCD
         """
         if clear:
             self.lcd.clear()
-        for row in framebuffer:
-            self.lcd.write_string(row.ljust(16)[:16])
-            self.lcd.write_string("\r\n")
+            self.shadow.clear()
+        recorder = self.rpi_lcd_processor.recorder
+        if recorder is not None:
+            recorder.frame(framebuffer)
+        runs = self.shadow.diff(self.glyphs.resolve(framebuffer))
+        for row, col, text in runs:
+            self.lcd.cursor_pos = (row, col)
+            self.lcd.write_string(text)
+
+        if self.metrics is not None:
+            # One instruction byte per cursor move and clear, one data byte per character
+            self.metrics.bytes_written += sum(len(text) + 1 for _, _, text in runs) + (1 if clear else 0)
+            self.metrics.frames_written += 1
+        return self
+
+    def _write_message(self, text):
+        """
+        Write raw text to the LCD. The display content is unknown afterwards,
+        so the shadow framebuffer gets invalidated.
+        """
+        self.shadow.invalidate()
+        recorder = self.rpi_lcd_processor.recorder
+        if recorder is not None:
+            recorder.message(text, self.cols, self.rows)
+        self.lcd.write_string(self.glyphs.resolve([text])[0])
+        self.lcd.home()
+        return self
+
+    def _clear(self):
+        self.lcd.clear()
+        self.shadow.clear()
+        return self
+
+    def clearDisplay(self):
+        """
+        Clear the screen
+        """
+        self._watch_items(())
+        self.rpi_lcd_processor.frame = None
+        self.rpi_lcd_processor.put([self._clear])
         return self
 
-    def message(self, text, clear=True):
+    def message(self, text, clear=True, urgent=False):
         """
         Method to display a static message on the LCD.
         text: String containing the message text to be displayed
         clear: If false, will not clear the display first
+        urgent: If true, the message (e.g. a fault alert) goes ahead of every
+        queued command. The scroll animation stops and frames still waiting
+        to be drawn are dropped, the message stays until the next render.
+        Writes already queued behind it (clears, raw text) are drawn over
+        by a copy of the message at the end of the normal lane.
         """
-        if isinstance(text, list):
-            self.rpi_lcd_processor.put([self._write_to_lcd, text, clear])
+        self._watch_items(())
+        if urgent:
+            self._stop_animation()
+            paragraphs = text if isinstance(text, list) else text.split("\n")
+            lines = [line for paragraph in paragraphs for line in wrap_text(paragraph, self.cols)][:self.rows]
+            lines = lines + [""] * (self.rows - len(lines))
+            self.rpi_lcd_processor.frame = lines
+            self.rpi_lcd_processor.put_frame([self._write_to_lcd, lines], URGENT)
+            if self.rpi_lcd_processor.qsize() > 1:
+                self.rpi_lcd_processor.put_frame([self._write_to_lcd, lines])
+        elif isinstance(text, list):
+            self.write_to_lcd(text, clear)
         else:
-            self.rpi_lcd_processor.put([self.lcd.write_string, text])
-            self.rpi_lcd_processor.put([self.lcd.home])
+            self.rpi_lcd_processor.frame = None
+            self.rpi_lcd_processor.put([self._write_message, text])
         return self
 
     def render(self):
@@ -78,30 +196,40 @@ class RpiLCDMenu(BaseMenu):
         then fed either to _menu_static if the menu's 'scrolling_menu'
         attribute is False, or to _menu_scroller if True.
         """
+        with self.rpi_lcd_processor.render_lock:
+            if self.metrics is None:
+                return self._render()
+
+            start = self.metrics.clock()
+            self._render()
+            self.metrics.render.add(self.metrics.clock() - start)
+            self.metrics.frames_rendered += 1
+        return self
+
+    def _render(self):
+        self._stop_animation()
+
         if len(self.items) == 0:
             self.message("Menu is empty")
             return self
 
-        if len(self.items) <= 2:
-            text = [self.items[0].text]
-            cursor_pos = self.current_option
-            if len(self.items) == 2:
-                text.append(self.items[1].text)
+        # Slide the window of visible items only when the cursor leaves it
+        if self.current_option < self.window_start:
+            self.window_start = self.current_option
+        elif self.current_option >= self.window_start + self.rows:
+            self.window_start = self.current_option - self.rows + 1
+        self.window_start = max(min(self.window_start, len(self.items) - self.rows), 0)
 
-        else:
-            text = [self.items[self.current_option].text]
-            cursor_pos = 0
-            if self.current_option + 1 < len(self.items):
-                text.append(self.items[self.current_option + 1].text)
-            else:
-                text.append(self.items[0].text)
+        visible = self.items[self.window_start: self.window_start + self.rows]
+        self._watch_items(visible)
+        text = [item.text for item in visible]
+        cursor_pos = self.current_option - self.window_start
 
         if len(text[cursor_pos]) <= self.max_width:
             return self._menu_static(text, cursor_pos)
 
         if self.scrolling_menu:
-            self.rpi_lcd_processor.put([self._menu_scroller, text, cursor_pos, self.input_count])
-            return self
+            return self._menu_scroller(text, cursor_pos, self.input_count)
 
         return self._menu_static(text, cursor_pos)
 
@@ -111,54 +239,90 @@ class RpiLCDMenu(BaseMenu):
         framebuffer for a fixed, non-scrolling menu with indicator cursor,
         and send it to write_to_lcd.
         """
-        inactive_row = int(cursor_pos == 0 and "1" or "0")
         self.logger.debug("STATIC DISPLAY")
         self.logger.debug("cursor_pos: " + str(cursor_pos))
-        self.logger.debug("inactive_row: " + str(inactive_row))
-        framebuffer = ["", ""]
-        framebuffer[cursor_pos] = self.cursor_char + text[cursor_pos][: self.max_width]
-        framebuffer[inactive_row] = " " + text[inactive_row][: self.max_width]
+        framebuffer = self._menu_framebuffer(text, cursor_pos)
         self.logger.debug(framebuffer)
-        self.rpi_lcd_processor.put([self._write_to_lcd, framebuffer])
+        self.write_to_lcd(framebuffer)
         return self
 
+    def _menu_framebuffer(self, text, cursor_pos):
+        """
+        Format the visible menu rows, with the indicator cursor in front of
+        the selected one. Rows without an item are blanked.
+        """
+        framebuffer = [" " + row[: self.max_width] for row in text]
+        framebuffer[cursor_pos] = self.cursor_char + text[cursor_pos][: self.max_width]
+        framebuffer += [""] * (self.rows - len(framebuffer))
+        return framebuffer
+
     def _menu_scroller(self, text, cursor_pos, start_input_count):
         """
-        Receive pre-formatted menu elements from render, generate frames
-        to animate a scrolling menu with indicator cursor, and send each
-        frame of the animated menu to write_to_lcd.
+        Receive pre-formatted menu elements from render and start the
+        animation of the scrolling menu row. Frames are drawn by timers on
+        the processor thread until there's another input event.
         """
-        inactive_row = int(cursor_pos == 0 and "1" or "0")
         self.logger.debug("SCROLLING DISPLAY")
         self.logger.debug("cursor_pos: " + str(cursor_pos))
-        self.logger.debug("inactive_row: " + str(inactive_row))
-        # top line too long.. so animate until there's another input event
-        ani_pos = 0
-        while start_input_count == self.input_count and self.scrolling_menu:
-            # Render partial menu text
-            ani_text = text[cursor_pos][ani_pos: ani_pos + self.max_width]
-            # Prepend cursor character in front of top menu item, pad bottom item
-            framebuffer = ["", ""]
-            framebuffer[cursor_pos] = self.cursor_char + ani_text[: self.max_width]
-            framebuffer[inactive_row] = " " + text[inactive_row][: self.max_width]
-            # Send the framebuffer to the LCD
-            self._write_to_lcd(framebuffer)
-            # Determine next animation state
-            if ani_pos in (0, len(text[cursor_pos]) - self.max_width):
-                delay_frames = 25
-            else:
-                delay_frames = 5
-            ani_pos += 1
-            # Restart the animation once the whole row has been scrolled
-            if ani_pos >= (len(text[cursor_pos]) - self.max_width + 1):
-                ani_pos = 0
-
-            # Watch for input during "pause" so interface remains responsive
-            for _ in range(delay_frames):
-                sleep(self.lcd_framerate)
-                if start_input_count != self.input_count:
-                    break
+        animation = ScrollAnimation(self, text, cursor_pos, start_input_count)
+        # The animation draws its frames on the processor thread
+        self.rpi_lcd_processor.frame = None
+        self.rpi_lcd_processor.animation = animation
+        animation.start()
+        if self.metrics is not None:
+            self.metrics.scroll_animations += 1
         return self
 
+    def _stop_animation(self):
+        """
+        Cancel the scroll animation running on the display, if any
+        """
+        animation = self.rpi_lcd_processor.animation
+        if animation is not None:
+            animation.cancel()
+            self.rpi_lcd_processor.animation = None
+        return self
+
+    def _watch_items(self, items):
+        """
+        Tell the refresher of the display which items are visible, only
+        DynamicItems get polled. Every other view unwatches with no items.
+        """
+        refresher = self.rpi_lcd_processor.refresher
+        if refresher is None:
+            # Imported here, the items package depends on this module
+            from rpilcdmenu.item_refresher import ItemRefresher
+            from rpilcdmenu.items.dynamic_item import DynamicItem
+
+            if not any(isinstance(item, DynamicItem) for item in items):
+                return self
+            refresher = self.rpi_lcd_processor.refresher = ItemRefresher(self)
+        refresher.watch(self, items)
+        return self
+
+    def show_busy(self, busy=True):
+        """
+        Show the busy indicator while background actions are running
+        """
+        indicator = self.rpi_lcd_processor.busy_indicator
+        if indicator is None:
+            indicator = self.rpi_lcd_processor.busy_indicator = BusyIndicator(self)
+        if busy:
+            indicator.acquire()
+        else:
+            indicator.release()
+        return self
+
+    def _call_soon_threadsafe(self, items):
+        self.rpi_lcd_processor.put_threadsafe(items)
+
+    def _call_later(self, delay, items):
+        return self.rpi_lcd_processor.schedule(delay, items)
+
+    def _cancel_call(self, handle):
+        self.rpi_lcd_processor.cancel(handle)
+
     def stop(self):
         self.rpi_lcd_processor.stop()
+        if self.rpi_lcd_processor.refresher is not None:
+            self.rpi_lcd_processor.refresher.close()
@@ -7,7 +7,8 @@ class RpiLCDSubMenu(RpiLCDMenu):
         """
         self.scrolling_menu = scrolling_menu
         self.rpi_lcd_processor = base_menu.rpi_lcd_processor
-        self.max_width = base_menu.max_width
+        self.cols = base_menu.cols
+        self.rows = base_menu.rows
         self.lcd_framerate = base_menu.lcd_framerate
         self.cursor_char = base_menu.cursor_char
 
@@ -0,0 +1,95 @@
+from rpilcdmenu.helpers.scroll_frames import ScrollFrameCache
+
+
+class ScrollAnimation:
+    """
+    Right-to-left scrolling of the selected menu row. Every frame is a
+    timer on the LCD processor, so the writer thread never sleeps and a
+    new input cancels the animation before its next frame.
+    """
+
+    # Shared by all animations, the same item scrolls every time it gets selected
+    frame_cache = ScrollFrameCache()
+
+    def __init__(self, menu, text, cursor_pos, start_input_count):
+        """
+        :param RpiLCDMenu menu: menu which owns the animated rows
+        :param list text: texts of the visible rows
+        :param int cursor_pos: row holding the cursor, this one is scrolled
+        :param int start_input_count: menu input count when the animation was requested
+        """
+        self.menu = menu
+        self.processor = menu.rpi_lcd_processor
+        self.text = text
+        self.cursor_pos = cursor_pos
+        self.start_input_count = start_input_count
+        self.ani_pos = 0
+        self.frames = None
+        # Reused for every frame, only the scrolled row gets replaced
+        self.framebuffer = None
+        self.cancelled = False
+        self.timer = None
+        self._step_items = [self.step]
+
+    def start(self):
+        """
+        Queue the first frame like any other write, so waiting for the queue
+        to drain includes it. Later frames are timers.
+        """
+        self.processor.put(self._step_items)
+        return self
+
+    def cancel(self):
+        """
+        Stop the animation, a frame which is already drawing finishes first
+        """
+        self.cancelled = True
+        if self.timer is not None:
+            self.processor.cancel(self.timer)
+        return self
+
+    def is_active(self):
+        """
+        :return bool: whether the animation should draw another frame
+        """
+        return (
+            not self.cancelled
+            and self.start_input_count == self.menu.input_count
+            and self.menu.scrolling_menu
+        )
+
+    def step(self):
+        """
+        Draw one frame and schedule the next one. Runs on the processor thread.
+        """
+        if not self.is_active():
+            return self
+
+        menu = self.menu
+        if self.frames is None:
+            self.frames = self.frame_cache.get(self.text[self.cursor_pos], menu.max_width, menu.cursor_char)
+            self.framebuffer = menu._menu_framebuffer(self.text, self.cursor_pos)
+
+        row, delay_frames = self.frames[self.ani_pos]
+        self.framebuffer[self.cursor_pos] = row
+        governor = self.processor.governor
+        if governor is None:
+            menu._write_to_lcd(self.framebuffer)
+        else:
+            start = governor.clock()
+            menu._write_to_lcd(self.framebuffer)
+            # Buffered backends transfer on flush, send the frame now to measure it
+            self.processor.lcd.flush()
+            governor.record(governor.clock() - start)
+
+        # Restart the animation once the whole row has been scrolled
+        self.ani_pos += 1
+        if self.ani_pos >= len(self.frames):
+            self.ani_pos = 0
+
+        if self.is_active():
+            delay = delay_frames * menu.lcd_framerate * self.processor.time_scale
+            if governor is not None:
+                delay = governor.delay(delay, self.processor)
+            self.timer = self.processor.schedule(delay, self._step_items)
+        return self
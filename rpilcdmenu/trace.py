@@ -0,0 +1,181 @@
+import json
+import threading
+import time
+from io import StringIO
+
+from rpilcdmenu.backends import VirtualLcd
+from rpilcdmenu.input.controller import InputController
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor
+
+TRACE_VERSION = 1
+
+
+class TraceRecorder:
+    """
+    Writes timestamped input events and frames as JSON lines:
+
+        {"version": 1, "cols": 16, "rows": 2}
+        {"t": 0.512, "input": null, "steps": 3}
+        {"t": 0.513, "frame": [" item3", ">item4"]}
+
+    Inputs are recorded by an InputController, frames by the menus drawing
+    through the processor the recorder is attached to.
+    """
+
+    def __init__(self, stream, clock=time.monotonic):
+        """
+        :param stream: text stream the trace is written to
+        :param callable clock: time source, timestamps are relative to the creation
+        """
+        self.stream = stream
+        self.clock = clock
+        self.start = clock()
+        self._lock = threading.Lock()
+        self._header_written = False
+
+    def attach(self, processor):
+        """
+        Record the frames written through processor
+        :param RpiLcdProcessor processor: processor of the recorded display
+        """
+        self._header(processor.lcd.cols, processor.lcd.rows)
+        processor.recorder = self
+        return self
+
+    def input(self, key, steps=0):
+        """
+        :param str key: ENTER or ALT_ENTER, None for a cursor move
+        :param int steps: positions moved
+        """
+        self._write({"t": self._elapsed(), "input": key, "steps": steps})
+
+    def frame(self, framebuffer):
+        """
+        :param list framebuffer: rows passed to _write_to_lcd
+        """
+        self._write({"t": self._elapsed(), "frame": list(framebuffer)})
+
+    def message(self, text, cols, rows):
+        """
+        Raw text writes have no framebuffer, they are recorded as the frame
+        the text shows when written from the top left corner
+        :param str text: text passed to _write_message
+        :param int cols: display width in characters
+        :param int rows: display height in characters
+        """
+        lcd = VirtualLcd(cols=cols, rows=rows, record=False)
+        lcd.write_string(text)
+        self.frame([row.rstrip() for row in lcd.display()])
+
+    def _header(self, cols, rows):
+        if not self._header_written:
+            self._header_written = True
+            self._write({"version": TRACE_VERSION, "cols": cols, "rows": rows})
+
+    def _elapsed(self):
+        return round(self.clock() - self.start, 6)
+
+    def _write(self, record):
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            self.stream.write(line)
+
+
+def load_trace(stream):
+    """
+    :param stream: text stream holding a trace
+    :return list: the records, header first
+    """
+    return [json.loads(line) for line in stream if line.strip()]
+
+
+def replay(records, menu_factory, speed=1.0):
+    """
+    Drive a fresh menu tree with the inputs of a trace on a VirtualLcd and
+    record the frames it produces. The scroll animation runs at the same
+    relative speed as the inputs.
+    :param list records: trace as returned by load_trace
+    :param callable menu_factory: creates the root menu for a given processor
+    :param float speed: 2.0 replays twice as fast, None as fast as possible without timers
+    :return list: records of the new run
+    """
+    header = records[0] if records and "version" in records[0] else {}
+    lcd = VirtualLcd(cols=header.get("cols", 16), rows=header.get("rows", 2))
+    processor = RpiLcdProcessor(lcd=lcd)
+    output = StringIO()
+    recorder = TraceRecorder(output).attach(processor)
+
+    menu = menu_factory(processor)
+    if speed:
+        # Every menu and view on the display animates through the processor
+        processor.time_scale = 1.0 / speed
+        processor.start()
+    controller = InputController(menu.start(), recorder=recorder)
+
+    inputs = [record for record in records if "input" in record]
+    for record in inputs:
+        if speed:
+            delay = record["t"] / speed - (time.monotonic() - recorder.start)
+            if delay > 0:
+                time.sleep(delay)
+        else:
+            processor.run_pending()
+        controller.apply(record["input"], record["steps"])
+
+    if speed:
+        processor.stop()
+    else:
+        processor.run_pending()
+    if processor.animation is not None:
+        processor.animation.cancel()
+
+    output.seek(0)
+    return load_trace(output)
+
+
+def summarize(records):
+    """
+    :param list records: a trace
+    :return dict: number of inputs and frames and the latency from an input to its first frame
+    """
+    latencies = []
+    inputs = frames = 0
+    waiting = None
+    for record in records:
+        if "input" in record:
+            inputs += 1
+            if waiting is None:
+                waiting = record["t"]
+        elif "frame" in record:
+            frames += 1
+            if waiting is not None:
+                latencies.append(record["t"] - waiting)
+                waiting = None
+
+    latencies.sort()
+    return {
+        "inputs": inputs,
+        "frames": frames,
+        "mean_latency_ms": sum(latencies) / len(latencies) * 1e3 if latencies else 0.0,
+        "p95_latency_ms": latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] * 1e3 if latencies else 0.0,
+    }
+
+
+def compare(baseline, candidate):
+    """
+    :param list baseline: trace of the reference run
+    :param list candidate: trace of the run to check
+    :return dict: summaries of both runs, their differences (candidate - baseline)
+        and how many frames show something else
+    """
+    before = summarize(baseline)
+    after = summarize(candidate)
+    frames_before = [record["frame"] for record in baseline if "frame" in record]
+    frames_after = [record["frame"] for record in candidate if "frame" in record]
+    return {
+        "baseline": before,
+        "candidate": after,
+        "difference": {key: after[key] - before[key] for key in before},
+        "mismatched_frames": sum(a != b for a, b in zip(frames_before, frames_after))
+        + abs(len(frames_before) - len(frames_after)),
+    }
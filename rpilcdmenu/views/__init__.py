@@ -1,3 +1,4 @@
 from .message_view import MessageView
+from .log_view import LogView
 
-__all__ = ['MessageView']
+__all__ = ['MessageView', 'LogView']
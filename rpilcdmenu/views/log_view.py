@@ -0,0 +1,124 @@
+from collections import deque
+from itertools import islice
+
+from rpilcdmenu.rpi_lcd_submenu import RpiLCDSubMenu
+from rpilcdmenu.helpers.text_layout import wrap_text
+
+
+class LogView(RpiLCDSubMenu):
+    """
+    Live tail of appended lines (log output, sensor readings...). Lines are
+    kept in a ring buffer, so memory stays bounded however long it runs.
+    """
+
+    def __init__(self, base_menu, max_lines=100):
+        """
+        Initialize LogView
+        :ivar RpiLCDMenu base_menu: The menu which this item belongs to
+        :ivar int max_lines: display lines kept in the ring buffer
+        """
+
+        self.lcd = base_menu.lcd
+        self.cols = base_menu.cols
+        self.rows = base_menu.rows
+        self.lines = deque(maxlen=max_lines)
+        # Lines pushed out of the ring buffer so far, line_index counts them too
+        self.lines_dropped = 0
+        self.line_index = 0
+        self.follow = True
+        self.active = False
+        self._shown = None
+
+        super(LogView, self).__init__(base_menu)
+        # Producers write from their own threads, sharing the render lock of
+        # the display keeps menu renders and the refresher out meanwhile
+        self._lock = self.rpi_lcd_processor.render_lock
+
+    def append_line(self, text):
+        """
+        Add a line, can be called from any thread. The display is only
+        updated when the visible window changes.
+        :param str text: line to be shown, long lines get wrapped
+        """
+        with self._lock:
+            for paragraph in text.split('\n'):
+                for line in wrap_text(paragraph, self.cols):
+                    if len(self.lines) == self.lines.maxlen:
+                        self.lines_dropped += 1
+                    self.lines.append(line)
+
+            if self.follow:
+                self.line_index = self._last_line_index()
+            else:
+                self.line_index = max(self.line_index, self.lines_dropped)
+
+            if self.active:
+                self._refresh()
+
+        return self
+
+    def _last_line_index(self):
+        return self.lines_dropped + max(len(self.lines) - self.rows, 0)
+
+    def _refresh(self):
+        """
+        Write the visible window unless it is already shown
+        """
+        start = self.line_index - self.lines_dropped
+        window = list(islice(self.lines, start, start + self.rows))
+        window += [""] * (self.rows - len(window))
+        if window != self._shown:
+            self._shown = window
+            self.write_to_lcd(window)
+        return self
+
+    def start(self):
+        with self._lock:
+            self.active = True
+            self.follow = True
+            self.line_index = self._last_line_index()
+        return super(LogView, self).start()
+
+    def render(self):
+        """
+        Render the visible lines
+        """
+        with self._lock:
+            self._stop_animation()
+            self._watch_items(())
+            self._shown = None
+            self._refresh()
+        return self
+
+    def processUp(self):
+        with self._lock:
+            if self.line_index > self.lines_dropped:
+                self.line_index -= 1
+                self.follow = False
+                self._refresh()
+
+        return self
+
+    def processDown(self):
+        with self._lock:
+            if self.line_index < self._last_line_index():
+                self.line_index += 1
+                self.follow = self.line_index == self._last_line_index()
+                self._refresh()
+
+        return self
+
+    def processSteps(self, steps):
+        with self._lock:
+            line_index = max(min(self.line_index + steps, self._last_line_index()), self.lines_dropped)
+            if line_index != self.line_index:
+                self.line_index = line_index
+                self.follow = self.line_index == self._last_line_index()
+                self._refresh()
+
+        return self
+
+    def processEnter(self):
+        with self._lock:
+            self.active = False
+        return self.exit()
@@ -1,5 +1,5 @@
 from rpilcdmenu.rpi_lcd_submenu import RpiLCDSubMenu
-from rpilcdmenu.helpers.text_helper import get_scrolled_text, get_text_lines
+from rpilcdmenu.helpers.text_layout import TextLayout
 
 
 class MessageView(RpiLCDSubMenu):
@@ -14,22 +14,35 @@ class MessageView(RpiLCDSubMenu):
         self.lcd = base_menu.lcd
         self.scrollable = scrollable
         self.line_index = 0
-        self.text_lines = 0
         self.text = ''
+        self.cols = base_menu.cols
+        self.rows = base_menu.rows
+        self.layout = TextLayout(width=self.cols)
 
         self.setText(text)
 
         super(MessageView, self).__init__(base_menu)
 
+    @property
+    def text_lines(self):
+        """
+        How many display lines the message has
+        """
+        return self.layout.line_count
+
     def render(self):
         """
         Render menu
         """
-        self.lcd.clear()
+        self._stop_animation()
+        self._watch_items(())
 
         if self.scrollable:
-            self.message(get_scrolled_text(self.text, self.line_index))
+            framebuffer = self.layout.window(self.line_index, self.rows)
+            framebuffer += [""] * (self.rows - len(framebuffer))
+            self.write_to_lcd(framebuffer)
         else:
+            self.clearDisplay()
             self.message(self.text)
 
         return self
@@ -48,9 +61,20 @@ class MessageView(RpiLCDSubMenu):
 
         return self
 
+    def processSteps(self, steps):
+        line_index = max(min(self.line_index + steps, self.text_lines - 1), 0)
+        if line_index != self.line_index and self.scrollable:
+            self.line_index = line_index
+            self.render()
+
+        return self
+
     def processEnter(self):
         return self.exit()
 
     def setText(self, text):
+        """
+        Change the message, appended text only lays out the new part
+        """
         self.text = text
-        self.text_lines = get_text_lines(text)
+        self.layout.set_text(text)
@@ -0,0 +1,54 @@
+from mock import patch
+
+from rpilcdmenu.backends.rplcd_batched import BatchedCharLCD, BusProfile
+
+
+@patch('RPLCD.i2c.SMBus')
+def test_batchedcharlcd_sends_buffered_bytes_as_block_writes(SMBusMock):
+    lcd = BatchedCharLCD(address=0x27, port=1, cols=16, rows=2)
+    bus = SMBusMock.return_value
+    bus.reset_mock()
+
+    lcd.write_string("ab")
+
+    bus.write_byte.assert_not_called()
+    bus.write_i2c_block_data.assert_not_called()
+
+    lcd.flush()
+
+    # 'a' = 0x61 and 'b' = 0x62 as RS=1 data nibbles with backlight, pulsed on E
+    expected = [
+        0x69, 0x6D, 0x69, 0x19, 0x1D, 0x19,
+        0x69, 0x6D, 0x69, 0x29, 0x2D, 0x29,
+    ]
+    bus.write_i2c_block_data.assert_called_once_with(0x27, expected[0], expected[1:])
+    assert lcd.transfers == 1
+
+
+@patch('RPLCD.i2c.SMBus')
+def test_batchedcharlcd_splits_transfers_into_blocks(SMBusMock):
+    lcd = BatchedCharLCD(profile=BusProfile(block_size=8), address=0x27, port=1, cols=16, rows=2)
+    bus = SMBusMock.return_value
+    bus.reset_mock()
+
+    lcd.write_string("abcd")
+    lcd.flush()
+
+    assert bus.write_i2c_block_data.call_count == 3
+
+
+@patch('RPLCD.i2c.SMBus')
+def test_batchedcharlcd_flushes_clear_immediately(SMBusMock):
+    lcd = BatchedCharLCD(address=0x27, port=1, cols=16, rows=2)
+    bus = SMBusMock.return_value
+    bus.reset_mock()
+
+    lcd.clear()
+
+    bus.write_i2c_block_data.assert_called_once()
+
+
+def test_busprofile_pads_writes_on_fast_buses_only():
+    assert BusProfile(clock_hz=100000).padding_writes == 0
+    assert BusProfile(clock_hz=400000).padding_writes == 0
+    assert BusProfile(clock_hz=1000000).padding_writes == 2
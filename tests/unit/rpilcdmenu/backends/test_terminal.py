@@ -0,0 +1,47 @@
+import io
+
+from rpilcdmenu import RpiLCDMenu
+from rpilcdmenu.backends import TerminalLcd
+from rpilcdmenu.items import MenuItem
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor
+
+
+def test_terminallcd_draws_display_once_per_changing_batch():
+    stream = io.StringIO()
+    lcd = TerminalLcd(cols=8, rows=2, stream=stream)
+    processor = RpiLcdProcessor(lcd=lcd)
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+    menu.append_item(MenuItem("one")).append_item(MenuItem("two"))
+
+    menu.start()
+    processor.run_pending()
+    menu.custom_character(0, (31,) * 8)
+    menu.message([">one " + "\x00", " two"])
+    processor.run_pending()
+    processor.run_pending()
+
+    assert lcd.frames_drawn == 2
+    assert stream.getvalue().endswith("\x1b[H+--------+\n|>one █  |\n| two    |\n+--------+\n")
+
+
+def test_terminallcd_without_drawing_only_keeps_display():
+    stream = io.StringIO()
+    lcd = TerminalLcd(stream=stream, draw=False)
+    lcd.write_string("hello")
+    lcd.flush()
+
+    assert stream.getvalue() == ""
+    assert lcd.display()[0] == "hello           "
+
+
+def test_terminallcd_counts_bytes_without_logging_them():
+    lcd = TerminalLcd(stream=io.StringIO(), draw=False)
+    for _ in range(100):
+        lcd.write_string("hello")
+
+    assert lcd.log == []
+    assert lcd.stats()["data_bytes"] == 500
+
+    lcd = TerminalLcd(stream=io.StringIO(), draw=False, record=True)
+    lcd.write_string("hi")
+    assert [entry[1:] for entry in lcd.log] == [("data", ord("h")), ("data", ord("i"))]
@@ -0,0 +1,46 @@
+from rpilcdmenu.backends.virtual import VirtualLcd, PCF8574_WRITES_PER_BYTE
+
+
+def test_virtuallcd_keeps_written_text_and_wraps_long_lines():
+    lcd = VirtualLcd(cols=4, rows=2)
+
+    lcd.write_string("abcdef")
+
+    assert lcd.display() == ["abcd", "ef  "]
+    assert lcd.cursor_pos == (1, 2)
+
+
+def test_virtuallcd_handles_carriage_return_and_newline():
+    lcd = VirtualLcd(cols=4, rows=2)
+
+    lcd.write_string("ab\r\ncd")
+
+    assert lcd.display() == ["ab  ", "cd  "]
+
+
+def test_virtuallcd_counts_instruction_and_data_bytes():
+    lcd = VirtualLcd()
+
+    lcd.clear()
+    lcd.cursor_pos = (1, 3)
+    lcd.write_string("xy")
+
+    assert lcd.stats() == {
+        "instruction_bytes": 2,
+        "data_bytes": 2,
+        "bytes": 4,
+        "bus_writes": 4 * PCF8574_WRITES_PER_BYTE,
+        "transfers": 0,
+    }
+    assert [entry[1:] for entry in lcd.log] == [
+        ("instruction", 0x01), ("instruction", 0xC3), ("data", ord("x")), ("data", ord("y"))
+    ]
+
+
+def test_virtuallcd_stores_custom_characters():
+    lcd = VirtualLcd()
+
+    lcd.create_char(2, (0, 1, 2, 3, 4, 5, 6, 7))
+
+    assert lcd.cgram[2] == (0, 1, 2, 3, 4, 5, 6, 7)
+    assert lcd.stats()["data_bytes"] == 8
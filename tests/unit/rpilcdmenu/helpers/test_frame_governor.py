@@ -0,0 +1,52 @@
+from rpilcdmenu.helpers.frame_governor import FrameGovernor
+
+
+def test_framegovernor_keeps_nominal_delay_on_fast_bus():
+    governor = FrameGovernor(budget=0.25)
+    governor.record(0.001)
+
+    assert governor.delay(0.05) == 0.05
+    assert governor.stretched == 0
+
+
+def test_framegovernor_stretches_delay_to_budget():
+    governor = FrameGovernor(budget=0.25)
+    governor.record(0.03)
+
+    delay = governor.delay(0.05)
+
+    assert abs(delay - 0.09) < 1e-9
+    assert abs(governor.utilization(delay) - 0.25) < 1e-9
+    assert governor.stretched == 1
+
+
+def test_framegovernor_limits_slowdown():
+    governor = FrameGovernor(budget=0.1, max_slowdown=4.0)
+    governor.record(1.0)
+
+    assert governor.delay(0.05) == 0.2
+
+
+def test_framegovernor_smooths_measurements():
+    governor = FrameGovernor(smoothing=0.5)
+    governor.record(0.01)
+    governor.record(0.03)
+
+    assert abs(governor.frame_cost - 0.02) < 1e-9
+    assert governor.snapshot()["frames"] == 2
+
+
+def test_framegovernor_shares_budget_between_animating_displays():
+    now = [0.0]
+    governor = FrameGovernor(budget=0.25, clock=lambda: now[0])
+    governor.record(0.03)
+
+    assert abs(governor.delay(0.05, "first") - 0.09) < 1e-9
+    delay = governor.delay(0.05, "second")
+
+    assert abs(delay - 0.21) < 1e-9
+    assert abs(governor.utilization(delay) - 0.25) < 1e-9
+
+    # A stream which stopped drawing frames gives its share back
+    now[0] = 1.0
+    assert abs(governor.delay(0.05, "second") - 0.09) < 1e-9
@@ -0,0 +1,97 @@
+import pytest
+
+from rpilcdmenu import RpiLCDMenu
+from rpilcdmenu.backends import VirtualLcd
+from rpilcdmenu.items import MenuItem
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor
+
+
+def bitmap(value):
+    return (value,) * 8
+
+
+def create_processor():
+    lcd = VirtualLcd()
+    return RpiLcdProcessor(lcd=lcd), lcd
+
+
+def test_glyphmanager_uploads_glyph_once_and_reuses_its_slot():
+    processor, lcd = create_processor()
+    glyphs = processor.glyphs
+
+    first = glyphs.char(bitmap(1))
+    second = glyphs.char(bitmap(2))
+    assert glyphs.char(bitmap(1)) == first
+    assert glyphs.resolve([first + second, first]) == ["\x00\x01", "\x00"]
+    assert glyphs.resolve([second]) == ["\x01"]
+
+    assert lcd.cgram[:3] == [bitmap(1), bitmap(2), None]
+    assert glyphs.stats() == {"uploads": 2, "hits": 1, "evictions": 0, "resident": 2}
+
+
+def test_glyphmanager_evicts_least_recently_used_glyph():
+    processor, lcd = create_processor()
+    glyphs = processor.glyphs
+    for value in range(8):
+        glyphs.resolve([glyphs.char(bitmap(value))])
+    glyphs.resolve([glyphs.char(bitmap(0))])
+
+    assert glyphs.resolve([glyphs.char(bitmap(8))]) == ["\x01"]
+    assert lcd.cgram[1] == bitmap(8)
+    assert glyphs.stats()["evictions"] == 1
+
+
+def test_glyphmanager_characters_keep_their_glyph_after_eviction():
+    processor, lcd = create_processor()
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+    menu.append_item(MenuItem("Volume " + menu.glyph(bitmap(4))))
+    for value in range(8):
+        menu.message([menu.glyph(bitmap(10 + value)), ""])
+        processor.run_pending()
+
+    menu.start()
+    processor.run_pending()
+
+    slot = ord(lcd.display()[0][8])
+    assert lcd.display()[0].startswith(">Volume ")
+    assert lcd.cgram[slot] == bitmap(4)
+
+
+def test_glyphmanager_never_evicts_glyphs_of_the_same_frame():
+    processor, lcd = create_processor()
+    glyphs = processor.glyphs
+    chars = [glyphs.char(bitmap(value)) for value in range(9)]
+
+    rows = glyphs.resolve(["".join(chars)])
+
+    assert rows == ["".join(chr(slot) for slot in range(8)) + "?"]
+    assert lcd.cgram == [bitmap(value) for value in range(8)]
+
+
+def test_glyphmanager_keeps_defined_slots_and_fails_when_all_are_pinned():
+    processor, lcd = create_processor()
+    glyphs = processor.glyphs
+    for slot in range(7):
+        glyphs.define(slot, bitmap(slot))
+
+    assert glyphs.resolve([glyphs.char(bitmap(10))]) == ["\x07"]
+    assert glyphs.resolve([glyphs.char(bitmap(11))]) == ["\x07"]
+
+    glyphs.define(7, bitmap(7))
+    with pytest.raises(Exception):
+        glyphs.char(bitmap(12))
+
+
+def test_rpilcdmenu_custom_character_is_uploaded_in_order_with_frames():
+    processor, lcd = create_processor()
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+
+    menu.custom_character("\x03", bitmap(31))
+    menu.message(["Volume " + menu.glyph(bitmap(4)), ""])
+    processor.run_pending()
+
+    assert lcd.cgram[3] == bitmap(31)
+    assert lcd.cgram[0] == bitmap(4)
+    assert lcd.display()[0] == "Volume \x00        "
+    log = [(kind, value) for _, kind, value in lcd.log]
+    assert log.index(("instruction", 0x40)) < log.index(("data", ord("V")))
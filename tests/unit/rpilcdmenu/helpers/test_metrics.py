@@ -0,0 +1,47 @@
+from mock import Mock
+
+from rpilcdmenu.helpers.metrics import Histogram, PipelineMetrics
+
+
+def test_histogram_reports_bucket_bounds_as_percentiles():
+    histogram = Histogram()
+    for _ in range(9):
+        histogram.add(0.000003)
+    histogram.add(0.001)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["count"] == 10
+    assert snapshot["p50_us"] == 4
+    assert snapshot["p95_us"] == 1000
+    assert snapshot["max_us"] == 1000
+
+
+def test_histogram_of_nothing_is_zero():
+    assert Histogram().snapshot() == {"count": 0, "mean_us": 0.0, "p50_us": 0.0, "p95_us": 0.0, "max_us": 0.0}
+
+
+def test_pipelinemetrics_keeps_one_histogram_per_command():
+    def write():
+        pass
+
+    metrics = PipelineMetrics()
+    metrics.command(write, 0.001)
+    metrics.command(write, 0.002)
+    metrics.command(Mock(), 0.001)
+
+    commands = metrics.snapshot()["commands"]
+
+    assert commands["test_pipelinemetrics_keeps_one_histogram_per_command.<locals>.write"]["count"] == 2
+    assert commands["Mock"]["count"] == 1
+
+
+def test_pipelinemetrics_reset_starts_new_period():
+    metrics = PipelineMetrics()
+    metrics.frames_written = 3
+    metrics.queue_wait.add(0.001)
+
+    metrics.reset()
+
+    assert metrics.frames_written == 0
+    assert metrics.queue_wait.count == 0
@@ -0,0 +1,40 @@
+from rpilcdmenu.helpers.scroll_frames import ScrollFrameCache
+
+
+def test_scrollframecache_precomputes_frames_with_pauses_at_both_ends():
+    cache = ScrollFrameCache()
+
+    assert cache.get("abcdef", 4, ">") == (
+        (">abcd", 25),
+        (">bcde", 5),
+        (">cdef", 25),
+    )
+
+
+def test_scrollframecache_returns_same_frames_for_same_text():
+    cache = ScrollFrameCache()
+
+    assert cache.get("abcdef", 4, ">") is cache.get("abcdef", 4, ">")
+    assert cache.get("abcdef", 4, ">") is not cache.get("abcdef", 4, "*")
+
+
+def test_scrollframecache_evicts_least_recently_used_sequence():
+    cache = ScrollFrameCache(maxsize=2)
+    first = cache.get("first item", 4, ">")
+    cache.get("second item", 4, ">")
+    cache.get("first item", 4, ">")
+    cache.get("third item", 4, ">")
+
+    assert len(cache) == 2
+    assert cache.get("first item", 4, ">") is first
+
+
+def test_scrollframecache_invalidate_drops_frames_of_text():
+    cache = ScrollFrameCache()
+    frames = cache.get("abcdef", 4, ">")
+    cache.get("ghijkl", 4, ">")
+
+    cache.invalidate("abcdef")
+
+    assert len(cache) == 1
+    assert cache.get("abcdef", 4, ">") is not frames
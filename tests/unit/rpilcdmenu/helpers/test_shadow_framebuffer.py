@@ -0,0 +1,46 @@
+from rpilcdmenu.helpers.shadow_framebuffer import ShadowFramebuffer
+
+
+def test_shadow_framebuffer_writes_full_rows_when_display_content_is_unknown():
+    shadow = ShadowFramebuffer(16, 2)
+
+    assert shadow.diff([">item1", " item2"]) == [
+        (0, 0, ">item1          "),
+        (1, 0, " item2          "),
+    ]
+
+
+def test_shadow_framebuffer_skips_unchanged_rows():
+    shadow = ShadowFramebuffer(16, 2)
+    shadow.diff([">item1", " item2"])
+
+    assert shadow.diff([">item1", " item2"]) == []
+
+
+def test_shadow_framebuffer_returns_only_changed_runs():
+    shadow = ShadowFramebuffer(16, 2)
+    shadow.diff([">item1", " item2"])
+
+    assert shadow.diff([" item1", ">item2"]) == [(0, 0, " "), (1, 0, ">")]
+
+
+def test_shadow_framebuffer_merges_runs_separated_by_small_gaps():
+    shadow = ShadowFramebuffer(16, 1)
+    shadow.diff(["abcdefgh"])
+
+    assert shadow.diff(["xbxdefgx"]) == [(0, 0, "xbx"), (0, 7, "x")]
+
+
+def test_shadow_framebuffer_diffs_against_blank_screen_after_clear():
+    shadow = ShadowFramebuffer(16, 2)
+    shadow.clear()
+
+    assert shadow.diff(["  ab"]) == [(0, 2, "ab")]
+
+
+def test_shadow_framebuffer_invalidate_forces_full_rewrite():
+    shadow = ShadowFramebuffer(4, 1)
+    shadow.diff(["abcd"])
+    shadow.invalidate()
+
+    assert shadow.diff(["abcd"]) == [(0, 0, "abcd")]
@@ -27,3 +27,10 @@ def test_get_text_lines_returns_how_many_lines_given_message_has():
     result = get_text_lines("a\nb\ncccccccccccccccc")
 
     assert result == 3
+
+
+def test_get_scrolled_text_and_get_text_lines_use_given_width():
+    sample_text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit"
+
+    assert get_scrolled_text(sample_text, 1, 2, 20) == "t amet, consectetur adipiscing elit"
+    assert get_text_lines(sample_text, 20) == 3
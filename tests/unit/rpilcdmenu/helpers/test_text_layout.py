@@ -0,0 +1,45 @@
+from rpilcdmenu.helpers.text_layout import TextLayout
+
+
+def test_textlayout_wraps_text_at_word_boundaries():
+    layout = TextLayout("Lorem ipsum dolor sit amet, consectetur", 16)
+
+    assert layout.lines == ["Lorem ipsum", "dolor sit amet,", "consectetur"]
+
+
+def test_textlayout_splits_words_longer_than_width():
+    layout = TextLayout("abcdefghij xy", 4)
+
+    assert layout.lines == ["abcd", "efgh", "ij", "xy"]
+
+
+def test_textlayout_keeps_newlines_and_empty_lines():
+    layout = TextLayout("foo\n\nbar", 16)
+
+    assert layout.lines == ["foo", "", "bar"]
+    assert layout.line_count == 3
+
+
+def test_textlayout_window_returns_slice_of_lines():
+    layout = TextLayout("a\nb\nc\nd", 16)
+
+    assert layout.window(1, 2) == ["b", "c"]
+    assert layout.window(3, 2) == ["d"]
+
+
+def test_textlayout_append_gives_same_lines_as_full_layout():
+    layout = TextLayout("Lorem ipsum do", 16)
+    layout.append("lor sit\namet, consectetur")
+    layout.append(" adipiscing")
+
+    expected = TextLayout("Lorem ipsum dolor sit\namet, consectetur adipiscing", 16)
+    assert layout.lines == expected.lines
+    assert layout.text == expected.text
+
+
+def test_textlayout_set_text_relayouts_changed_text():
+    layout = TextLayout("foo bar", 16)
+
+    layout.set_text("baz")
+
+    assert layout.lines == ["baz"]
@@ -0,0 +1,137 @@
+import io
+
+from mock import Mock, call
+
+from rpilcdmenu.input import InputController, KeyboardSource, PolledAxis, TerminalKeyboard, UP, DOWN, ENTER
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def create_controller(**kwargs):
+    clock = FakeClock()
+    menu = Mock()
+    menu.processSteps.return_value = menu
+    menu.processEnter.return_value = menu
+    return InputController(menu, clock=clock, **kwargs), menu, clock
+
+
+def test_inputcontroller_coalesces_burst_of_moves_into_one_call():
+    controller, menu, clock = create_controller()
+
+    for _ in range(5):
+        controller.tap(DOWN)
+    controller.tap(UP)
+    clock.now = 0.05
+    controller.dispatch()
+
+    assert menu.mock_calls == [call.processSteps(4)]
+    assert controller.events_received == 6
+
+
+def test_inputcontroller_keeps_moves_apart_from_enter():
+    controller, menu, clock = create_controller()
+
+    controller.tap(DOWN)
+    controller.tap(DOWN)
+    controller.tap(ENTER)
+    controller.tap(UP)
+    clock.now = 0.05
+    controller.dispatch()
+
+    assert menu.mock_calls == [call.processSteps(2), call.processEnter(), call.processSteps(-1)]
+
+
+def test_inputcontroller_waits_for_coalesce_window():
+    controller, menu, clock = create_controller()
+
+    controller.tap(DOWN)
+    controller.dispatch()
+    assert menu.mock_calls == []
+
+    clock.now = 0.02
+    controller.dispatch()
+    assert menu.mock_calls == [call.processSteps(1)]
+
+
+def test_inputcontroller_ignores_bounces_and_settles_late_release():
+    controller, menu, clock = create_controller(coalesce_window=0, repeat_delay=None)
+
+    controller.press(ENTER)
+    clock.now = 0.005
+    controller.release(ENTER)
+    controller.press(ENTER)
+    controller.release(ENTER)
+    clock.now = 0.1
+    controller.dispatch()
+    controller.press(ENTER)
+
+    assert menu.mock_calls == [call.processEnter()]
+    clock.now = 0.2
+    controller.dispatch()
+    assert menu.mock_calls == [call.processEnter(), call.processEnter()]
+
+
+def test_inputcontroller_repeats_held_key_faster_and_faster():
+    controller, menu, clock = create_controller(coalesce_window=0, repeat_delay=0.5, repeat_interval=0.2,
+                                                repeat_acceleration=0.5, repeat_min_interval=0.05)
+
+    controller.press(DOWN)
+    controller.dispatch()
+    # Repeats at 0.5, 0.7, 0.8, 0.85, 0.9, 0.95
+    clock.now = 0.96
+    controller.dispatch()
+    controller.release(DOWN)
+    clock.now = 2
+    controller.dispatch()
+
+    assert menu.mock_calls == [call.processSteps(1), call.processSteps(6)]
+
+
+def test_inputcontroller_tracks_returned_menu():
+    controller, menu, clock = create_controller(coalesce_window=0)
+    submenu = Mock()
+    submenu.processSteps.return_value = submenu
+    menu.processEnter.return_value = submenu
+
+    controller.tap(ENTER)
+    controller.tap(DOWN)
+
+    assert controller.dispatch() is submenu
+    submenu.processSteps.assert_called_once_with(1)
+
+
+def test_polledaxis_presses_outside_center_zone_and_releases_back_in_it():
+    controller = Mock()
+    values = iter([1.5, 3.0, 3.0, 0.1, 1.5])
+    axis = PolledAxis(controller, lambda: next(values))
+
+    for _ in range(5):
+        axis.poll()
+
+    assert controller.mock_calls == [
+        call.press(UP), call.release(UP), call.press(DOWN), call.release(DOWN)
+    ]
+
+
+def test_keyboardsource_maps_characters_to_key_strokes():
+    controller = Mock()
+    KeyboardSource(controller, io.StringIO()).feed("ssxw e")
+
+    assert controller.mock_calls == [call.tap(DOWN), call.tap(DOWN), call.tap(UP), call.tap(ENTER), call.tap(ENTER)]
+
+
+def test_terminalkeyboard_reads_arrow_keys_until_quit():
+    controller = Mock()
+    on_quit = Mock()
+    keyboard = TerminalKeyboard(controller, io.StringIO("\x1b[B\x1b[Aw\nqs"), on_quit=on_quit)
+
+    keyboard._run()
+
+    assert controller.mock_calls == [call.tap(DOWN), call.tap(UP), call.tap(UP), call.tap(ENTER)]
+    on_quit.assert_called_once_with()
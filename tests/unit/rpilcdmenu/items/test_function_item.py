@@ -1,3 +1,11 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from mock import Mock, call
+
+from rpilcdmenu.base_menu import BaseMenu
+from rpilcdmenu.items.container_item import ContainerItem
 from rpilcdmenu.items.function_item import FunctionItem
 
 
@@ -13,3 +21,105 @@ def test_functionitem_action_calls_configured_function_with_keyword_args_and_ret
     action_result = function_item.action()
     assert (3, 2) == action_result
     assert (3, 2) == function_item.get_return()
+
+
+def test_functionitem_without_arguments_shares_empty_defaults_and_has_no_dict():
+    first = FunctionItem("First", lambda: 1)
+    second = FunctionItem("Second", lambda: 2)
+
+    assert first.args is second.args
+    assert first.kwargs is second.kwargs
+    assert second.action() == 2
+    assert not hasattr(first, "__dict__")
+
+
+def test_functionitem_with_executor_hands_result_to_menu_without_blocking():
+    executor = ThreadPoolExecutor(1)
+    release = threading.Event()
+    menu = BaseMenu()
+    target = BaseMenu()
+    menu.append_item(FunctionItem("Slow", lambda: release.wait() and target, executor=executor))
+    menu.start()
+
+    assert menu.processEnter() is menu
+    assert menu.items[0].is_running()
+
+    release.set()
+    executor.shutdown(wait=True)
+
+    assert not menu.items[0].is_running()
+    assert menu.items[0].get_return() is target
+    assert menu.processDown() is target
+
+
+def test_functionitem_with_executor_drops_result_after_timeout():
+    executor = ThreadPoolExecutor(1)
+    release = threading.Event()
+    menu = BaseMenu()
+    item = FunctionItem("Slow", lambda: release.wait() and BaseMenu(), executor=executor, timeout=0.01)
+    menu.append_item(item)
+
+    menu.processEnter()
+    time.sleep(0.1)
+    assert not item.is_running()
+
+    release.set()
+    executor.shutdown(wait=True)
+
+    assert item.get_return() is None
+    assert menu.redirect is None
+
+
+def test_functionitem_cancel_abandons_background_call():
+    executor = ThreadPoolExecutor(1)
+    release = threading.Event()
+    menu = BaseMenu()
+    item = FunctionItem("Slow", release.wait, executor=executor)
+    menu.append_item(item)
+
+    menu.processEnter()
+    item.cancel()
+    release.set()
+    executor.shutdown(wait=True)
+
+    assert not item.is_running()
+    assert item.get_return() is None
+
+
+def test_functionitem_in_container_shows_busy_on_owning_menu():
+    executor = ThreadPoolExecutor(1)
+    menu = BaseMenu()
+    menu.show_busy = Mock()
+    container = ContainerItem("Container")
+    item = FunctionItem("Slow", lambda: 1, executor=executor)
+    container.append_item(item)
+    menu.append_item(container)
+
+    menu.processEnter()
+    executor.shutdown(wait=True)
+
+    assert menu.show_busy.mock_calls == [call(), call(False)]
+    assert item.get_return() == 1
+
+
+def test_functionitem_finishes_a_call_only_once_across_threads():
+    executor = ThreadPoolExecutor(1)
+    release = threading.Event()
+    menu = BaseMenu()
+    menu.action_finished = Mock()
+    item = FunctionItem("Slow", lambda: release.wait() and 1, executor=executor)
+    menu.append_item(item)
+
+    menu.processEnter()
+    future = item.future
+    release.set()
+    future.result()
+    # The executor callback races with these
+    threads = [threading.Thread(target=item._finish, args=(future,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    executor.shutdown(wait=True)
+
+    menu.action_finished.assert_called_once_with(item, 1)
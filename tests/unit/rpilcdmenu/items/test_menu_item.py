@@ -45,3 +45,14 @@ def test_menuitem_get_return_returns_parent_menu_value_given_parent_menu():
 def test_menuitem_get_return_returns_None_given_no_parent_menu():
     menu_item = MenuItem("an Item")
     assert None == menu_item.get_return()
+
+
+def test_menuitem_has_no_instance_dict_but_subclasses_may_add_attributes():
+    class TaggedItem(MenuItem):
+        pass
+
+    assert not hasattr(MenuItem("an Item"), "__dict__")
+
+    item = TaggedItem("an Item")
+    item.tag = "extra"
+    assert "extra" == item.tag
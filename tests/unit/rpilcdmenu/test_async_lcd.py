@@ -0,0 +1,64 @@
+import asyncio
+
+from mock import Mock, call
+
+from rpilcdmenu.backends import VirtualLcd
+from rpilcdmenu.async_lcd import AsyncLcdProcessor, AsyncRpiLCDMenu
+from rpilcdmenu.rpi_lcd_menu import RpiLCDMenu
+
+
+def test_asynclcdprocessor_runs_commands_and_timers_on_event_loop():
+    write = Mock()
+
+    async def scenario():
+        processor = AsyncLcdProcessor(lcd=VirtualLcd()).start()
+        processor.schedule(0, [write, "timer"])
+        processor.put([write, "command"])
+        await processor.drain()
+        await asyncio.sleep(0.01)
+        await processor.stop()
+
+    asyncio.run(scenario())
+
+    assert write.mock_calls == [call("command"), call("timer")]
+
+
+def test_asyncrpilcdmenu_navigation_returns_after_frame_is_written():
+    lcd = VirtualLcd()
+
+    async def scenario():
+        processor = AsyncLcdProcessor(lcd=lcd)
+        menu = RpiLCDMenu(rpi_lcd_processor=processor)
+        for text in ("item1", "item2", "item3"):
+            item = Mock()
+            item.text = text
+            menu.append_item(item)
+
+        async_menu = await AsyncRpiLCDMenu(menu).start()
+        await async_menu.processDown()
+        assert processor.qsize() == 0
+        await async_menu.stop()
+
+    asyncio.run(scenario())
+
+    assert lcd.display() == [" item1          ", ">item2          "]
+
+
+def test_asyncrpilcdmenu_returns_after_first_scroll_frame_is_written():
+    lcd = VirtualLcd()
+
+    async def scenario():
+        processor = AsyncLcdProcessor(lcd=lcd)
+        menu = RpiLCDMenu(rpi_lcd_processor=processor)
+        for index in range(3):
+            item = Mock()
+            item.text = "A very long menu item %d" % index
+            menu.append_item(item)
+
+        async_menu = await AsyncRpiLCDMenu(menu).start()
+        assert lcd.display()[0] == ">A very long men"
+        await async_menu.processDown()
+        assert lcd.display()[1] == ">A very long men"
+        await async_menu.stop()
+
+    asyncio.run(scenario())
@@ -64,3 +64,54 @@ def test_basemenu_debug_returns_subitem_debug_info():
 
     base_menu.debug()
     submenuitem_mock.submenu.debug.assert_called_once()
+
+
+def test_basemenu_process_steps_moves_cursor_with_wrap_around_and_renders_once():
+    base_menu = BaseMenu()
+    for _ in range(5):
+        base_menu.append_item(mock.Mock())
+    base_menu.render = mock.Mock()
+
+    base_menu.processSteps(7)
+    assert base_menu.current_option == 2
+    base_menu.processSteps(-3)
+    assert base_menu.current_option == 4
+    assert base_menu.render.call_count == 2
+
+
+def test_basemenu_moves_keeping_the_selection_do_not_render():
+    base_menu = BaseMenu()
+    base_menu.append_item(mock.Mock())
+    base_menu.render = mock.Mock()
+
+    base_menu.processDown()
+    base_menu.processUp()
+    base_menu.processSteps(3)
+
+    base_menu.render.assert_not_called()
+    assert base_menu.input_count == 0
+
+
+def test_basemenu_process_steps_calls_overridden_up_and_down():
+    class CountingMenu(BaseMenu):
+        def __init__(self):
+            super(CountingMenu, self).__init__()
+            self.moves = []
+
+        def processUp(self):
+            self.moves.append("up")
+            return self
+
+        def processDown(self):
+            self.moves.append("down")
+            return self
+
+    menu = CountingMenu()
+    for _ in range(5):
+        menu.append_item(mock.Mock())
+
+    assert menu.processSteps(3) is menu
+    menu.processSteps(-2)
+
+    assert menu.moves == ["down", "down", "down", "up", "up"]
+    assert menu.current_option == 0
@@ -0,0 +1,58 @@
+from concurrent.futures import Future
+
+from mock import Mock
+
+from rpilcdmenu import RpiLCDMenu
+from rpilcdmenu.backends import VirtualLcd
+from rpilcdmenu.items import FunctionItem, MenuItem
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor
+
+
+def create_menu(lcd):
+    processor = RpiLcdProcessor(lcd=lcd)
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+    return menu, processor
+
+
+def test_busyindicator_spins_in_corner_until_background_action_finishes():
+    lcd = VirtualLcd()
+    menu, processor = create_menu(lcd)
+    future = Future()
+    executor = Mock()
+    executor.submit.return_value = future
+    menu.append_item(FunctionItem("Slow", Mock(), executor=executor)).append_item(MenuItem("Other"))
+
+    menu.start()
+    menu.processEnter()
+    processor.run_pending()
+    assert lcd.display() == [">Slow          .", " Other          "]
+
+    processor.busy_indicator.step()
+    assert lcd.display()[0] == ">Slow          o"
+
+    future.set_result(None)
+    processor.run_pending()
+    assert lcd.display() == [">Slow           ", " Other          "]
+    assert processor.busy_indicator.jobs == 0
+
+
+def test_busyindicator_keeps_content_drawn_below_it():
+    lcd = VirtualLcd()
+    menu, processor = create_menu(lcd)
+    future = Future()
+    executor = Mock()
+    executor.submit.return_value = future
+    menu.append_item(FunctionItem("Slow", Mock(), executor=executor)).append_item(MenuItem("Other"))
+
+    menu.start()
+    menu.processEnter()
+    processor.run_pending()
+    menu.message([">Slow          X", ""])
+    processor.run_pending()
+    processor.busy_indicator.step()
+    assert lcd.display()[0] == ">Slow          o"
+
+    future.set_result(None)
+    processor.run_pending()
+
+    assert lcd.display()[0] == ">Slow          X"
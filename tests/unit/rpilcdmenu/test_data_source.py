@@ -0,0 +1,78 @@
+from mock import Mock
+
+from rpilcdmenu import RpiLCDMenu
+from rpilcdmenu.backends import VirtualLcd
+from rpilcdmenu.base_menu import BaseMenu
+from rpilcdmenu.data_source import DataSource, LazyItems
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor
+
+
+class CountingSource(DataSource):
+    def __init__(self, length):
+        self.length = length
+        self.fetches = []
+
+    def __len__(self):
+        return self.length
+
+    def fetch(self, start, count):
+        self.fetches.append((start, count))
+        return ["record%d" % index for index in range(start, min(start + count, self.length))]
+
+
+def test_lazyitems_fetches_only_the_page_of_an_item():
+    source = CountingSource(100000)
+    items = LazyItems(source, page_size=10)
+
+    assert len(items) == 100000
+    assert items[12345].text == "record12345"
+    assert items[-1].text == "record99999"
+    assert source.fetches == [(12340, 10), (99990, 10)]
+
+
+def test_lazyitems_reuses_cached_pages_and_drops_least_recently_used():
+    source = CountingSource(100)
+    items = LazyItems(source, page_size=10, cache_pages=2)
+
+    first = items[0]
+    items[10]
+    assert items[0] is first
+    items[20]
+    assert items[5] is not None
+    assert len(source.fetches) == 3
+
+    items[10]
+    assert source.fetches[-1] == (10, 10)
+
+
+def test_lazyitems_slices_and_wraps_plain_sequences():
+    items = LazyItems(range(5), page_size=2, item_factory=lambda record: Mock(text=str(record * 2)))
+
+    assert [item.text for item in items[1:4]] == ["2", "4", "6"]
+    assert [item.text for item in items] == ["0", "2", "4", "6", "8"]
+
+
+def test_basemenu_navigates_data_source_and_wraps_around():
+    menu = BaseMenu()
+    menu.set_data_source(CountingSource(1000))
+    menu.start()
+
+    menu.processUp()
+
+    assert menu.current_option == 999
+    assert menu.items[menu.current_option].menu is menu
+
+
+def test_rpilcdmenu_renders_window_of_data_source():
+    lcd = VirtualLcd()
+    processor = RpiLcdProcessor(lcd=lcd)
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+    source = CountingSource(1000000)
+    menu.set_data_source(source)
+
+    menu.start()
+    menu.processUp()
+    processor.run_pending()
+
+    assert lcd.display() == [" record999998   ", ">record999999   "]
+    assert source.fetches == [(0, 16), (999984, 16)]
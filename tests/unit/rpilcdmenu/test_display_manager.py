@@ -0,0 +1,140 @@
+import threading
+import time
+
+from rpilcdmenu import RpiLCDMenu
+from rpilcdmenu.backends import VirtualLcd
+from rpilcdmenu.display_manager import BusWorker, BusDisplay, DisplayManager
+from rpilcdmenu.helpers.frame_governor import FrameGovernor
+from rpilcdmenu.items import MenuItem
+
+
+class BlockingLcd(VirtualLcd):
+    """
+    Display on a hanging bus, every flush waits for release
+    """
+
+    def __init__(self):
+        super(BlockingLcd, self).__init__()
+        self.release = threading.Event()
+
+    def flush(self):
+        self.release.wait(5)
+        super(BlockingLcd, self).flush()
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def test_displaymanager_drives_menus_on_all_displays():
+    manager = DisplayManager()
+    menus = []
+    for index in range(3):
+        menu = RpiLCDMenu(rpi_lcd_processor=manager.add_display(lcd=VirtualLcd(), bus=index % 2))
+        menu.append_item(MenuItem("display%d" % index)).start()
+        menus.append(menu)
+    manager.stop()
+
+    for index, menu in enumerate(menus):
+        assert menu.lcd.display()[0].startswith(">display%d" % index)
+
+
+def test_displaymanager_uses_one_thread_per_bus():
+    before = threading.active_count()
+    manager = DisplayManager()
+    for index in range(10):
+        manager.add_display(lcd=VirtualLcd(), bus=index % 2)
+
+    assert threading.active_count() - before == 2
+    assert manager.stats() == {0: {"displays": 5, "rounds": 0}, 1: {"displays": 5, "rounds": 0}}
+    manager.stop()
+    assert threading.active_count() == before
+
+
+def test_displaymanager_slow_bus_does_not_stall_other_buses():
+    manager = DisplayManager()
+    slow_lcd = BlockingLcd()
+    slow = manager.add_display(lcd=slow_lcd, bus=0)
+    fast = manager.add_display(lcd=VirtualLcd(), bus=1)
+
+    slow.put_frame([slow.lcd.write_string, "slow"])
+    fast.put_frame([fast.lcd.write_string, "fast"])
+
+    assert wait_for(lambda: fast.lcd.display()[0].startswith("fast"))
+    assert slow.batches_processed == 0
+
+    slow_lcd.release.set()
+    manager.stop()
+    assert slow.batches_processed == 1
+    assert slow_lcd.display()[0].startswith("slow")
+
+
+def test_busworker_interleaves_displays_fairly():
+    worker = BusWorker(0)
+    first = BusDisplay(worker, VirtualLcd())
+    second = BusDisplay(worker, VirtualLcd())
+    worker.add(first).add(second)
+
+    for index in range(3):
+        first.put([first.lcd.write_string, "a%d" % index])
+    second.put([second.lcd.write_string, "b"])
+
+    with worker.condition:
+        work = worker._next_round()
+    assert [(display, len(batch)) for display, batch in work] == [(first, 3), (second, 1)]
+
+    first.put([first.lcd.write_string, "a"])
+    second.put([second.lcd.write_string, "b"])
+    with worker.condition:
+        work = worker._next_round()
+    # The display served first moves on every round
+    assert [display for display, _ in work] == [second, first]
+
+
+def test_busdisplay_timers_wake_the_bus_worker():
+    manager = DisplayManager()
+    display = manager.add_display(lcd=VirtualLcd(), bus=0)
+    done = threading.Event()
+
+    display.schedule(0.01, [done.set])
+
+    assert done.wait(1)
+    manager.stop()
+
+
+def test_busworker_detaches_failing_display_and_keeps_driving_the_bus():
+    class FailingLcd(VirtualLcd):
+        def flush(self):
+            raise IOError("no ACK from display")
+
+    manager = DisplayManager()
+    broken = manager.add_display(lcd=FailingLcd(), bus=0)
+    working = manager.add_display(lcd=VirtualLcd(), bus=0)
+
+    broken.put_frame([broken.lcd.write_string, "broken"])
+    assert wait_for(lambda: not broken.is_alive())
+    assert isinstance(broken.failed, IOError)
+    broken.put([broken.lcd.write_string, "dropped"])
+    assert broken.qsize() == 0
+    assert broken.commands_rejected == 1
+
+    working.put_frame([working.lcd.write_string, "working"])
+    assert wait_for(lambda: working.lcd.display()[0].startswith("working"))
+    assert manager.workers[0].is_alive()
+    manager.stop()
+
+
+def test_displaymanager_budgets_the_bus_with_one_governor():
+    manager = DisplayManager()
+    governor = FrameGovernor()
+    first = manager.add_display(lcd=VirtualLcd(), bus=0)
+    second = manager.add_display(lcd=VirtualLcd(), bus=0, governor=governor)
+    third = manager.add_display(lcd=VirtualLcd(), bus=0, governor=FrameGovernor())
+    manager.stop()
+
+    assert [display.governor for display in (first, second, third)] == [governor] * 3
@@ -0,0 +1,173 @@
+import time
+from concurrent.futures import Future
+
+from mock import Mock
+
+from rpilcdmenu import RpiLCDMenu
+from rpilcdmenu.backends import VirtualLcd
+from rpilcdmenu.helpers.metrics import PipelineMetrics
+from rpilcdmenu.item_refresher import ItemRefresher
+from rpilcdmenu.items import DynamicItem, MenuItem, SubmenuItem
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor
+from rpilcdmenu.rpi_lcd_submenu import RpiLCDSubMenu
+
+
+class InlineExecutor:
+    """
+    Runs submitted providers right away on the calling thread
+    """
+
+    def submit(self, function):
+        future = Future()
+        future.set_result(function())
+        return future
+
+
+class ManualExecutor:
+    """
+    Keeps the providers until the test runs them
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, function):
+        future = Future()
+        self.calls.append((function, future))
+        return future
+
+    def run(self):
+        calls, self.calls = self.calls, []
+        for function, future in calls:
+            future.set_result(function())
+
+
+def create_menu(*items, **kwargs):
+    processor = RpiLcdProcessor(lcd=VirtualLcd(), metrics=PipelineMetrics(), **kwargs)
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+    processor.refresher = ItemRefresher(menu, executor=InlineExecutor(), min_ttl=0.005)
+    for item in items:
+        menu.append_item(item)
+    return menu, processor
+
+
+def test_itemrefresher_shows_provider_value_of_visible_item():
+    provider = Mock(return_value="CPU 42C")
+    menu, processor = create_menu(MenuItem("item1"), DynamicItem(provider, ttl=60))
+
+    menu.start()
+    processor.run_pending()
+
+    assert processor.lcd.display()[1].rstrip() == " CPU 42C"
+    assert provider.call_count == 1
+
+
+def test_itemrefresher_caches_values_until_ttl_expires():
+    provider = Mock(return_value="CPU 42C")
+    menu, processor = create_menu(DynamicItem(provider, ttl=0.05), MenuItem("item2"))
+
+    menu.start()
+    processor.run_pending()
+    menu.processDown().processUp()
+    processor.run_pending()
+    assert provider.call_count == 1
+
+    time.sleep(0.06)
+    processor.run_pending()
+    assert provider.call_count == 2
+
+
+def test_itemrefresher_renders_again_only_on_changed_value():
+    values = ["1", "1", "2"]
+    menu, processor = create_menu(DynamicItem(lambda: values.pop(0) if values else "2", ttl=0.01), MenuItem("item2"))
+    refresher = processor.refresher
+
+    menu.start()
+    for _ in range(3):
+        processor.run_pending()
+        time.sleep(0.015)
+    processor.run_pending()
+
+    # The first value replaces the placeholder, the repeated one is not drawn
+    assert refresher.refreshes >= 3
+    assert refresher.renders == 2
+    assert processor.lcd.display()[0].rstrip() == ">2"
+
+
+def test_itemrefresher_does_not_poll_hidden_items():
+    provider = Mock(return_value="value")
+    menu, processor = create_menu(MenuItem("item1"), MenuItem("item2"), DynamicItem(provider))
+
+    menu.start()
+    processor.run_pending()
+    provider.assert_not_called()
+
+    menu.processUp()
+    processor.run_pending()
+    provider.assert_called_once()
+
+
+def test_itemrefresher_stops_polling_for_other_views():
+    provider = Mock(return_value="value")
+    menu, processor = create_menu(DynamicItem(provider, ttl=0.01))
+
+    menu.start()
+    processor.run_pending()
+    menu.message("Hello")
+    time.sleep(0.02)
+    processor.run_pending()
+
+    provider.assert_called_once()
+    assert processor.refresher.items == []
+
+
+def test_rpilcdmenu_creates_refresher_for_dynamic_items_only():
+    processor = RpiLcdProcessor(lcd=VirtualLcd())
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+    menu.append_item(MenuItem("item1")).start()
+    assert processor.refresher is None
+
+    menu.append_item(DynamicItem(lambda: "value"))
+    menu.render()
+    assert isinstance(processor.refresher, ItemRefresher)
+    processor.refresher.close()
+
+
+def test_itemrefresher_does_not_draw_a_menu_which_was_left():
+    menu, processor = create_menu(max_batch=1, starvation_limit=2)
+    executor = processor.refresher.executor = ManualExecutor()
+    submenu = RpiLCDSubMenu(menu)
+    submenu.append_item(MenuItem("child1")).append_item(MenuItem("child2"))
+    menu.append_item(DynamicItem(lambda: "val 1")).append_item(SubmenuItem("Sub", submenu, menu))
+
+    menu.start()
+    processor.run_pending()
+    # The value arrives while the user enters the submenu
+    executor.run()
+    menu = menu.processDown().processEnter()
+    processor.run_pending()
+
+    assert menu is submenu
+    assert [row.rstrip() for row in processor.lcd.display()] == [">child1", " child2"]
+    assert processor.refresher.renders == 0
+
+
+def test_itemrefresher_limits_polling_of_zero_ttl():
+    provider = Mock(return_value="same")
+    menu, processor = create_menu(DynamicItem(provider, ttl=0))
+    processor.refresher.min_ttl = 60
+
+    menu.start()
+    processor.run_pending()
+
+    assert provider.call_count == 1
+
+
+def test_itemrefresher_queues_nothing_for_menus_without_dynamic_items():
+    menu, processor = create_menu(MenuItem("item1"), MenuItem("item2"))
+
+    menu.start()
+    processor.run_pending()
+    menu.processDown()
+
+    assert processor.qsize() == 1
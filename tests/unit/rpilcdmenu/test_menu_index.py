@@ -0,0 +1,100 @@
+from mock import Mock
+
+from rpilcdmenu.base_menu import BaseMenu
+from rpilcdmenu.items import MenuItem, SubmenuItem
+from rpilcdmenu.menu_index import MenuIndex
+
+
+def create_tree():
+    root = BaseMenu()
+    settings = BaseMenu(root)
+    network = BaseMenu(settings)
+    root.append_item(MenuItem("Play")).append_item(SubmenuItem("Settings", settings, root))
+    settings.append_item(MenuItem("Display")).append_item(SubmenuItem("Network", network, settings))
+    network.append_item(MenuItem("Wi-Fi")).append_item(MenuItem("IP"))
+    return root, settings, network
+
+
+def test_menuindex_addresses_items_by_path():
+    root, settings, network = create_tree()
+    index = MenuIndex(root)
+
+    assert len(index) == 6
+    entry = index.get("Settings/Network/IP")
+    assert entry.menu is network
+    assert entry.position == 1
+    assert index.get("Settings/IP") is None
+
+
+def test_menuindex_jump_selects_item_and_moves_cursors_along_path():
+    root, settings, network = create_tree()
+    network.render = Mock()
+    index = MenuIndex(root)
+
+    assert index.jump("Settings/Network/IP") is network
+    assert network.current_option == 1
+    assert settings.current_option == 1
+    assert root.current_option == 1
+    network.render.assert_called_once_with()
+
+
+def test_menuindex_search_finds_items_by_text_prefix():
+    root, settings, network = create_tree()
+    index = MenuIndex(root)
+
+    assert [entry.path for entry in index.search("s")] == ["Settings"]
+    assert [entry.path for entry in index.search("")][:2] == ["Settings/Display", "Settings/Network/IP"]
+    assert [entry.path for entry in index.search("n")] == ["Settings/Network"]
+    assert index.search("x") == []
+    assert len(index.search("", limit=3)) == 3
+
+
+def test_menuindex_follows_appended_and_removed_items():
+    root, settings, network = create_tree()
+    index = MenuIndex(root)
+
+    wifi = network.items[0]
+    network.remove_item(wifi)
+    assert "Settings/Network/Wi-Fi" not in index
+    assert index.get("Settings/Network/IP").position == 0
+
+    audio = BaseMenu(settings)
+    audio.append_item(MenuItem("Volume"))
+    settings.append_item(SubmenuItem("Audio", audio, settings))
+    audio.append_item(MenuItem("Balance"))
+    assert index.get("Settings/Audio/Balance").position == 1
+
+    root.remove_item(root.items[1])
+    assert len(index) == 1
+    assert [entry.path for entry in index.search("")] == ["Play"]
+    assert settings.index is None
+
+
+def test_menuindex_removing_unindexed_duplicate_moves_later_items_up():
+    root = BaseMenu()
+    first, second, last = MenuItem("A"), MenuItem("A"), MenuItem("B")
+    root.append_item(first).append_item(second).append_item(last)
+    index = MenuIndex(root)
+    root.render = Mock()
+
+    root.remove_item(second)
+
+    assert index.get("B").position == 1
+    assert index.jump("B") is root
+    assert root.current_option == 1
+    assert index.get("A").item is first
+
+
+def test_menuindex_removing_indexed_duplicate_hands_path_to_the_other():
+    root = BaseMenu()
+    first, second, last = MenuItem("A"), MenuItem("A"), MenuItem("B")
+    root.append_item(first).append_item(second).append_item(last)
+    index = MenuIndex(root)
+
+    root.remove_item(first)
+
+    entry = index.get("A")
+    assert entry.item is second
+    assert entry.position == 0
+    assert index.get("B").position == 1
+    assert [found.item for found in index.search("a")] == [second]
@@ -1,5 +1,11 @@
 from mock import Mock, MagicMock, patch, call
 from rpilcdmenu.rpi_lcd_menu import RpiLCDMenu
+from rpilcdmenu.helpers.shadow_framebuffer import ShadowFramebuffer
+from rpilcdmenu.helpers.glyph_manager import GlyphManager
+from rpilcdmenu.backends import VirtualLcd
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor
+from rpilcdmenu.helpers.metrics import PipelineMetrics
+from rpilcdmenu.items import MenuItem
 
 
 @patch('rpilcdmenu.rpi_lcd_menu.RpiLCDHwd')
@@ -168,3 +174,108 @@ def test_rpilcdmenu_render_multiple_items_rewind_menu(LCDHwdMock):
         call(ord(char), True) for char in " item1"
     ]
 
+
+
+@patch('rpilcdmenu.rpi_lcd_menu.RpiLcdProcessor')
+def test_rpilcdmenu_write_to_lcd_sends_only_changed_characters(RpiLcdProcessorMock):
+    processor = RpiLcdProcessorMock.return_value
+    processor.shadow = ShadowFramebuffer(16, 2)
+    processor.glyphs = GlyphManager(processor)
+
+    menu = RpiLCDMenu()
+    menu._write_to_lcd([">item1", " item2"])
+    processor.lcd.reset_mock()
+
+    menu._write_to_lcd([" item1", ">item2"])
+
+    assert processor.lcd.write_string.mock_calls == [call(" "), call(">")]
+    assert menu.lcd.cursor_pos == (1, 0)
+
+
+def create_menu_with_items(lcd, count):
+    menu = RpiLCDMenu(rpi_lcd_processor=RpiLcdProcessor(lcd=lcd))
+    for index in range(count):
+        item = Mock()
+        item.text = "item%d" % (index + 1)
+        menu.append_item(item)
+    return menu
+
+
+def test_rpilcdmenu_render_shows_rows_items_in_sliding_window():
+    lcd = VirtualLcd(cols=20, rows=4)
+    menu = create_menu_with_items(lcd, 6)
+    menu.rpi_lcd_processor.put_frame = lambda items: items[0](*items[1:])
+
+    menu.start()
+    assert lcd.display()[0].rstrip() == ">item1"
+    assert menu.lcd.cols == 20 and menu.max_width == 19
+
+    for _ in range(3):
+        menu.processDown()
+    assert [row.rstrip() for row in lcd.display()] == [" item1", " item2", " item3", ">item4"]
+
+    menu.processDown()
+    assert [row.rstrip() for row in lcd.display()] == [" item2", " item3", " item4", ">item5"]
+
+    menu.processUp()
+    menu.processUp()
+    menu.processUp()
+    menu.processUp()
+    assert [row.rstrip() for row in lcd.display()] == [">item1", " item2", " item3", " item4"]
+
+    menu.processUp()
+    assert [row.rstrip() for row in lcd.display()] == [" item3", " item4", " item5", ">item6"]
+
+
+def test_rpilcdmenu_render_blanks_rows_without_items():
+    lcd = VirtualLcd(cols=20, rows=4)
+    menu = create_menu_with_items(lcd, 1)
+    menu.rpi_lcd_processor.put_frame = lambda items: items[0](*items[1:])
+
+    menu.start()
+
+    assert [row.rstrip() for row in lcd.display()] == [">item1", "", "", ""]
+
+
+def test_rpilcdmenu_skips_frames_the_display_shows_already():
+    processor = RpiLcdProcessor(lcd=VirtualLcd(), metrics=PipelineMetrics())
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+    menu.append_item(MenuItem("item1")).append_item(MenuItem("item2"))
+
+    menu.start()
+    processor.run_pending()
+    menu.render()
+    menu.processDown().processUp()
+    menu.render()
+    processor.run_pending()
+
+    assert processor.metrics.frames_rendered == 5
+    assert processor.metrics.frames_skipped == 2
+    assert processor.metrics.frames_written == 2
+
+
+def test_rpilcdmenu_resends_frame_after_message():
+    lcd = VirtualLcd()
+    menu = create_menu_with_items(lcd, 2)
+    processor = menu.rpi_lcd_processor
+
+    menu.start()
+    menu.message("Hello")
+    menu.render()
+    processor.run_pending()
+
+    assert lcd.display()[0].rstrip() == ">item1"
+
+
+def test_rpilcdmenu_max_width_can_be_set():
+    lcd = VirtualLcd()
+    menu = create_menu_with_items(lcd, 2)
+    menu.max_width = 3
+    menu.scrolling_menu = False
+
+    menu.start()
+    menu.rpi_lcd_processor.run_pending()
+    assert [row.rstrip() for row in lcd.display()] == [">ite", " ite"]
+
+    menu.max_width = None
+    assert menu.max_width == 15
@@ -0,0 +1,233 @@
+import time
+
+from mock import Mock, call
+
+from rpilcdmenu import RpiLCDMenu
+from rpilcdmenu.backends import VirtualLcd
+from rpilcdmenu.helpers.metrics import PipelineMetrics
+from rpilcdmenu.items import MenuItem
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor, URGENT, BACKGROUND
+
+
+def test_rpilcdprocessor_frame_replaces_pending_frame():
+    processor = RpiLcdProcessor(lcd=VirtualLcd())
+    write = Mock()
+
+    processor.put_frame([write, 1])
+    processor.put_frame([write, 2])
+    processor.put_frame([write, 3])
+
+    assert processor.qsize() == 1
+    assert processor.stats()["frames_dropped"] == 2
+
+    processor.start()
+    processor.stop()
+
+    assert write.mock_calls == [call(3)]
+
+
+def test_rpilcdprocessor_keeps_order_of_commands_between_frames():
+    processor = RpiLcdProcessor(lcd=VirtualLcd())
+    write = Mock()
+
+    processor.put_frame([write, 1])
+    processor.put([write, "clear"])
+    processor.put_frame([write, 2])
+    processor.put_frame([write, 3])
+
+    processor.start()
+    processor.stop()
+
+    assert write.mock_calls == [call(1), call("clear"), call(3)]
+    assert processor.stats()["max_depth"] == 3
+
+
+def test_rpilcdprocessor_keeps_every_frame_without_coalescing():
+    processor = RpiLcdProcessor(coalesce_frames=False, lcd=VirtualLcd())
+    write = Mock()
+
+    processor.put_frame([write, 1])
+    processor.put_frame([write, 2])
+
+    processor.start()
+    processor.stop()
+
+    assert write.mock_calls == [call(1), call(2)]
+    assert processor.stats()["frames_dropped"] == 0
+
+
+def test_rpilcdprocessor_runs_due_timers_after_queued_commands():
+    processor = RpiLcdProcessor(lcd=VirtualLcd())
+    write = Mock()
+
+    processor.schedule(0, [write, "timer"])
+    processor.put([write, "command"])
+    processor.start()
+    processor.schedule(0.01, [processor.put, None])
+    processor.join()
+
+    assert write.mock_calls == [call("command"), call("timer")]
+
+
+def test_rpilcdprocessor_cancelled_timer_never_runs():
+    processor = RpiLcdProcessor(lcd=VirtualLcd())
+    write = Mock()
+
+    timer = processor.schedule(0, [write])
+    processor.cancel(timer)
+    processor.start()
+    processor.schedule(0.01, [processor.put, None])
+    processor.join()
+
+    write.assert_not_called()
+
+
+def test_rpilcdprocessor_flushes_lcd_once_per_batch():
+    lcd = VirtualLcd()
+    processor = RpiLcdProcessor(lcd=lcd)
+    lcd.reset_stats()
+
+    processor.put([lcd.write_string, "a"])
+    processor.put([lcd.write_string, "b"])
+    processor.put([lcd.write_string, "c"])
+    processor.start()
+    processor.stop()
+
+    assert lcd.stats()["transfers"] == 1
+
+
+def test_rpilcdprocessor_run_pending_executes_queue_and_due_timers_inline():
+    processor = RpiLcdProcessor(lcd=VirtualLcd())
+    write = Mock()
+
+    processor.put([write, "command"])
+    processor.schedule(0, [write, "timer"])
+    processor.schedule(60, [write, "later"])
+    processor.run_pending()
+
+    assert write.mock_calls == [call("command"), call("timer")]
+    assert processor.stats()["batches_processed"] == 2
+
+
+def test_rpilcdprocessor_records_metrics_of_commands_and_frames():
+    lcd = VirtualLcd()
+    processor = RpiLcdProcessor(lcd=lcd, metrics=PipelineMetrics())
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+    menu.append_item(MenuItem("item1")).append_item(MenuItem("item2"))
+
+    menu.render()
+    menu.processDown()
+    processor.run_pending()
+
+    snapshot = processor.metrics_snapshot()
+    assert snapshot["frames_rendered"] == 2
+    assert snapshot["frames_written"] == 1
+    assert snapshot["frames_dropped"] == 1
+    assert snapshot["queue_wait"]["count"] == 1
+    assert snapshot["commands"]["RpiLCDMenu._write_to_lcd"]["count"] == 1
+    assert snapshot["bytes_written"] == lcd.stats()["bytes"] - 1  # the initial clear
+
+
+def test_rpilcdprocessor_reports_metrics_periodically():
+    callback = Mock()
+    processor = RpiLcdProcessor(lcd=VirtualLcd(), metrics=PipelineMetrics(callback=callback, interval=0.05))
+
+    time.sleep(0.06)
+    processor.run_pending()
+
+    assert callback.call_count == 1
+    assert callback.call_args[0][0]["frames_written"] == 0
+
+
+def test_rpilcdprocessor_without_metrics_has_no_snapshot():
+    assert RpiLcdProcessor(lcd=VirtualLcd()).metrics_snapshot() is None
+
+
+def test_rpilcdprocessor_serves_urgent_lane_first():
+    processor = RpiLcdProcessor(lcd=VirtualLcd())
+    write = Mock()
+
+    processor.put([write, "background"], BACKGROUND)
+    processor.put([write, "normal"])
+    processor.put([write, "urgent"], URGENT)
+    processor.run_pending()
+
+    assert write.mock_calls == [call("urgent"), call("normal"), call("background")]
+
+
+def test_rpilcdprocessor_urgent_frame_drops_waiting_lower_frames():
+    processor = RpiLcdProcessor(lcd=VirtualLcd())
+    write = Mock()
+
+    processor.put_frame([write, "scroll"], BACKGROUND)
+    processor.put_frame([write, "menu"])
+    processor.put_frame([write, "alert"], URGENT)
+    processor.run_pending()
+
+    assert write.mock_calls == [call("alert")]
+    assert processor.stats()["frames_dropped"] == 2
+
+
+def test_rpilcdprocessor_limits_batch_and_promotes_starved_lanes():
+    processor = RpiLcdProcessor(lcd=VirtualLcd(), max_batch=2, starvation_limit=2)
+    write = Mock()
+
+    processor.put([write, "background"], BACKGROUND)
+    for index in range(8):
+        processor.put([write, index])
+    processor.run_pending()
+
+    # Two batches pass the background lane over, then its command goes first
+    assert write.mock_calls[4] == call("background")
+    assert processor.stats()["promotions"] == 1
+    assert processor.stats()["batches_processed"] == 5
+
+
+def test_rpilcdprocessor_runs_due_timers_behind_busy_queue():
+    processor = RpiLcdProcessor(lcd=VirtualLcd(), max_batch=1, starvation_limit=2)
+    write = Mock()
+
+    processor.schedule(0, [write, "timer"])
+    for index in range(5):
+        processor.put([write, index])
+    processor.run_pending()
+
+    assert write.mock_calls[2] == call("timer")
+
+
+def test_rpilcdmenu_urgent_message_overrides_pending_frames():
+    lcd = VirtualLcd()
+    processor = RpiLcdProcessor(lcd=lcd)
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+    menu.append_item(MenuItem("item1")).append_item(MenuItem("item2"))
+
+    menu.render()
+    menu.message("FAULT\nOverheat", urgent=True)
+    processor.run_pending()
+
+    assert lcd.display() == ["FAULT           ", "Overheat        "]
+
+
+def test_rpilcdmenu_urgent_message_wraps_long_lines():
+    lcd = VirtualLcd()
+    processor = RpiLcdProcessor(lcd=lcd)
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+
+    menu.message("Fault: pump 3 overheating", urgent=True)
+    processor.run_pending()
+
+    assert [row.rstrip() for row in lcd.display()] == ["Fault: pump 3", "overheating"]
+
+
+def test_rpilcdmenu_urgent_message_stays_over_queued_writes():
+    lcd = VirtualLcd()
+    processor = RpiLcdProcessor(lcd=lcd)
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+
+    menu.clearDisplay()
+    menu.message("Menu is empty")
+    menu.message("FAULT", urgent=True)
+    processor.run_pending()
+
+    assert processor.frame == ["FAULT", ""]
+    assert [row.rstrip() for row in lcd.display()] == processor.frame
@@ -0,0 +1,91 @@
+from mock import Mock
+
+from rpilcdmenu.helpers.frame_governor import FrameGovernor
+from rpilcdmenu.rpi_lcd_menu import RpiLCDMenu
+from rpilcdmenu.scroll_animation import ScrollAnimation
+
+
+def create_menu():
+    menu = Mock()
+    menu.input_count = 0
+    menu.scrolling_menu = True
+    menu.cursor_char = ">"
+    menu.max_width = 15
+    menu.rows = 2
+    menu.lcd_framerate = 0.05
+    menu._menu_framebuffer = lambda text, cursor_pos: RpiLCDMenu._menu_framebuffer(menu, text, cursor_pos)
+    menu.rpi_lcd_processor.governor = None
+    menu.rpi_lcd_processor.time_scale = 1.0
+    return menu
+
+
+def test_scrollanimation_draws_frame_and_schedules_next_one():
+    menu = create_menu()
+    frames = []
+    menu._write_to_lcd.side_effect = lambda framebuffer: frames.append(list(framebuffer))
+    animation = ScrollAnimation(menu, ["A very long menu item", "item2"], 0, 0)
+
+    animation.step()
+    animation.step()
+
+    assert frames == [[">A very long men", " item2"], ["> very long menu", " item2"]]
+    delays = [c[0][0] for c in menu.rpi_lcd_processor.schedule.call_args_list]
+    assert delays == [25 * 0.05, 5 * 0.05]
+
+
+def test_scrollanimation_stops_on_input():
+    menu = create_menu()
+    animation = ScrollAnimation(menu, ["A very long menu item", "item2"], 0, 0)
+
+    menu.input_count = 1
+    animation.step()
+
+    menu._write_to_lcd.assert_not_called()
+    menu.rpi_lcd_processor.schedule.assert_not_called()
+
+
+def test_scrollanimation_queues_first_frame():
+    menu = create_menu()
+    animation = ScrollAnimation(menu, ["A very long menu item", "item2"], 1, 0).start()
+
+    menu.rpi_lcd_processor.put.assert_called_once_with([animation.step])
+    menu.rpi_lcd_processor.schedule.assert_not_called()
+
+
+def test_scrollanimation_cancel_cancels_pending_timer():
+    menu = create_menu()
+    animation = ScrollAnimation(menu, ["A very long menu item", "item2"], 1, 0).start()
+    animation.step()
+
+    animation.cancel()
+    animation.step()
+
+    menu.rpi_lcd_processor.cancel.assert_called_once_with(animation.timer)
+    assert menu._write_to_lcd.call_count == 1
+
+
+def test_scrollanimation_cancelled_before_first_frame_draws_nothing():
+    menu = create_menu()
+    animation = ScrollAnimation(menu, ["A very long menu item", "item2"], 1, 0).start()
+
+    animation.cancel()
+    animation.step()
+
+    menu._write_to_lcd.assert_not_called()
+
+
+def test_scrollanimation_stretches_delays_on_slow_bus():
+    menu = create_menu()
+    clock = iter([0.0, 0.1, 0.1, 1.0, 1.1, 1.1])
+    governor = menu.rpi_lcd_processor.governor = FrameGovernor(budget=0.2, clock=lambda: next(clock))
+    animation = ScrollAnimation(menu, ["A very long menu item", "item2"], 0, 0)
+
+    animation.step()
+    animation.step()
+
+    # Frames take 100ms, the pause after the first frame is long enough already
+    delays = [c[0][0] for c in menu.rpi_lcd_processor.schedule.call_args_list]
+    assert delays[0] == 25 * 0.05
+    assert abs(delays[1] - 0.4) < 1e-9
+    assert governor.frames == 2
+    menu.rpi_lcd_processor.lcd.flush.assert_called()
@@ -0,0 +1,124 @@
+import io
+import time
+
+from rpilcdmenu import RpiLCDMenu
+from rpilcdmenu.backends import VirtualLcd
+from rpilcdmenu.input import InputController, DOWN, ENTER
+from rpilcdmenu.items import MenuItem, MessageItem
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor
+from rpilcdmenu.rpi_lcd_submenu import RpiLCDSubMenu
+from rpilcdmenu.trace import TraceRecorder, compare, load_trace, replay, summarize
+
+
+def create_menu(processor):
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+    for index in range(5):
+        menu.append_item(MenuItem("item%d" % index))
+    return menu
+
+
+def record_session():
+    stream = io.StringIO()
+    processor = RpiLcdProcessor(lcd=VirtualLcd())
+    recorder = TraceRecorder(stream).attach(processor)
+    controller = InputController(create_menu(processor).start(), coalesce_window=0, recorder=recorder)
+    processor.run_pending()
+
+    controller.tap(DOWN).tap(DOWN).dispatch()
+    processor.run_pending()
+    controller.tap(ENTER).dispatch()
+    processor.run_pending()
+
+    stream.seek(0)
+    return load_trace(stream)
+
+
+def test_tracerecorder_writes_header_inputs_and_frames():
+    records = record_session()
+
+    assert records[0] == {"version": 1, "cols": 16, "rows": 2}
+    assert [(record["input"], record["steps"]) for record in records if "input" in record] == [
+        (None, 2), ("enter", 0)
+    ]
+    assert [record["frame"] for record in records if "frame" in record] == [
+        [">item0", " item1"], [" item1", ">item2"]
+    ]
+
+
+def test_summarize_counts_frames_and_input_latency():
+    summary = summarize([
+        {"t": 0.0, "frame": ["a"]},
+        {"t": 1.0, "input": None, "steps": 1},
+        {"t": 1.002, "frame": ["b"]},
+        {"t": 2.0, "input": "enter", "steps": 0},
+    ])
+
+    assert summary["inputs"] == 2
+    assert summary["frames"] == 2
+    assert round(summary["mean_latency_ms"], 3) == 2.0
+
+
+def test_replay_reproduces_frames_of_recorded_session():
+    records = record_session()
+
+    fast = replay(records, create_menu, speed=None)
+
+    assert compare(records, fast)["mismatched_frames"] == 0
+    assert compare(records, fast)["difference"]["frames"] == 0
+
+
+def test_replay_in_real_time_keeps_timing_of_inputs():
+    records = [
+        {"version": 1, "cols": 16, "rows": 2},
+        {"t": 0.1, "input": None, "steps": 1},
+        {"t": 0.2, "input": None, "steps": 1},
+    ]
+
+    replayed = replay(records, create_menu, speed=4.0)
+
+    assert [record["frame"] for record in replayed if "frame" in record] == [
+        [">item0", " item1"], [" item0", ">item1"], [" item1", ">item2"]
+    ]
+    assert [record["t"] for record in replayed if "input" in record][1] >= 0.05
+
+
+def test_replay_speeds_up_animations_of_all_menus():
+    processors = []
+    records = [{"version": 1, "cols": 16, "rows": 2}, {"t": 0.0, "input": None, "steps": 1}]
+
+    def factory(processor):
+        processors.append(processor)
+        return create_menu(processor)
+
+    replay(records, factory, speed=4.0)
+    assert processors[0].time_scale == 0.25
+
+    # Submenus get their own lcd_framerate, the scale of the display still applies
+    processor = RpiLcdProcessor(lcd=VirtualLcd())
+    processor.time_scale = 0.25
+    submenu = RpiLCDSubMenu(create_menu(processor), scrolling_menu=True)
+    submenu.append_item(MenuItem("A very long submenu item")).start()
+    processor.run_pending()
+
+    delay = processor._timers[0].deadline - time.monotonic()
+    assert 0 < delay <= 25 * submenu.lcd_framerate * 0.25
+    processor.animation.cancel()
+
+
+def test_tracerecorder_records_raw_messages_as_frames():
+    stream = io.StringIO()
+    processor = RpiLcdProcessor(lcd=VirtualLcd())
+    TraceRecorder(stream).attach(processor)
+    menu = RpiLCDMenu(rpi_lcd_processor=processor)
+    submenu = RpiLCDSubMenu(menu)
+    menu.append_item(MenuItem("item0"))
+    menu.append_item(MessageItem("Info", "A message on two rows", menu))
+
+    menu.start().processDown().processEnter()
+    submenu.start()
+    processor.run_pending()
+
+    stream.seek(0)
+    assert [record["frame"] for record in load_trace(stream) if "frame" in record][-2:] == [
+        ["A message on two", " rows"], ["Menu is empty", ""]
+    ]
@@ -0,0 +1,110 @@
+import threading
+
+from mock import call, Mock, MagicMock
+
+from rpilcdmenu import RpiLCDMenu
+from rpilcdmenu.backends import VirtualLcd
+from rpilcdmenu.rpi_lcd_hwd import RpiLcdProcessor
+from rpilcdmenu.views.log_view import LogView
+
+
+def create_log_view(max_lines=100):
+    base_menu = MagicMock()
+    base_menu.cols = 16
+    base_menu.rows = 2
+    log_view = LogView(base_menu, max_lines)
+    log_view.write_to_lcd = Mock()
+    return log_view
+
+
+def test_logview_follows_tail_of_appended_lines():
+    log_view = create_log_view()
+    log_view.start()
+
+    log_view.append_line("one")
+    log_view.append_line("two")
+    log_view.append_line("three")
+
+    assert log_view.write_to_lcd.mock_calls[-1] == call(["two", "three"])
+
+
+def test_logview_does_not_render_when_inactive():
+    log_view = create_log_view()
+
+    log_view.append_line("one")
+
+    log_view.write_to_lcd.assert_not_called()
+
+
+def test_logview_stays_at_position_after_user_scrolled_up():
+    log_view = create_log_view()
+    for line in ("one", "two", "three"):
+        log_view.append_line(line)
+    log_view.start()
+
+    log_view.processUp()
+    log_view.write_to_lcd.reset_mock()
+    log_view.append_line("four")
+
+    log_view.write_to_lcd.assert_not_called()
+
+    log_view.processDown()
+    log_view.processDown()
+    assert log_view.follow
+    assert log_view.write_to_lcd.mock_calls[-1] == call(["three", "four"])
+
+
+def test_logview_keeps_memory_bounded():
+    log_view = create_log_view(max_lines=3)
+    for index in range(1000):
+        log_view.append_line("line %d" % index)
+    log_view.start()
+
+    assert len(log_view.lines) == 3
+    assert log_view.lines_dropped == 997
+    assert log_view.write_to_lcd.mock_calls[-1] == call(["line 998", "line 999"])
+
+    log_view.processUp()
+    log_view.processUp()
+    assert log_view.write_to_lcd.mock_calls[-1] == call(["line 997", "line 998"])
+
+
+def test_logview_wraps_long_lines():
+    log_view = create_log_view()
+    log_view.start()
+
+    log_view.append_line("temperature 21.5 degrees")
+
+    assert log_view.write_to_lcd.mock_calls[-1] == call(["temperature 21.5", "degrees"])
+
+
+def test_logview_process_steps_clamps_to_buffer_and_draws_once():
+    log_view = create_log_view()
+    for line in ("one", "two", "three", "four"):
+        log_view.append_line(line)
+    log_view.start()
+    log_view.write_to_lcd.reset_mock()
+
+    log_view.processSteps(-10)
+    assert log_view.write_to_lcd.mock_calls == [call(["one", "two"])]
+    assert not log_view.follow
+
+    log_view.processSteps(10)
+    assert log_view.follow
+    assert log_view.write_to_lcd.mock_calls[-1] == call(["three", "four"])
+
+
+def test_logview_waits_for_renders_of_the_display():
+    processor = RpiLcdProcessor(lcd=VirtualLcd())
+    log_view = LogView(RpiLCDMenu(rpi_lcd_processor=processor))
+    log_view.start()
+    appended = threading.Event()
+    producer = threading.Thread(target=lambda: (log_view.append_line("late"), appended.set()))
+
+    with processor.render_lock:
+        producer.start()
+        assert not appended.wait(0.05)
+    producer.join()
+
+    processor.run_pending()
+    assert processor.lcd.display()[0].rstrip() == "late"
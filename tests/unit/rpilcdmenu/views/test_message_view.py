@@ -1,39 +1,34 @@
-from mock import call, Mock, MagicMock, patch
+from mock import call, Mock, MagicMock
 from rpilcdmenu.views.message_view import MessageView
 
 
-@patch('rpilcdmenu.views.message_view.get_text_lines')
-@patch('rpilcdmenu.views.message_view.get_scrolled_text')
-def test_messageview_render_shows_full_message_in_non_scrollable_mode(get_scrolled_text, get_text_lines):
-    message_view = MessageView(Mock(), 'Some multi-line\ntext to be shown\n on LCD', False)
+def create_base_menu():
+    base_menu = MagicMock()
+    base_menu.cols = 16
+    base_menu.rows = 2
+    return base_menu
+
+
+def test_messageview_render_shows_full_message_in_non_scrollable_mode():
+    message_view = MessageView(create_base_menu(), 'Some multi-line\ntext to be shown\n on LCD', False)
 
     message_view.message = Mock()
     message_view.render()
     message_view.message.assert_called_once_with('Some multi-line\ntext to be shown\n on LCD')
 
 
-@patch('rpilcdmenu.views.message_view.get_text_lines')
-@patch('rpilcdmenu.views.message_view.get_scrolled_text')
-def test_messageview_render_shows_only_part_of_text_in_scrollable_mode(get_scrolled_text, get_text_lines):
-    get_scrolled_text.return_value = 'Some multi-line\ntext to be shown'
-    get_text_lines.return_value = 3
-
-    message_view = MessageView(Mock(), 'Some multi-line\ntext to be shown\n on LCD', True)
+def test_messageview_render_shows_only_part_of_text_in_scrollable_mode():
+    message_view = MessageView(create_base_menu(), 'Some multi-line\ntext to be shown\n on LCD', True)
 
-    message_view.message = Mock()
+    message_view.write_to_lcd = Mock()
     message_view.render()
-    message_view.message.assert_called_once_with('Some multi-line\ntext to be shown')
-
+    message_view.write_to_lcd.assert_called_once_with(['Some multi-line', 'text to be shown'])
 
-@patch('rpilcdmenu.views.message_view.get_text_lines')
-@patch('rpilcdmenu.views.message_view.get_scrolled_text')
-def test_messageview_processDown_scrolls_down_given_message(get_scrolled_text, get_text_lines):
-    get_scrolled_text.return_value = ' on LCD'
-    get_text_lines.return_value = 3
 
-    message_view = MessageView(Mock(), 'Some multi-line\ntext to be shown\n on LCD', True)
+def test_messageview_processDown_scrolls_down_given_message():
+    message_view = MessageView(create_base_menu(), 'Some multi-line\ntext to be shown\n on LCD', True)
 
-    message_view.message = Mock()
+    message_view.write_to_lcd = Mock()
 
     message_view.render()
     message_view.processDown()
@@ -41,18 +36,13 @@ def test_messageview_processDown_scrolls_down_given_message(get_scrolled_text, g
     message_view.processDown()
     message_view.processDown()
 
-    assert message_view.message.mock_calls[-1] == call(' on LCD')
+    assert message_view.write_to_lcd.mock_calls[-1] == call([' on LCD', ''])
 
 
-@patch('rpilcdmenu.views.message_view.get_text_lines')
-@patch('rpilcdmenu.views.message_view.get_scrolled_text')
-def test_messageview_processDown_scrolls_given_message_up_after_scrolling_it_down(get_scrolled_text, get_text_lines):
-    get_scrolled_text.return_value = 'Some multi-line\ntext to be shown'
-    get_text_lines.return_value = 3
+def test_messageview_processDown_scrolls_given_message_up_after_scrolling_it_down():
+    message_view = MessageView(create_base_menu(), 'Some multi-line\ntext to be shown\n on LCD', True)
 
-    message_view = MessageView(Mock(), 'Some multi-line\ntext to be shown\n on LCD', True)
-
-    message_view.message = Mock()
+    message_view.write_to_lcd = Mock()
 
     message_view.render()
     message_view.processDown()
@@ -61,13 +51,21 @@ def test_messageview_processDown_scrolls_given_message_up_after_scrolling_it_dow
     message_view.processUp()
     message_view.processUp()
 
-    assert message_view.message.mock_calls[-1] == call('Some multi-line\ntext to be shown')
+    assert message_view.write_to_lcd.mock_calls[-1] == call(['Some multi-line', 'text to be shown'])
+
+
+def test_messageview_setText_appends_to_laid_out_lines():
+    message_view = MessageView(create_base_menu(), 'first line', True)
+    layout = message_view.layout
+
+    message_view.setText('first line\nsecond line')
+
+    assert message_view.layout is layout
+    assert message_view.text_lines == 2
 
 
-@patch('rpilcdmenu.views.message_view.get_text_lines')
-@patch('rpilcdmenu.views.message_view.get_scrolled_text')
-def test_messageview_processEnter_exits_to_parent_menu(get_scrolled_text, get_text_lines):
-    parent_menu_mock = MagicMock()
+def test_messageview_processEnter_exits_to_parent_menu():
+    parent_menu_mock = create_base_menu()
 
     message_view = MessageView(parent_menu_mock, 'Some multi-line\ntext to be shown\n on LCD', True)
     message_view.processEnter()